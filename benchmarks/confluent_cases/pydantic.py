@@ -21,10 +21,17 @@ class ConfluentTestCase:
     comment = "Consume Pydantic Model"
     broker_type = "Confluent"
 
-    def __init__(self) -> None:
+    def __init__(self, decode_to_model: bool = False) -> None:
         self.EVENTS_PROCESSED = 0
 
-        broker = self.broker = KafkaBroker(logger=None, graceful_timeout=10)
+        if decode_to_model:
+            self.comment = f"{self.comment} (decode to model)"
+
+        broker = self.broker = KafkaBroker(
+            logger=None,
+            graceful_timeout=10,
+            decode_to_model=decode_to_model,
+        )
 
         p = self.publisher = broker.publisher("in")
 
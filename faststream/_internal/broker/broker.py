@@ -16,6 +16,7 @@ from faststream._internal.types import (
     ConnectionType,
     MsgType,
 )
+from faststream._internal.utils.functions import call_or_await
 
 from .pub_base import BrokerPublishMixin
 from .registrator import Registrator
@@ -132,6 +133,16 @@ class BrokerUsecase(
         for sub in self.subscribers:
             await sub.stop()
 
+        for pub in self.publishers:
+            await pub.stop()
+
+        for middleware in self.middlewares:
+            # middlewares buffering some state (e.g. telemetry metrics) release it here
+            if (on_stop := getattr(middleware, "on_broker_stop", None)) is not None:
+                await call_or_await(on_stop)
+
+        await self.config.logger._stop()
+
         self.running = False
 
     @deprecated(
@@ -1,6 +1,6 @@
 from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Generic, Optional, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, Optional, Union
 
 from typing_extensions import TypeVar as TypeVar313
 
@@ -16,6 +16,9 @@ if TYPE_CHECKING:
 
 @dataclass(kw_only=True)
 class BrokerConfig:
+    # bumped by any middlewares change to rebuild compiled consume pipelines
+    middlewares_version: ClassVar[int] = 0
+
     prefix: str = ""
     include_in_schema: bool | None = True
 
@@ -45,9 +48,11 @@ class BrokerConfig:
 
     def add_middleware(self, middleware: "BrokerMiddleware[Any]") -> None:
         self.broker_middlewares = (*self.broker_middlewares, middleware)
+        BrokerConfig.middlewares_version += 1
 
     def insert_middleware(self, middleware: "BrokerMiddleware[Any]") -> None:
         self.broker_middlewares = (middleware, *self.broker_middlewares)
+        BrokerConfig.middlewares_version += 1
 
 
 BrokerConfigType = TypeVar313(
@@ -73,6 +78,8 @@ class ConfigComposition(Generic[BrokerConfigType]):
 
     def add_config(self, config: "ConfigType") -> None:
         self.configs = (config, *self.configs)
+        # included router gets outer middlewares
+        BrokerConfig.middlewares_version += 1
 
     # broker priority options
     @property
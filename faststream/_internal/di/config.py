@@ -1,14 +1,17 @@
 import inspect
 from collections.abc import Awaitable, Callable, Mapping, Reversible, Sequence
+from contextlib import suppress
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
 from fast_depends import Provider
 from fast_depends.core import CallModel, build_call_model
 
+from faststream._internal._compat import PYDANTIC_V2
 from faststream._internal.constants import EMPTY
 from faststream._internal.context import ContextRepo
 from faststream._internal.utils import apply_types, to_async
+from faststream.message.utils import is_json_body
 
 if TYPE_CHECKING:
     from fast_depends.dependencies import Dependant
@@ -29,6 +32,8 @@ class BuiltDependant:
 @dataclass(kw_only=True)
 class FastDependsConfig:
     use_fastdepends: bool = True
+    # decode JSON message body right into the handler model
+    decode_to_model: bool = False
 
     provider: "Provider" = field(default_factory=Provider)
     serializer: Optional["SerializerProto"] = field(default_factory=lambda: EMPTY)
@@ -53,6 +58,7 @@ class FastDependsConfig:
 
         return FastDependsConfig(
             use_fastdepends=use_fd,
+            decode_to_model=self.decode_to_model or value.decode_to_model,
             provider=value.provider,
             serializer=self.serializer or value.serializer,
             context=self.context,
@@ -83,15 +89,20 @@ class FastDependsConfig:
                 serializer_cls=self._serializer,
             )
 
+            model_decoder = None
             if self.use_fastdepends:
                 wrapper: InjectWrapper[..., Any] = apply_types(
                     None, context__=self.context
                 )
                 wrapped_call = wrapper(func=wrapped_call, model=dependent)
 
+                if self.decode_to_model:
+                    model_decoder = _build_model_decoder(dependent, self._serializer)
+
             wrapped_call = _unwrap_message_to_fast_depends_decorator(
                 wrapped_call,
                 dependent,
+                model_decoder,
             )
 
         return BuiltDependant(
@@ -104,6 +115,7 @@ class FastDependsConfig:
 def _unwrap_message_to_fast_depends_decorator(
     func: Callable[..., Any],
     dependent: "CallModel",
+    model_decoder: Callable[[Any], Any] | None = None,
 ) -> Callable[["StreamMessage[Any]"], Awaitable[Any]]:
     dependant_params = dependent.flat_params
     if len(dependant_params) <= 1:
@@ -128,6 +140,16 @@ def _unwrap_message_to_fast_depends_decorator(
             msg = f"Couldn't unpack `{msg}` to multiple values."
             raise ValueError(msg)
 
+    elif model_decoder is not None:
+
+        async def decode_wrapper(message: "StreamMessage[Any]") -> Any:
+            # message decode cache is left for filters and middlewares
+            if is_json_body(message.body, message.content_type):
+                return await func(model_decoder(message.body))
+
+            msg = await message.decode()
+            return await func(msg)
+
     else:
 
         async def decode_wrapper(message: "StreamMessage[Any]") -> Any:
@@ -135,3 +157,45 @@ def _unwrap_message_to_fast_depends_decorator(
             return await func(msg)
 
     return decode_wrapper
+
+
+def _build_model_decoder(
+    dependent: "CallModel",
+    serializer: Optional["SerializerProto"],
+) -> Callable[[Any], Any] | None:
+    """Build a function decoding JSON right into the handler's only argument model."""
+    params = dependent.flat_params
+    if len(params) != 1 or params[0].kind is inspect.Parameter.VAR_POSITIONAL:
+        return None
+
+    model = params[0].field_type
+    if not inspect.isclass(model):
+        return None
+
+    with suppress(ImportError):
+        from fast_depends.pydantic import PydanticSerializer
+        from pydantic import BaseModel
+
+        if (
+            PYDANTIC_V2
+            and isinstance(serializer, PydanticSerializer)
+            and issubclass(model, BaseModel)
+        ):
+            validate_json = model.model_validate_json
+
+            def decode_pydantic(body: Any) -> Any:
+                if isinstance(body, memoryview):
+                    body = bytes(body)
+                return validate_json(body)
+
+            return decode_pydantic
+
+    with suppress(ImportError):
+        from fast_depends.msgspec import MsgSpecSerializer
+        from msgspec import Struct
+        from msgspec.json import Decoder
+
+        if isinstance(serializer, MsgSpecSerializer) and issubclass(model, Struct):
+            return Decoder(model, strict=False, dec_hook=serializer.dec_hook).decode
+
+    return None
@@ -51,6 +51,9 @@ class PublisherUsecase(Endpoint, PublisherProto):
     async def start(self) -> None:
         pass
 
+    async def stop(self) -> None:
+        pass
+
     def set_test(
         self,
         *,
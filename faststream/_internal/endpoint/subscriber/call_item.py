@@ -15,7 +15,11 @@ from faststream._internal.types import MsgType
 from faststream.exceptions import IgnoredException, SetupError
 from faststream.specification.asyncapi.utils import to_camelcase
 
+from .executor import make_executor_decorator
+
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.basic_types import AsyncFuncAny, Decorator
@@ -34,8 +38,10 @@ class HandlerItem(Generic[MsgType]):
     """A class representing handler overloaded item."""
 
     __slots__ = (
+        "_reversed_middlewares",
         "dependant",
         "dependencies",
+        "executor",
         "filter",
         "handler",
         "item_decoder",
@@ -54,13 +60,16 @@ class HandlerItem(Generic[MsgType]):
         item_decoder: Optional["CustomCallable"],
         item_middlewares: Sequence["SubscriberMiddleware[StreamMessage[MsgType]]"],
         dependencies: Iterable["Dependant"],
+        executor: Optional["Executor"] = None,
     ) -> None:
         self.handler = handler
         self.filter = filter
         self.item_parser = item_parser
         self.item_decoder = item_decoder
         self.item_middlewares = item_middlewares
+        self._reversed_middlewares = tuple(item_middlewares[::-1])
         self.dependencies = dependencies
+        self.executor = executor
         self.dependant = None
 
     def __repr__(self) -> str:
@@ -81,6 +90,13 @@ class HandlerItem(Generic[MsgType]):
             self.item_parser = parser
             self.item_decoder = decoder
 
+            if self.executor is not None:
+                # should wrap the original call first
+                _call_decorators = (
+                    *_call_decorators,
+                    make_executor_decorator(self.executor),
+                )
+
             self.dependant = self.handler.set_wrapped(
                 dependencies=(*broker_dependencies, *self.dependencies),
                 _call_decorators=_call_decorators,
@@ -139,7 +155,7 @@ class HandlerItem(Generic[MsgType]):
         """Execute wrapped handler with consume middlewares."""
         call: AsyncFuncAny = self.handler.call_wrapped
 
-        for middleware in chain(self.item_middlewares[::-1], _extra_middlewares):
+        for middleware in chain(self._reversed_middlewares, _extra_middlewares):
             call = partial(middleware, call)
 
         try:
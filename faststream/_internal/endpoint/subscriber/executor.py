@@ -0,0 +1,73 @@
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import wraps
+from importlib import import_module
+from inspect import unwrap
+from typing import TYPE_CHECKING, Any
+
+from fast_depends.utils import is_coroutine_callable
+
+from faststream._internal.utils.functions import run_in_executor
+from faststream.exceptions import SetupError
+
+if TYPE_CHECKING:
+    from faststream._internal.basic_types import Decorator
+
+
+def make_executor_decorator(executor: Executor) -> "Decorator":
+    """Build a call decorator running handler in the executor.
+
+    Process-based executors can't receive the handler object itself,
+    so the original function is passed by its import path and resolved
+    in the worker.
+    """
+    if not isinstance(executor, ProcessPoolExecutor):
+
+        def decorator(call: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+            @wraps(call)
+            async def executor_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await run_in_executor(executor, call, *args, **kwargs)
+
+            return executor_wrapper
+
+        return decorator
+
+    def process_decorator(call: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+        original = unwrap(call)
+
+        if is_coroutine_callable(original):
+            error_msg = (
+                f"`{original.__name__}` should be a sync function to run in process pool."
+            )
+            raise SetupError(error_msg)
+
+        module, qualname = original.__module__, original.__qualname__
+        if "<locals>" in qualname:
+            error_msg = (
+                f"`{qualname}` should be defined at module level to run in process pool."
+            )
+            raise SetupError(error_msg)
+
+        @wraps(call)
+        async def executor_wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await run_in_executor(
+                executor,
+                _call_by_path,
+                module,
+                qualname,
+                *args,
+                **kwargs,
+            )
+
+        return executor_wrapper
+
+    return process_decorator
+
+
+def _call_by_path(module: str, qualname: str, /, *args: Any, **kwargs: Any) -> Any:
+    call: Any = import_module(module)
+    for name in qualname.split("."):
+        call = getattr(call, name)
+
+    # decorated handlers are resolved to `HandlerCallWrapper` calling the original function
+    return call(*args, **kwargs)
@@ -1,6 +1,8 @@
+import time
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Callable, Iterable, Sequence
 from contextlib import AbstractContextManager, AsyncExitStack
+from dataclasses import replace
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
@@ -14,8 +16,10 @@ from typing import (
 
 from typing_extensions import Self, deprecated, overload, override
 
+from faststream._internal.configs import BrokerConfig
 from faststream._internal.endpoint.usecase import Endpoint
 from faststream._internal.endpoint.utils import ParserComposition
+from faststream._internal.logger.log_context import LazyLogContext
 from faststream._internal.types import (
     AsyncCallable,
     MsgType,
@@ -35,6 +39,8 @@ from .call_item import (
 from .utils import MultiLock, default_filter
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from fast_depends.dependencies import Dependant
 
     from faststream._internal.basic_types import Decorator
@@ -63,6 +69,15 @@ class _CallOptions(NamedTuple):
     dependencies: Iterable["Dependant"]
 
 
+class _ConsumePipeline(NamedTuple):
+    """Message-independent parts of the consume flow, compiled once on start."""
+
+    middlewares: tuple["BrokerMiddleware[Any]", ...]
+    context: tuple[tuple[str, Any], ...]
+    # `BrokerConfig.middlewares_version` the pipeline was built with
+    middlewares_version: int
+
+
 class SubscriberUsecase(Endpoint, Generic[MsgType]):
     """A class representing an asynchronous handler."""
 
@@ -95,10 +110,14 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         )
 
         self._call_decorators: tuple[Decorator, ...] = ()
+        self._pipeline: _ConsumePipeline | None = None
 
         self.running = False
         self.lock = FakeContext()
 
+        # `time.monotonic()` of the last received message, used by health checks
+        self.last_consumed_at: float | None = None
+
         self.extra_watcher_options = {}
 
     @property
@@ -110,6 +129,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         self.lock = MultiLock()
 
         self._build_fastdepends_model()
+        self._pipeline = self._build_consume_pipeline()
 
         self._outer_config.logger.log(
             f"`{self.specification.call_name}` waiting for messages",
@@ -117,27 +137,45 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         )
 
     def _build_fastdepends_model(self) -> None:
+        fd_config = self._outer_config.fd_config
+
         for call in self.calls:
             if parser := call.item_parser or self._outer_config.broker_parser:
                 async_parser: AsyncCallable = ParserComposition(parser, self._parser)
             else:
                 async_parser = self._parser
 
+            call_config = fd_config
             if decoder := call.item_decoder or self._outer_config.broker_decoder:
                 async_decoder: AsyncCallable = ParserComposition(decoder, self._decoder)
+
+                if fd_config.decode_to_model:
+                    # custom decoder result should be passed to the handler
+                    call_config = replace(fd_config, decode_to_model=False)
             else:
                 async_decoder = self._decoder
 
             call._setup(
                 parser=async_parser,
                 decoder=async_decoder,
-                config=self._outer_config.fd_config,
+                config=call_config,
                 broker_dependencies=self._outer_config.broker_dependencies,
                 _call_decorators=self._call_decorators,
             )
 
             call.handler.refresh(with_mock=False)
 
+    def _build_consume_pipeline(self) -> _ConsumePipeline:
+        """Resolve middlewares and context scopes shared by all messages."""
+        return _ConsumePipeline(
+            middlewares=self.__build__middlewares_stack(self._broker_middlewares),
+            context=(
+                ("logger", self._outer_config.logger.logger.logger),
+                *self._outer_config.extra_context.items(),
+            ),
+            middlewares_version=BrokerConfig.middlewares_version,
+        )
+
     def _post_start(self) -> None:
         self.running = True
 
@@ -151,6 +189,9 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         if isinstance(self.lock, MultiLock):
             await self.lock.wait_release(self._outer_config.graceful_timeout)
 
+        # drop compiled pipeline to pick up config changes on restart
+        self._pipeline = None
+
     def add_call(
         self,
         *,
@@ -183,6 +224,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
             ),
         ] = (),
         dependencies: Iterable["Dependant"] = (),
+        executor: Optional["Executor"] = None,
     ) -> "HandlerCallWrapper[P_HandlerParams, T_HandlerReturn]": ...
 
     @overload
@@ -201,6 +243,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
             ),
         ] = (),
         dependencies: Iterable["Dependant"] = (),
+        executor: Optional["Executor"] = None,
     ) -> Callable[
         [Callable[P_HandlerParams, T_HandlerReturn]],
         "HandlerCallWrapper[P_HandlerParams, T_HandlerReturn]",
@@ -222,6 +265,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
             ),
         ] = (),
         dependencies: Iterable["Dependant"] = (),
+        executor: Optional["Executor"] = None,
     ) -> Union[
         "HandlerCallWrapper[P_HandlerParams, T_HandlerReturn]",
         Callable[
@@ -247,6 +291,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
                     item_decoder=decoder or self._call_options.decoder,
                     item_middlewares=total_middlewares,
                     dependencies=total_deps,
+                    executor=executor,
                 ),
             )
 
@@ -282,20 +327,28 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
     async def process_message(self, msg: MsgType) -> "Response":
         """Execute all message processing stages."""
+        self.last_consumed_at = time.monotonic()
+
         context = self._outer_config.fd_config.context
-        logger_state = self._outer_config.logger
+
+        pipeline = self._pipeline
+        if (
+            pipeline is None
+            or pipeline.middlewares_version != BrokerConfig.middlewares_version
+        ):
+            # broker middlewares can be added after start
+            self._pipeline = pipeline = self._build_consume_pipeline()
 
         async with AsyncExitStack() as stack:
             stack.enter_context(self.lock)
 
             # Enter context before middlewares
-            stack.enter_context(context.scope("logger", logger_state.logger.logger))
-            for k, v in self._outer_config.extra_context.items():
-                stack.enter_context(context.scope(k, v))
+            for k, v in pipeline.context:
+                stack.callback(context.reset_local, k, context.set_local(k, v))
 
             # enter all middlewares
             middlewares: list[BaseMiddleware] = []
-            for base_m in self.__build__middlewares_stack():
+            for base_m in pipeline.middlewares:
                 middleware = base_m(msg, context=context)
                 middlewares.append(middleware)
                 await middleware.__aenter__()
@@ -311,7 +364,10 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
 
                 if message is not None:
                     stack.enter_context(
-                        context.scope("log_context", self.get_log_context(message)),
+                        context.scope(
+                            "log_context",
+                            LazyLogContext(self.get_log_context, message),
+                        ),
                     )
                     stack.enter_context(context.scope("message", message))
 
@@ -319,13 +375,13 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
                     for m in middlewares:
                         stack.push_async_exit(m.__aexit__)
 
+                    middlewares.reverse()
+
                     result_msg = ensure_response(
                         await h.call(
                             message=message,
                             # consumer middlewares
-                            _extra_middlewares=(
-                                m.consume_scope for m in middlewares[::-1]
-                            ),
+                            _extra_middlewares=(m.consume_scope for m in middlewares),
                         ),
                     )
 
@@ -338,9 +394,7 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
                     ):
                         await p._publish(
                             result_msg.as_publish_command(),
-                            _extra_middlewares=(
-                                m.publish_scope for m in middlewares[::-1]
-                            ),
+                            _extra_middlewares=(m.publish_scope for m in middlewares),
                         )
 
                     # Return data for tests
@@ -361,27 +415,27 @@ class SubscriberUsecase(Endpoint, Generic[MsgType]):
         # An error was raised and processed by some middleware
         return ensure_response(None)
 
-    def __build__middlewares_stack(self) -> tuple["BrokerMiddleware[MsgType]", ...]:
+    def __build__middlewares_stack(
+        self,
+        broker_middlewares: Sequence["BrokerMiddleware[Any]"],
+    ) -> tuple["BrokerMiddleware[Any]", ...]:
         logger_state = self._outer_config.logger
 
         if self.ack_policy is AckPolicy.MANUAL:
-            broker_middlewares = (
+            return (
                 CriticalLogMiddleware(logger_state),
-                *self._broker_middlewares,
+                *broker_middlewares,
             )
 
-        else:
-            broker_middlewares = (
-                AcknowledgementMiddleware(
-                    logger=logger_state,
-                    ack_policy=self.ack_policy,
-                    extra_options=self.extra_watcher_options,
-                ),
-                CriticalLogMiddleware(logger_state),
-                *self._broker_middlewares,
-            )
-
-        return broker_middlewares
+        return (
+            AcknowledgementMiddleware(
+                logger=logger_state,
+                ack_policy=self.ack_policy,
+                extra_options=self.extra_watcher_options,
+            ),
+            CriticalLogMiddleware(logger_state),
+            *broker_middlewares,
+        )
 
     def __get_response_publisher(
         self,
@@ -2,7 +2,11 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from fastapi import __version__ as FASTAPI_VERSION  # noqa: N812
-from fastapi.dependencies.utils import solve_dependencies
+from fastapi.dependencies.utils import (
+    request_body_to_args,
+    request_params_to_args,
+    solve_dependencies,
+)
 from starlette.background import BackgroundTasks
 from typing_extensions import Never
 
@@ -39,6 +43,7 @@ __all__ = (
     "create_response_field",
     "raise_fastapi_validation_error",
     "solve_faststream_dependency",
+    "solve_faststream_params",
 )
 
 
@@ -133,3 +138,45 @@ else:
             errors=errors,  # type: ignore[has-type]
             background_tasks=background,  # type: ignore[has-type]
         )
+
+
+_BODY_KWARGS = {"embed_body_fields": False} if FASTAPI_v102_4 else {}
+
+
+async def solve_faststream_params(
+    request: "Request",
+    dependant: "Dependant",
+) -> SolvedDependency:
+    """Validate request params of a dependant without sub-dependencies.
+
+    Does the same as `solve_dependencies` for such dependant, but skips
+    sub-dependencies solving and special params injection.
+    """
+    values: dict[str, Any] = {}
+    errors: list[Any] = []
+
+    for fields, received in (
+        (dependant.path_params, request.path_params),
+        (dependant.query_params, request.query_params),
+        (dependant.header_params, request.headers),
+        (dependant.cookie_params, request.cookies),
+    ):
+        if fields:
+            params_values, params_errors = request_params_to_args(fields, received)
+            values.update(params_values)
+            errors += params_errors
+
+    if dependant.body_params:
+        body_values, body_errors = await request_body_to_args(
+            dependant.body_params,
+            request._body,  # type: ignore[arg-type]
+            **_BODY_KWARGS,
+        )
+        values.update(body_values)
+        errors.extend(body_errors)
+
+    return SolvedDependency(
+        values=values,
+        errors=errors,
+        background_tasks=None,
+    )
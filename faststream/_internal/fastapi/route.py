@@ -12,6 +12,7 @@ from typing import (
 )
 
 from fast_depends.dependencies import Dependant
+from fastapi.encoders import jsonable_encoder
 from fastapi.routing import run_endpoint_function, serialize_response
 from starlette.requests import Request
 
@@ -25,6 +26,7 @@ from ._compat import (
     create_response_field,
     raise_fastapi_validation_error,
     solve_faststream_dependency,
+    solve_faststream_params,
 )
 from .get_dependant import (
     get_fastapi_native_dependant,
@@ -145,17 +147,21 @@ def build_faststream_to_fastapi_parser(
     """Creates a session for handling requests."""
     assert dependent.call
 
-    consume = make_fastapi_execution(
-        dependent=dependent,
-        fastapi_config=fastapi_config,
-        response_field=response_field,
-        response_model_include=response_model_include,
-        response_model_exclude=response_model_exclude,
-        response_model_by_alias=response_model_by_alias,
-        response_model_exclude_unset=response_model_exclude_unset,
-        response_model_exclude_defaults=response_model_exclude_defaults,
-        response_model_exclude_none=response_model_exclude_none,
-    )
+    consume: Callable[[StreamMessage, NativeMessage[Any]], Awaitable[Response]]
+    if response_field is None and is_static_dependant(dependent):
+        consume = make_fastapi_static_execution(dependent=dependent)
+    else:
+        consume = make_fastapi_execution(
+            dependent=dependent,
+            fastapi_config=fastapi_config,
+            response_field=response_field,
+            response_model_include=response_model_include,
+            response_model_exclude=response_model_exclude,
+            response_model_by_alias=response_model_by_alias,
+            response_model_exclude_unset=response_model_exclude_unset,
+            response_model_exclude_defaults=response_model_exclude_defaults,
+            response_model_exclude_none=response_model_exclude_none,
+        )
 
     dependencies_names = tuple(i.name for i in dependent.dependencies)
 
@@ -268,3 +274,60 @@ def make_fastapi_execution(
         raise AssertionError(msg)
 
     return app
+
+
+def is_static_dependant(dependent: "FastAPIDependant") -> bool:
+    """Check if the handler takes nothing but validated message params.
+
+    Such handler doesn't require `Depends`, `Request`, `BackgroundTasks` or
+    other request-scoped objects, so it can be called without FastAPI
+    dependencies solving.
+    """
+    return not dependent.dependencies and not any(
+        getattr(dependent, name, None)
+        for name in (
+            "request_param_name",
+            "websocket_param_name",
+            "http_connection_param_name",
+            "response_param_name",
+            "background_tasks_param_name",
+            "security_scopes_param_name",
+        )
+    )
+
+
+def make_fastapi_static_execution(
+    *,
+    dependent: "FastAPIDependant",
+) -> Callable[
+    ["StreamMessage", "NativeMessage[Any]"],
+    Awaitable[Response],
+]:
+    """Creates a FastAPI application for a handler without dependencies."""
+    is_coroutine = asyncio.iscoroutinefunction(dependent.call)
+
+    async def app(
+        request: "StreamMessage",
+        raw_message: "NativeMessage[Any]",
+    ) -> Response:
+        """Validate StreamMessage params and return user function result."""
+        solved_result = await solve_faststream_params(
+            request=request,
+            dependant=dependent,
+        )
+
+        if solved_result.errors:
+            raise_fastapi_validation_error(solved_result.errors, request._body)  # type: ignore[arg-type]
+
+        function_result = await run_endpoint_function(
+            dependant=dependent,
+            values=solved_result.values,
+            is_coroutine=is_coroutine,
+        )
+
+        response = ensure_response(function_result)
+        # the same as `serialize_response` does without response model
+        response.body = jsonable_encoder(response.body)
+        return response
+
+    return app
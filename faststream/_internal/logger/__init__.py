@@ -1,9 +1,13 @@
+from .background import BackgroundLogWriter
+from .log_context import LazyLogContext
 from .logging import logger
 from .params_storage import DefaultLoggerStorage, LoggerParamsStorage
 from .state import LoggerState, make_logger_state
 
 __all__ = (
+    "BackgroundLogWriter",
     "DefaultLoggerStorage",
+    "LazyLogContext",
     "LoggerParamsStorage",
     "LoggerState",
     "logger",
@@ -0,0 +1,73 @@
+import logging
+import queue
+from collections.abc import Mapping
+from logging.handlers import QueueListener
+from typing import Any
+
+
+class _LoggerHandler(logging.Handler):
+    """Passes records to the logger handlers as they were logged by it."""
+
+    def __init__(self, logger: logging.Logger) -> None:
+        super().__init__()
+        self.logger = logger
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        self.logger.handle(record)
+        return True
+
+
+class BackgroundLogWriter:
+    """Writes `logging.Logger` records from a separate thread.
+
+    Records are created in the caller thread, so they have the right time
+    and log context, but filtering, formatting and I/O are moved out of
+    the event loop the same way `logging.handlers.QueueHandler` does.
+    """
+
+    __slots__ = ("_listener", "_queue", "_running", "logger")
+
+    def __init__(self, logger: logging.Logger) -> None:
+        self.logger = logger
+        self._queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._listener = QueueListener(self._queue, _LoggerHandler(logger))
+        self._running = False
+
+    def start(self) -> None:
+        if not self._running:
+            self._listener.start()
+            self._running = True
+
+    def stop(self) -> None:
+        """Stop the writer thread after all queued records are written."""
+        if self._running:
+            self._listener.stop()
+            self._running = False
+
+    def log(
+        self,
+        level: int,
+        msg: str,
+        *,
+        extra: Mapping[str, Any] | None = None,
+        exc_info: BaseException | None = None,
+    ) -> None:
+        logger = self.logger
+        if not logger.isEnabledFor(level):
+            return
+
+        record = logger.makeRecord(
+            logger.name,
+            level,
+            "(unknown file)",
+            0,
+            msg,
+            (),
+            (type(exc_info), exc_info, exc_info.__traceback__) if exc_info else None,
+            extra=extra,
+        )
+
+        if self._running:
+            self._queue.put_nowait(record)
+        else:
+            logger.handle(record)
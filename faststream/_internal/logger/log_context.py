@@ -0,0 +1,43 @@
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any, Generic, TypeVar
+
+MessageT = TypeVar("MessageT")
+
+
+class LazyLogContext(Mapping[str, str], Generic[MessageT]):
+    """Message log context built on the first access.
+
+    Allows to skip building the context for messages no record is emitted for.
+    """
+
+    __slots__ = ("_builder", "_context", "_message")
+
+    def __init__(
+        self,
+        builder: Callable[[MessageT], dict[str, str]],
+        message: MessageT,
+    ) -> None:
+        self._builder = builder
+        self._message = message
+        self._context: dict[str, str] | None = None
+
+    @property
+    def context(self) -> dict[str, str]:
+        if (context := self._context) is None:
+            context = self._context = self._builder(self._message)
+        return context
+
+    def __getitem__(self, key: str) -> str:
+        return self.context[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.context)
+
+    def __len__(self) -> int:
+        return len(self.context)
+
+    def __or__(self, other: Mapping[str, Any]) -> dict[str, Any]:
+        return {**self.context, **other}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.context})"
@@ -1,6 +1,12 @@
 import logging
+import random
+import time
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any, Optional
 
+import anyio
+
+from .background import BackgroundLogWriter
 from .logger_proxy import (
     EmptyLoggerObject,
     LoggerObject,
@@ -23,6 +29,10 @@ def make_logger_state(
     logger: Optional["LoggerProto"],
     log_level: int,
     default_storage_cls: type["DefaultLoggerStorage"],
+    *,
+    sample_ratio: float = 1.0,
+    rate_limit: int | None = None,
+    in_background: bool = False,
 ) -> "LoggerState":
     storage = make_logger_storage(
         logger=logger,
@@ -32,6 +42,9 @@ def make_logger_state(
     return LoggerState(
         log_level=log_level,
         storage=storage,
+        sample_ratio=sample_ratio,
+        rate_limit=rate_limit,
+        in_background=in_background,
     )
 
 
@@ -40,12 +53,25 @@ class LoggerState:
         self,
         log_level: int = logging.INFO,
         storage: Optional["LoggerParamsStorage"] = None,
+        *,
+        sample_ratio: float = 1.0,
+        rate_limit: int | None = None,
+        in_background: bool = False,
     ) -> None:
         self.log_level = log_level
         self.params_storage = storage or EmptyLoggerStorage()
 
         self.logger: LoggerObject = NotSetLoggerObject()
 
+        # per-message records options
+        self.sample_ratio = sample_ratio
+        self.rate_limit = rate_limit
+        self.in_background = in_background
+
+        self._writer: BackgroundLogWriter | None = None
+        self._rate_window = 0
+        self._rate_count = 0
+
     def __repr__(self) -> str:
         return (
             f"{self.__class__.__name__}(log_level={self.log_level}, logger={self.logger})"
@@ -69,9 +95,66 @@ class LoggerState:
             exc_info=exc_info,
         )
 
+    def sample_message(self) -> bool:
+        """Whether to write per-message records for the current message."""
+        if self.sample_ratio < 1 and random.random() >= self.sample_ratio:  # noqa: S311
+            return False
+
+        if (rate_limit := self.rate_limit) is not None:
+            window = int(time.monotonic())
+            if window != self._rate_window:
+                self._rate_window = window
+                self._rate_count = 0
+
+            if self._rate_count >= rate_limit:
+                return False
+
+            self._rate_count += 1
+
+        return True
+
+    def log_message(
+        self,
+        message: str,
+        log_level: int | None = None,
+        extra: Mapping[str, Any] | None = None,
+        exc_info: BaseException | None = None,
+    ) -> None:
+        """Write per-message record, in a background thread if it is enabled."""
+        if (writer := self._writer) is not None:
+            writer.log(
+                (log_level or self.log_level),
+                message,
+                extra=extra,
+                exc_info=exc_info,
+            )
+
+        else:
+            self.logger.log(
+                (log_level or self.log_level),
+                message,
+                extra=extra,
+                exc_info=exc_info,
+            )
+
     def _setup(self, context: "ContextRepo", /) -> None:
         if not self.logger:
             if logger := self.params_storage.get_logger(context=context):
                 self.logger = RealLoggerObject(logger)
             else:
                 self.logger = EmptyLoggerObject()
+
+        if (
+            self.in_background
+            and self._writer is None
+            and isinstance(self.logger.logger, logging.Logger)
+        ):
+            self._writer = BackgroundLogWriter(self.logger.logger)
+
+        if self._writer is not None:
+            self._writer.start()
+
+    async def _stop(self) -> None:
+        if self._writer is not None:
+            # wait for queued records to be written
+            await anyio.to_thread.run_sync(self._writer.stop)
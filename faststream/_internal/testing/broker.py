@@ -208,6 +208,7 @@ class TestBroker(Generic[Broker]):
 
         for sub in broker.subscribers:
             sub.running = False
+            sub._pipeline = None
             for call in sub.calls:
                 call.handler.reset_test()
 
@@ -27,6 +27,10 @@ MAX_INC = 333
 INC = MAX_INC - MIN_INC
 TOTAL_LENGTH = PREFIX_LENGTH + SEQ_LENGTH
 
+# all two-digit combinations to encode sequence by pairs of digits
+PAIR_BASE = BASE**2
+PAIRS = tuple(chr(DIGITS[i // BASE]) + chr(DIGITS[i % BASE]) for i in range(PAIR_BASE))
+
 
 class NUID:
     """NUID created is a utility to create a new id.
@@ -40,6 +44,7 @@ class NUID:
         self._seq = self._prand.randint(0, MAX_SEQ)
         self._inc = MIN_INC + self._prand.randint(BASE + 1, INC)
         self._prefix = bytearray()
+        self._str_prefix = ""
         self.randomize_prefix()
 
     def next(self) -> bytearray:
@@ -59,9 +64,28 @@ class NUID:
         prefix.extend(suffix)
         return prefix
 
+    def next_str(self) -> str:
+        """Next returns the next unique identifier as a string.
+
+        It is a faster version of `next().decode()`.
+        """
+        self._seq += self._inc
+        if self._seq >= MAX_SEQ:
+            self.randomize_prefix()
+            self.reset_sequential()
+
+        l_seq, d5 = divmod(self._seq, PAIR_BASE)
+        l_seq, d4 = divmod(l_seq, PAIR_BASE)
+        l_seq, d3 = divmod(l_seq, PAIR_BASE)
+        d1, d2 = divmod(l_seq, PAIR_BASE)
+        return (
+            f"{self._str_prefix}{PAIRS[d1]}{PAIRS[d2]}{PAIRS[d3]}{PAIRS[d4]}{PAIRS[d5]}"
+        )
+
     def randomize_prefix(self) -> None:
         random_bytes = token_bytes(PREFIX_LENGTH)
         self._prefix = bytearray(DIGITS[c % BASE] for c in random_bytes)
+        self._str_prefix = self._prefix.decode()
 
     def reset_sequential(self) -> None:
         self._seq = self._prand.randint(0, MAX_SEQ)
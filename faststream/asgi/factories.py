@@ -8,6 +8,7 @@ from faststream.specification.asyncapi.site import (
 )
 
 from .handlers import get
+from .health import BrokerHealthCheck
 from .response import AsgiResponse
 
 if TYPE_CHECKING:
@@ -26,7 +27,17 @@ def make_ping_asgi(
     description: str | None = None,
     tags: Sequence[Union["Tag", "TagDict", dict[str, Any]]] | None = None,
     unique_id: str | None = None,
+    *,
+    cache_ttl: float | None = None,
+    activity_ttl: float | None = None,
 ) -> "ASGIApp":
+    health_check = BrokerHealthCheck(
+        broker,
+        timeout=timeout,
+        cache_ttl=cache_ttl,
+        activity_ttl=activity_ttl,
+    )
+
     healthy_response = AsgiResponse(b"", 204)
     unhealthy_response = AsgiResponse(b"", 500)
 
@@ -37,7 +48,7 @@ def make_ping_asgi(
         unique_id=unique_id,
     )
     async def ping(scope: "Scope") -> AsgiResponse:
-        if await broker.ping(timeout):
+        if await health_check():
             return healthy_response
         return unhealthy_response
 
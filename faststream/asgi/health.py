@@ -0,0 +1,77 @@
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from faststream._internal.broker import BrokerUsecase
+
+
+class BrokerHealthCheck:
+    """Broker health state shared by all probes of an endpoint.
+
+    Concurrent probes wait for the same in-flight ping, its result is reused
+    for `cache_ttl` seconds, and a subscriber consumed a message in the last
+    `activity_ttl` seconds is enough to report healthy without a ping at all.
+    """
+
+    __slots__ = (
+        "_checked_at",
+        "_in_flight",
+        "_result",
+        "activity_ttl",
+        "broker",
+        "cache_ttl",
+        "timeout",
+    )
+
+    def __init__(
+        self,
+        broker: "BrokerUsecase[Any, Any]",
+        *,
+        timeout: float | None = None,
+        cache_ttl: float | None = None,
+        activity_ttl: float | None = None,
+    ) -> None:
+        self.broker = broker
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self.activity_ttl = activity_ttl
+
+        self._in_flight: asyncio.Future[bool] | None = None
+        self._result = False
+        self._checked_at: float | None = None
+
+    async def __call__(self) -> bool:
+        now = time.monotonic()
+
+        if self.activity_ttl is not None and self._has_activity(now, self.activity_ttl):
+            return True
+
+        if (
+            self.cache_ttl is not None
+            and self._checked_at is not None
+            and now - self._checked_at < self.cache_ttl
+        ):
+            return self._result
+
+        if self._in_flight is None:
+            self._in_flight = asyncio.ensure_future(self._ping())
+
+        # a cancelled probe should not cancel the ping awaited by others
+        return await asyncio.shield(self._in_flight)
+
+    def _has_activity(self, now: float, ttl: float) -> bool:
+        return any(
+            sub.running
+            and sub.last_consumed_at is not None
+            and now - sub.last_consumed_at < ttl
+            for sub in self.broker.subscribers
+        )
+
+    async def _ping(self) -> bool:
+        try:
+            self._result = await self.broker.ping(self.timeout)
+            self._checked_at = time.monotonic()
+        finally:
+            self._in_flight = None
+        return self._result
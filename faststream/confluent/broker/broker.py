@@ -107,9 +107,13 @@ class KafkaBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_sample_ratio: float = 1.0,
+        log_rate_limit: int | None = None,
+        log_in_background: bool = False,
         # FastDepends args
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
+        decode_to_model: bool = False,
     ) -> None:
         """Initialize KafkaBroker.
 
@@ -208,8 +212,14 @@ class KafkaBroker(
             tags: AsyncAPI server tags.
             logger: User specified logger to pass into Context and log service messages.
             log_level: Service messages log level.
+            log_sample_ratio: Fraction of messages to write `Received` and `Processed` records for.
+                Errors are always logged.
+            log_rate_limit: Maximum number of messages per second to write `Received` and `Processed` records for.
+            log_in_background: Whether to write per-message records from a background thread instead of the event loop.
             apply_types: Whether to use FastDepends or not.
             serializer: Serializer for FastDepends.
+            decode_to_model: Whether to decode JSON messages right into the handler's pydantic model
+                or msgspec Struct argument, skipping the intermediate `dict`.
         """
         if protocol is None:
             if security is not None and security.use_ssl:
@@ -268,10 +278,14 @@ class KafkaBroker(
                 logger=make_kafka_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    sample_ratio=log_sample_ratio,
+                    rate_limit=log_rate_limit,
+                    in_background=log_in_background,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
                     serializer=serializer,
+                    decode_to_model=decode_to_model,
                 ),
                 # subscriber args
                 graceful_timeout=graceful_timeout,
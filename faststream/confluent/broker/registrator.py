@@ -138,6 +138,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int = 1,
         # broker args
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -199,6 +200,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int = 1,
         # broker args
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -262,6 +264,7 @@ class KafkaRegistrator(
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int = 1,
         # broker args
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -401,6 +404,9 @@ class KafkaRegistrator(
                 return the ALSO. See method docs below.
             batch: Whether to consume messages in batches or not.
             max_records: Number of messages to consume as one batch.
+            prefetch: Number of messages to fetch from the consumer at once and to
+                process one by one. Saves a consumer thread call per message.
+                Available for `AckPolicy.ACK_FIRST` only.
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **Message** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
@@ -427,6 +433,7 @@ class KafkaRegistrator(
             partitions=partitions,
             batch=batch,
             max_records=max_records,
+            prefetch=prefetch,
             group_id=group_id,
             connection_data={
                 "group_instance_id": group_instance_id,
@@ -138,6 +138,7 @@ class KafkaRoute(SubscriberRoute):
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int = 1,
         # broker args
         dependencies: Iterable["Dependant"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -275,6 +276,9 @@ class KafkaRoute(SubscriberRoute):
                 return the ALSO. See method docs below.
             batch: Whether to consume messages in batches or not.
             max_records: Number of messages to consume as one batch.
+            prefetch: Number of messages to fetch from the consumer at once and to
+                process one by one. Saves a consumer thread call per message.
+                Available for `AckPolicy.ACK_FIRST` only.
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **Message** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
@@ -311,6 +315,7 @@ class KafkaRoute(SubscriberRoute):
             heartbeat_interval_ms=heartbeat_interval_ms,
             isolation_level=isolation_level,
             max_records=max_records,
+            prefetch=prefetch,
             batch=batch,
             # basic args
             dependencies=dependencies,
@@ -432,6 +432,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         ] = "read_uncommitted",
         batch: Literal[False] = False,
         max_records: int | None = None,
+        prefetch: int = 1,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -558,6 +559,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int = 1,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -628,6 +630,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
         ] = "read_uncommitted",
         batch: bool = False,
         max_records: int | None = None,
+        prefetch: int = 1,
         # broker args
         dependencies: Iterable["params.Depends"] = (),
         parser: Optional["CustomCallable"] = None,
@@ -771,6 +774,9 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
                 return the ALSO. See method docs below.
             batch: Whether to consume messages in batches or not.
             max_records: Number of messages to consume as one batch.
+            prefetch: Number of messages to fetch from the consumer at once and to
+                process one by one. Saves a consumer thread call per message.
+                Available for `AckPolicy.ACK_FIRST` only.
             dependencies: Dependencies list (`[Dependant(),]`) to apply to the subscriber.
             parser: Parser to map original **Message** object to FastStream one.
             decoder: Function to decode FastStream msg bytes body to python objects.
@@ -885,6 +891,7 @@ class KafkaRouter(StreamRouter[Message | tuple[Message, ...]]):
             isolation_level=isolation_level,
             batch=batch,
             max_records=max_records,
+            prefetch=prefetch,
             # broker args
             dependencies=dependencies,
             parser=parser,
@@ -1,9 +1,10 @@
 import asyncio
 import logging
+from collections import deque
 from collections.abc import Callable, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
-from time import time
+from time import monotonic, time
 from typing import TYPE_CHECKING, Any
 
 import anyio
@@ -191,6 +192,7 @@ class AsyncConfluentConsumer:
         connections_max_idle_ms: int = 540000,
         isolation_level: str = "read_uncommitted",
         allow_auto_create_topics: bool = True,
+        prefetch: int = 1,
     ) -> None:
         self.admin_client = admin_service
         self.logger_state = logger
@@ -239,6 +241,11 @@ class AsyncConfluentConsumer:
         # https://github.com/ag2ai/faststream/issues/1904#issuecomment-2506990895
         self._thread_pool = ThreadPoolExecutor(max_workers=1)
 
+        self.prefetch = prefetch
+        self._buffer: deque[Message] = deque()
+        self._last_poll = 0.0
+        self._max_poll_interval = int(self.config["max.poll.interval.ms"]) / 1000
+
     @property
     def topics_to_create(self) -> list[str]:
         return list({*self.topics, *(p.topic for p in self.partitions)})
@@ -320,11 +327,38 @@ class AsyncConfluentConsumer:
         await run_in_executor(self._thread_pool, self.consumer.close)
 
         self._thread_pool.shutdown(wait=False)
+        self._buffer.clear()
 
     async def getone(self, timeout: float = 0.1) -> Message | None:
         """Consumes a single message from Kafka."""
-        msg = await run_in_executor(self._thread_pool, self.consumer.poll, timeout)
-        return check_msg_error(msg)
+        if self.prefetch <= 1:
+            msg = await run_in_executor(self._thread_pool, self.consumer.poll, timeout)
+            return check_msg_error(msg)
+
+        if self._buffer and monotonic() - self._last_poll > self._max_poll_interval / 2:
+            # Buffer is drained too slow to keep consumer in the group.
+            # Return unprocessed messages to the consumer to poll it now.
+            await self._rewind_buffer()
+
+        # Refill buffer only after it was drained, so rebalance callbacks
+        # (called inside `consume`) never leave messages of revoked partitions in it
+        if not self._buffer:
+            self._buffer.extend(
+                await self.getmany(timeout=timeout, max_records=self.prefetch),
+            )
+            self._last_poll = monotonic()
+
+        return self._buffer.popleft() if self._buffer else None
+
+    async def _rewind_buffer(self) -> None:
+        offsets: dict[tuple[str, int], int] = {}
+        for msg in self._buffer:
+            offsets.setdefault((msg.topic(), msg.partition()), msg.offset())  # type: ignore[arg-type]
+
+        self._buffer.clear()
+
+        for (topic, partition), offset in offsets.items():
+            await self.seek(topic, partition, offset)
 
     async def getmany(
         self,
@@ -1,7 +1,7 @@
-from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
-from faststream.message import StreamMessage, decode_message
+from faststream.message import StreamMessage, decode_batch, decode_message
+from faststream.message.headers import decode_headers
 
 from .message import FAKE_CONSUMER, KafkaMessage
 
@@ -28,7 +28,7 @@ class AsyncConfluentParser:
         message: "Message",
     ) -> KafkaMessage:
         """Parses a Kafka message."""
-        headers = _parse_msg_headers(message.headers() or ())
+        headers = decode_headers(message.headers() or ())
 
         body = message.value() or b""
         offset = message.offset()
@@ -59,7 +59,7 @@ class AsyncConfluentParser:
 
         for m in message:
             body.append(m.value() or b"")
-            batch_headers.append(_parse_msg_headers(m.headers() or ()))
+            batch_headers.append(decode_headers(m.headers() or ()))
 
         headers = next(iter(batch_headers), {})
 
@@ -90,10 +90,7 @@ class AsyncConfluentParser:
         msg: "StreamMessage[tuple[Message, ...]]",
     ) -> "DecodedMessage":
         """Decode a batch of messages."""
-        return [decode_message(await self.parse_message(m)) for m in msg.raw_message]
-
-
-def _parse_msg_headers(
-    headers: Sequence[tuple[str, bytes | str]],
-) -> dict[str, str]:
-    return {i: j if isinstance(j, str) else j.decode() for i, j in headers}
+        return decode_batch(
+            msg.body,
+            [h.get("content-type") for h in msg.batch_headers],
+        )
@@ -26,6 +26,7 @@ def create_subscriber(
     polling_interval: float,
     batch: bool,
     max_records: int | None,
+    prefetch: int,
     # Kafka information
     group_id: str | None,
     connection_data: dict[str, Any],
@@ -49,8 +50,13 @@ def create_subscriber(
         no_ack=no_ack,
         auto_commit=auto_commit,
         max_workers=max_workers,
+        batch=batch,
+        prefetch=prefetch,
     )
 
+    if prefetch > 1:
+        connection_data["prefetch"] = prefetch
+
     subscriber_config = KafkaSubscriberConfig(
         topics=topics,
         partitions=partitions,
@@ -104,6 +110,8 @@ def _validate_input_for_misconfigure(
     auto_commit: bool,
     no_ack: bool,
     max_workers: int,
+    batch: bool,
+    prefetch: int,
     group_id: str | None,
     partitions: Iterable["TopicPartition"],
 ) -> None:
@@ -140,6 +148,15 @@ def _validate_input_for_misconfigure(
         msg = "Max workers not work with manual commit mode."
         raise SetupError(msg)
 
+    if prefetch > 1:
+        if batch:
+            msg = "You can't use `prefetch` with batch subscriber. Use `max_records` instead."
+            raise SetupError(msg)
+
+        if ack_policy is not AckPolicy.ACK_FIRST:
+            msg = "`prefetch` requires `ack_policy=AckPolicy.ACK_FIRST`."
+            raise SetupError(msg)
+
     if not topics and not partitions:
         msg = "You should provide either `topics` or `partitions`."
         raise SetupError(msg)
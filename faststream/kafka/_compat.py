@@ -0,0 +1,50 @@
+"""Private `aiokafka` API used by FastStream.
+
+Checked with the `aiokafka` versions allowed by the `kafka` extra,
+see `tests/brokers/kafka/test_compat.py`.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaProducer
+
+
+def serialize_record(
+    producer: "AIOKafkaProducer",
+    topic: str,
+    key: Any,
+    value: Any,
+) -> tuple[bytes | None, bytes | None] | None:
+    """Serialize record key and value the same way `producer.send()` does.
+
+    Returns `None` if the producer has no expected internals.
+    """
+    try:
+        serialize = producer._serialize
+    except AttributeError:
+        return None
+
+    serialized: tuple[bytes | None, bytes | None] = serialize(topic, key, value)
+    return serialized
+
+
+async def select_key_partition(
+    producer: "AIOKafkaProducer",
+    topic: str,
+    key: Any,
+    serialized_key: bytes,
+) -> int | None:
+    """Select a partition for keyed record the same way `producer.send()` does.
+
+    Returns `None` if the producer has no expected internals.
+    """
+    try:
+        wait_on_metadata = producer.client._wait_on_metadata
+        partition = producer._partition
+    except AttributeError:
+        return None
+
+    await wait_on_metadata(topic)
+    selected: int = partition(topic, None, key, None, serialized_key, None)
+    return selected
@@ -227,9 +227,13 @@ class KafkaBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_sample_ratio: float = 1.0,
+        log_rate_limit: int | None = None,
+        log_in_background: bool = False,
         # FastDepends args
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
+        decode_to_model: bool = False,
     ) -> None:
         """Kafka broker constructor.
 
@@ -334,10 +338,20 @@ class KafkaBroker(
                 User specified logger to pass into Context and log service messages.
             log_level (int):
                 Service messages log level.
+            log_sample_ratio (float):
+                Fraction of messages to write `Received` and `Processed` records for.
+                Errors are always logged.
+            log_rate_limit (int | None):
+                Maximum number of messages per second to write `Received` and `Processed` records for.
+            log_in_background (bool):
+                Whether to write per-message records from a background thread instead of the event loop.
             apply_types (bool):
                 Whether to use FastDepends or not.
             serializer (Optional[SerializerProto]):
                 Serializer to use.
+            decode_to_model (bool):
+                Whether to decode JSON messages right into the handler's pydantic model
+                or msgspec Struct argument, skipping the intermediate `dict`.
         """
         if protocol is None:
             if security is not None and security.use_ssl:
@@ -410,10 +424,14 @@ class KafkaBroker(
                 logger=make_kafka_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    sample_ratio=log_sample_ratio,
+                    rate_limit=log_rate_limit,
+                    in_background=log_in_background,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
                     serializer=serializer,
+                    decode_to_model=decode_to_model,
                 ),
                 # subscriber args
                 graceful_timeout=graceful_timeout,
@@ -42,6 +42,7 @@ if TYPE_CHECKING:
         BatchSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
+        ConcurrentKeyedSubscriber,
         DefaultSubscriber,
     )
 
@@ -180,6 +181,7 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordering: Literal["key", "partition"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -190,6 +192,7 @@ class KafkaRegistrator(
         "DefaultSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentKeyedSubscriber",
     ]: ...
 
     @overload
@@ -251,6 +254,7 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = 0,
+        ordering: Literal["key", "partition"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -262,6 +266,7 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentKeyedSubscriber",
     ]: ...
 
     @override
@@ -323,6 +328,7 @@ class KafkaRegistrator(
             ),
         ] = EMPTY,
         max_workers: int | None = None,
+        ordering: Literal["key", "partition"] | None = None,
         ack_policy: AckPolicy = EMPTY,
         no_reply: bool = False,
         # Specification args
@@ -334,6 +340,7 @@ class KafkaRegistrator(
         "BatchSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentKeyedSubscriber",
     ]:
         """Create a subscriber for Kafka topics.
 
@@ -513,6 +520,8 @@ class KafkaRegistrator(
             decoder: Function to decode FastStream msg bytes body to python objects.
             middlewares: Subscriber middlewares to wrap incoming message processing.
             max_workers: Number of workers to process messages concurrently.
+            ordering: Keep messages order by `key` or by `partition` processing them
+                concurrently by `max_workers` sequential lanes of a single consumer.
             no_ack: Whether to disable **FastStream** auto acknowledgement logic or not.
             ack_policy: Acknowledgement policy for the subscriber.
             no_reply: Whether to disable **FastStream** RPC and Reply To auto responses or not.
@@ -527,6 +536,7 @@ class KafkaRegistrator(
             *topics,
             batch=batch,
             max_workers=workers,
+            ordering=ordering,
             batch_timeout_ms=batch_timeout_ms,
             max_records=max_records,
             group_id=group_id,
@@ -579,6 +589,8 @@ class KafkaRegistrator(
             return cast("BatchSubscriber", subscriber)
 
         if workers > 1:
+            if ordering is not None:
+                return cast("ConcurrentKeyedSubscriber", subscriber)
             if auto_commit:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
@@ -608,6 +620,8 @@ class KafkaRegistrator(
         schema: Any | None = None,
         include_in_schema: bool = True,
         autoflush: bool = False,
+        linger_ms: float | None = None,
+        max_batch_bytes: int | None = None,
     ) -> "DefaultPublisher": ...
 
     @overload
@@ -659,6 +673,8 @@ class KafkaRegistrator(
         schema: Any | None = None,
         include_in_schema: bool = True,
         autoflush: bool = False,
+        linger_ms: float | None = None,
+        max_batch_bytes: int | None = None,
     ) -> Union[
         "BatchPublisher",
         "DefaultPublisher",
@@ -688,6 +704,8 @@ class KafkaRegistrator(
         schema: Any | None = None,
         include_in_schema: bool = True,
         autoflush: bool = False,
+        linger_ms: float | None = None,
+        max_batch_bytes: int | None = None,
     ) -> Union[
         "BatchPublisher",
         "DefaultPublisher",
@@ -726,9 +744,19 @@ class KafkaRegistrator(
                 Should be any python-native object annotation or `pydantic.BaseModel`.
             include_in_schema: Whetever to include operation in Specification schema or not.
             autoflush: Whether to flush the producer or not on every publish call.
+            linger_ms:
+                Collect concurrent `publish` calls for up to this time (in milliseconds)
+                and send them as a single batch per topic partition. Every call still
+                gets its own `RecordMetadata`. Disabled by default.
+            max_batch_bytes:
+                Send collected messages right away once their batch reaches this
+                size (in bytes). Used with `linger_ms` only. Broker `max_batch_size`
+                is the upper limit anyway.
         """
         publisher = create_publisher(
             autoflush=autoflush,
+            linger_ms=linger_ms,
+            max_batch_bytes=max_batch_bytes,
             # batch flag
             batch=batch,
             # default args
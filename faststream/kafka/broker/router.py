@@ -182,6 +182,7 @@ class KafkaRoute(SubscriberRoute):
         description: str | None = None,
         include_in_schema: bool = True,
         max_workers: int = 1,
+        ordering: Literal["key", "partition"] | None = None,
     ) -> None:
         """Initialize KafkaRoute.
 
@@ -370,12 +371,15 @@ class KafkaRoute(SubscriberRoute):
                 Uses decorated docstring as default.
             include_in_schema: Whetever to include operation in AsyncAPI schema or not.
             max_workers: Number of workers to process messages concurrently.
+            ordering: Keep messages order by `key` or by `partition` processing them
+                concurrently by `max_workers` sequential lanes of a single consumer.
         """
         super().__init__(
             call,
             *topics,
             publishers=publishers,
             max_workers=max_workers,
+            ordering=ordering,
             group_id=group_id,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
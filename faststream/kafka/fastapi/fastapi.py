@@ -56,6 +56,7 @@ if TYPE_CHECKING:
         BatchSubscriber,
         ConcurrentBetweenPartitionsSubscriber,
         ConcurrentDefaultSubscriber,
+        ConcurrentKeyedSubscriber,
         DefaultSubscriber,
     )
     from faststream.security import BaseSecurity
@@ -2614,16 +2615,25 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
                 "is equal to the number of partitions in the topic.",
             ),
         ] = 1,
+        ordering: Annotated[
+            Literal["key", "partition"] | None,
+            Doc(
+                "Keep messages order by `key` or by `partition` processing them "
+                "concurrently by `max_workers` sequential lanes of a single consumer.",
+            ),
+        ] = None,
     ) -> Union[
         "BatchSubscriber",
         "DefaultSubscriber",
         "ConcurrentDefaultSubscriber",
         "ConcurrentBetweenPartitionsSubscriber",
+        "ConcurrentKeyedSubscriber",
     ]:
         subscriber = super().subscriber(
             *topics,
             group_id=group_id,
             max_workers=max_workers,
+            ordering=ordering,
             key_deserializer=key_deserializer,
             value_deserializer=value_deserializer,
             fetch_max_wait_ms=fetch_max_wait_ms,
@@ -2673,6 +2683,8 @@ class KafkaRouter(StreamRouter[ConsumerRecord | tuple[ConsumerRecord, ...]]):
         if batch:
             return cast("BatchSubscriber", subscriber)
         if max_workers > 1:
+            if ordering is not None:
+                return cast("ConcurrentKeyedSubscriber", subscriber)
             if auto_commit:
                 return cast("ConcurrentDefaultSubscriber", subscriber)
             return cast("ConcurrentBetweenPartitionsSubscriber", subscriber)
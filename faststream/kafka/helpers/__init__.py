@@ -1,3 +1,9 @@
+from .offsets import OffsetTracker, TrackedConsumer, TrackingRebalanceListener
 from .rebalance_listener import make_logging_listener
 
-__all__ = ("make_logging_listener",)
+__all__ = (
+    "OffsetTracker",
+    "TrackedConsumer",
+    "TrackingRebalanceListener",
+    "make_logging_listener",
+)
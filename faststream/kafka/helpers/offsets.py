@@ -0,0 +1,122 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Optional
+
+from aiokafka import ConsumerRebalanceListener, TopicPartition
+
+from faststream._internal.utils.functions import call_or_await
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaConsumer, ConsumerRecord
+
+
+class OffsetTracker:
+    """Tracks in-flight records to find offsets safe to commit.
+
+    Records of one partition can be completed out of order, so a partition
+    is committed only up to its lowest still processing offset.
+    """
+
+    __slots__ = ("_committed", "_in_flight", "_next", "_rewound")
+
+    def __init__(self) -> None:
+        self._in_flight: dict[TopicPartition, dict[int, ConsumerRecord]] = {}
+        self._next: dict[TopicPartition, int] = {}
+        self._committed: dict[TopicPartition, int] = {}
+        # lowest offset each partition was sought back to and not fetched again yet
+        self._rewound: dict[TopicPartition, int] = {}
+
+    def add(self, record: "ConsumerRecord") -> None:
+        tp = TopicPartition(record.topic, record.partition)
+        self._in_flight.setdefault(tp, {})[record.offset] = record
+        self._next[tp] = max(self._next.get(tp, 0), record.offset + 1)
+        # offset of the first fetched record is already committed
+        self._committed.setdefault(tp, record.offset)
+
+        rewound = self._rewound.get(tp)
+        if rewound is not None and record.offset <= rewound:
+            del self._rewound[tp]
+
+    def complete(self, record: "ConsumerRecord") -> dict[TopicPartition, int]:
+        """Mark record as processed and return offsets to commit if any."""
+        tp = TopicPartition(record.topic, record.partition)
+
+        in_flight = self._in_flight.get(tp)
+        if in_flight is None or in_flight.get(record.offset) is not record:
+            # the partition was reset by rebalance while record was processing
+            return {}
+
+        del in_flight[record.offset]
+
+        offset = min(in_flight) if in_flight else self._next[tp]
+        if (rewound := self._rewound.get(tp)) is not None:
+            offset = min(offset, rewound)
+
+        if offset <= self._committed[tp]:
+            return {}
+
+        self._committed[tp] = offset
+        return {tp: offset}
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        """Do not commit past the offset until it is fetched again."""
+        self._rewound[partition] = min(self._rewound.get(partition, offset), offset)
+
+    def reset(self, partitions: Iterable[TopicPartition] | None = None) -> None:
+        """Forget partitions state, all partitions if `None`."""
+        if partitions is None:
+            self._in_flight.clear()
+            self._next.clear()
+            self._committed.clear()
+            self._rewound.clear()
+            return
+
+        for tp in partitions:
+            self._in_flight.pop(tp, None)
+            self._next.pop(tp, None)
+            self._committed.pop(tp, None)
+            self._rewound.pop(tp, None)
+
+
+class TrackedConsumer:
+    """Consumer proxy for messages processed with offsets tracking.
+
+    Offsets are committed by subscriber after message processing,
+    so message `ack` should not commit the whole consumer position.
+    """
+
+    __slots__ = ("consumer", "tracker")
+
+    def __init__(self, consumer: "AIOKafkaConsumer", tracker: OffsetTracker) -> None:
+        self.consumer = consumer
+        self.tracker = tracker
+
+    async def commit(self) -> None:
+        pass
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        self.tracker.seek(partition, offset)
+        self.consumer.seek(partition, offset)
+
+
+class TrackingRebalanceListener(ConsumerRebalanceListener):  # type: ignore[misc]
+    """Resets offsets tracking of partitions changed by rebalance."""
+
+    def __init__(
+        self,
+        tracker: OffsetTracker,
+        listener: Optional["ConsumerRebalanceListener"] = None,
+    ) -> None:
+        self.tracker = tracker
+        self.listener = listener
+
+    async def on_partitions_revoked(self, revoked: set[TopicPartition]) -> None:
+        self.tracker.reset(revoked)
+
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_revoked, revoked)
+
+    async def on_partitions_assigned(self, assigned: set[TopicPartition]) -> None:
+        self.tracker.reset(assigned)
+
+        if self.listener is not None:
+            await call_or_await(self.listener.on_partitions_assigned, assigned)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from faststream.kafka.message import (
     FAKE_CONSUMER,
@@ -6,7 +6,8 @@ from faststream.kafka.message import (
     KafkaMessage,
     KafkaRawMessage,
 )
-from faststream.message import decode_message
+from faststream.message import decode_batch, decode_message
+from faststream.message.headers import decode_headers
 
 if TYPE_CHECKING:
     from re import Pattern
@@ -38,7 +39,7 @@ class AioKafkaParser:
         message: Union["ConsumerRecord", "KafkaRawMessage"],
     ) -> "StreamMessage[ConsumerRecord]":
         """Parses a Kafka message."""
-        headers = {i: j.decode() for i, j in message.headers}
+        headers = decode_headers(message.headers)
 
         return self.msg_class(
             body=message.value or b"",
@@ -79,7 +80,7 @@ class AioKafkaBatchParser(AioKafkaParser):
 
         for m in message:
             body.append(m.value or b"")
-            batch_headers.append({i: j.decode() for i, j in m.headers})
+            batch_headers.append(decode_headers(m.headers))
 
         headers = next(iter(batch_headers), {})
 
@@ -101,7 +102,7 @@ class AioKafkaBatchParser(AioKafkaParser):
         msg: "StreamMessage[tuple[ConsumerRecord, ...]]",
     ) -> "DecodedMessage":
         """Decode a batch of messages."""
-        # super() should be here due python can't find it in comprehension
-        super_obj = cast("AioKafkaParser", super())
-
-        return [decode_message(await super_obj.parse_message(m)) for m in msg.raw_message]
+        return decode_batch(
+            msg.body,
+            [h.get("content-type") for h in msg.batch_headers],
+        )
@@ -21,3 +21,6 @@ class KafkaPublisherConfig(PublisherUsecaseConfig):
     partition: int | None
     headers: dict[str, str] | None
     reply_to: str
+
+    linger_ms: float | None = None
+    max_batch_bytes: int | None = None
@@ -25,6 +25,8 @@ def create_publisher(
     partition: int | None,
     headers: dict[str, str] | None,
     reply_to: str,
+    linger_ms: float | None,
+    max_batch_bytes: int | None,
     # Publisher args
     config: "KafkaBrokerConfig",
     middlewares: Sequence["PublisherMiddleware"],
@@ -40,6 +42,8 @@ def create_publisher(
         partition=partition,
         headers=headers,
         reply_to=reply_to,
+        linger_ms=linger_ms,
+        max_batch_bytes=max_batch_bytes,
         middlewares=middlewares,
         _outer_config=config,
     )
@@ -60,6 +64,10 @@ def create_publisher(
             msg = "You can't setup `key` with batch publisher"
             raise SetupError(msg)
 
+        if linger_ms is not None:
+            msg = "You can't setup `linger_ms` with batch publisher"
+            raise SetupError(msg)
+
         publisher: BatchPublisher | DefaultPublisher = BatchPublisher(
             publisher_config,
             specification,
@@ -0,0 +1,209 @@
+import asyncio
+from typing import TYPE_CHECKING
+
+from faststream.kafka._compat import select_key_partition, serialize_record
+
+if TYPE_CHECKING:
+    from aiokafka import AIOKafkaProducer
+    from aiokafka.producer.message_accumulator import BatchBuilder
+    from aiokafka.structs import RecordMetadata
+
+    from faststream.kafka.response import KafkaPublishCommand
+
+# topic, partition, linger_ms and max_batch_bytes of batched records
+_BatchKey = tuple[str, int | None, float | None, int | None]
+
+
+class _PendingBatch:
+    __slots__ = ("batch", "max_size", "producer", "records", "timer")
+
+    def __init__(self, producer: "AIOKafkaProducer", max_size: int | None) -> None:
+        self.producer = producer
+        self.batch: BatchBuilder = producer.create_batch()
+        self.max_size = max_size
+        # (caller future, record offset inside the batch)
+        self.records: list[tuple[asyncio.Future[RecordMetadata], int]] = []
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class LingerAccumulator:
+    """Collects concurrent single-message publishes into per-partition batches.
+
+    A batch is sent by `send_batch()` once it lingered for `cmd.linger_ms`
+    or reached `cmd.max_batch_bytes` bytes. Records are batched separately
+    for each of these settings, so publishers do not share each other batches.
+    Every caller gets its own `RecordMetadata` future resolved with the record
+    offset in the partition.
+    """
+
+    __slots__ = ("_batches", "_tasks")
+
+    def __init__(self) -> None:
+        self._batches: dict[_BatchKey, _PendingBatch] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def add(
+        self,
+        producer: "AIOKafkaProducer",
+        cmd: "KafkaPublishCommand",
+        value: bytes | None,
+        headers: list[tuple[str, bytes]],
+    ) -> "asyncio.Future[RecordMetadata]":
+        topic = cmd.destination
+
+        # batch stores raw bytes, so apply producer serializers as `send()` does
+        if (serialized := serialize_record(producer, topic, cmd.key, value)) is None:
+            return await self._send_one(producer, cmd, value, headers)
+
+        key_bytes, value_bytes = serialized
+
+        # keyless records keep `None`, so the whole batch goes
+        # to a partition chosen by the producer partitioner
+        partition = cmd.partition
+        if partition is None and key_bytes is not None:
+            partition = await select_key_partition(producer, topic, cmd.key, key_bytes)
+
+            if partition is None:
+                # can't batch keyed record without its partition
+                return await self._send_one(producer, cmd, value, headers)
+
+        # publishers with different settings do not share batches
+        batch_key = (topic, partition, cmd.linger_ms, cmd.max_batch_bytes)
+
+        if (pending := self._batches.get(batch_key)) is None:
+            pending = self._open(producer, batch_key)
+
+        metadata = pending.batch.append(
+            key=key_bytes,
+            value=value_bytes,
+            timestamp=cmd.timestamp_ms,
+            headers=headers,
+        )
+
+        if metadata is None:
+            # batch is full, so send it and start a new one
+            self._send(batch_key)
+            pending = self._open(producer, batch_key)
+            # the first record always fits into an empty batch
+            metadata = pending.batch.append(
+                key=key_bytes,
+                value=value_bytes,
+                timestamp=cmd.timestamp_ms,
+                headers=headers,
+            )
+
+        future: asyncio.Future[RecordMetadata] = (
+            asyncio.get_running_loop().create_future()
+        )
+        pending.records.append((future, metadata.offset))
+
+        if pending.max_size is not None and pending.batch.size() >= pending.max_size:
+            self._send(batch_key)
+
+        return future
+
+    async def flush(self) -> None:
+        """Send all pending batches and wait for them to be submitted."""
+        for batch_key in tuple(self._batches):
+            self._send(batch_key)
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _open(
+        self,
+        producer: "AIOKafkaProducer",
+        batch_key: _BatchKey,
+    ) -> _PendingBatch:
+        _, _, linger_ms, max_batch_bytes = batch_key
+
+        pending = self._batches[batch_key] = _PendingBatch(
+            producer,
+            max_size=max_batch_bytes,
+        )
+        pending.timer = asyncio.get_running_loop().call_later(
+            (linger_ms or 0) / 1000,
+            self._on_linger,
+            batch_key,
+            pending,
+        )
+        return pending
+
+    @staticmethod
+    async def _send_one(
+        producer: "AIOKafkaProducer",
+        cmd: "KafkaPublishCommand",
+        value: bytes | None,
+        headers: list[tuple[str, bytes]],
+    ) -> "asyncio.Future[RecordMetadata]":
+        send_future: asyncio.Future[RecordMetadata] = await producer.send(
+            cmd.destination,
+            value=value,
+            key=cmd.key,
+            timestamp_ms=cmd.timestamp_ms,
+            headers=headers,
+        )
+        return send_future
+
+    def _on_linger(
+        self,
+        batch_key: _BatchKey,
+        pending: _PendingBatch,
+    ) -> None:
+        if self._batches.get(batch_key) is pending:
+            self._send(batch_key)
+
+    def _send(self, batch_key: _BatchKey) -> None:
+        pending = self._batches.pop(batch_key)
+        task = asyncio.create_task(self._submit(batch_key, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _submit(
+        batch_key: _BatchKey,
+        pending: _PendingBatch,
+    ) -> None:
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+        topic, partition, *_ = batch_key
+
+        try:
+            batch_future = await pending.producer.send_batch(
+                pending.batch,
+                topic,
+                partition=partition,
+            )
+        except Exception as e:
+            for future, _ in pending.records:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        batch_future.add_done_callback(
+            lambda f: _resolve_records(f, pending.records),
+        )
+
+
+def _resolve_records(
+    batch_future: "asyncio.Future[RecordMetadata]",
+    records: list[tuple["asyncio.Future[RecordMetadata]", int]],
+) -> None:
+    if batch_future.cancelled():
+        for future, _ in records:
+            future.cancel()
+        return
+
+    if (exc := batch_future.exception()) is not None:
+        for future, _ in records:
+            if not future.done():
+                future.set_exception(exc)
+        return
+
+    batch_meta = batch_future.result()
+    for future, offset in records:
+        if not future.done():
+            future.set_result(
+                batch_meta._replace(offset=batch_meta.offset + offset),
+            )
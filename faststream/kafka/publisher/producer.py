@@ -12,6 +12,7 @@ from faststream.kafka.parser import AioKafkaParser
 from faststream.kafka.response import KafkaPublishCommand
 from faststream.message import encode_message
 
+from .linger import LingerAccumulator
 from .state import EmptyProducerState, ProducerState, RealProducer
 
 if TYPE_CHECKING:
@@ -69,6 +70,7 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
         decoder: Optional["CustomCallable"],
     ) -> None:
         self._producer: ProducerState = EmptyProducerState()
+        self._linger = LingerAccumulator()
         self.serializer: SerializerProto | None = None
 
         # NOTE: register default parser to be compatible with request
@@ -86,6 +88,7 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
         self._producer = RealProducer(producer)
 
     async def disconnect(self) -> None:
+        await self._linger.flush()
         await self._producer.stop()
         self._producer = EmptyProducerState()
 
@@ -97,6 +100,7 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
         return self._producer.closed
 
     async def flush(self) -> None:
+        await self._linger.flush()
         await self._producer.flush()
 
     @override
@@ -111,15 +115,25 @@ class AioKafkaFastProducerImpl(AioKafkaFastProducer):
             "content-type": content_type or "",
             **cmd.headers_to_publish(),
         }
+        headers = [(i, (j or "").encode()) for i, j in headers_to_send.items()]
 
-        send_future = await self._producer.producer.send(
-            topic=cmd.destination,
-            value=message,
-            key=cmd.key,
-            partition=cmd.partition,
-            timestamp_ms=cmd.timestamp_ms,
-            headers=[(i, (j or "").encode()) for i, j in headers_to_send.items()],
-        )
+        if cmd.linger_ms is not None:
+            send_future = await self._linger.add(
+                self._producer.producer,
+                cmd,
+                value=message,
+                headers=headers,
+            )
+
+        else:
+            send_future = await self._producer.producer.send(
+                topic=cmd.destination,
+                value=message,
+                key=cmd.key,
+                partition=cmd.partition,
+                timestamp_ms=cmd.timestamp_ms,
+                headers=headers,
+            )
 
         if not cmd.no_confirm:
             return await send_future
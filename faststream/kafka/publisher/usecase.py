@@ -135,6 +135,8 @@ class DefaultPublisher(LogicPublisher):
         super().__init__(config, specification)
 
         self.key = config.key
+        self.linger_ms = config.linger_ms
+        self.max_batch_bytes = config.max_batch_bytes
 
     @overload
     async def publish(
@@ -240,6 +242,8 @@ class DefaultPublisher(LogicPublisher):
             correlation_id=correlation_id or gen_cor_id(),
             timestamp_ms=timestamp_ms,
             no_confirm=no_confirm,
+            linger_ms=self.linger_ms,
+            max_batch_bytes=self.max_batch_bytes,
             _publish_type=PublishType.PUBLISH,
         )
         return await self._basic_publish(
@@ -265,6 +269,9 @@ class DefaultPublisher(LogicPublisher):
         cmd.partition = cmd.partition or self.partition
         cmd.key = cmd.key or self.key
 
+        cmd.linger_ms = self.linger_ms
+        cmd.max_batch_bytes = self.max_batch_bytes
+
         await self._basic_publish(
             cmd,
             producer=self._outer_config.producer,
@@ -58,6 +58,8 @@ class KafkaPublishCommand(BatchPublishCommand):
         reply_to: str = "",
         no_confirm: bool = False,
         timeout: float = 0.5,
+        linger_ms: float | None = None,
+        max_batch_bytes: int | None = None,
     ) -> None:
         super().__init__(
             message,
@@ -74,6 +76,10 @@ class KafkaPublishCommand(BatchPublishCommand):
         self.timestamp_ms = timestamp_ms
         self.no_confirm = no_confirm
 
+        # publisher-side batching options
+        self.linger_ms = linger_ms
+        self.max_batch_bytes = max_batch_bytes
+
         # request option
         self.timeout = timeout
 
@@ -1,6 +1,6 @@
 import warnings
 from collections.abc import Collection, Iterable
-from typing import TYPE_CHECKING, Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Literal, Optional, Union
 
 from faststream._internal.constants import EMPTY
 from faststream._internal.endpoint.subscriber.call_item import CallsCollection
@@ -13,6 +13,7 @@ from .usecase import (
     BatchSubscriber,
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
+    ConcurrentKeyedSubscriber,
     DefaultSubscriber,
 )
 
@@ -38,6 +39,7 @@ def create_subscriber(
     # Subscriber args
     ack_policy: "AckPolicy",
     max_workers: int,
+    ordering: Literal["key", "partition"] | None,
     no_ack: bool,
     no_reply: bool,
     config: "KafkaBrokerConfig",
@@ -50,6 +52,7 @@ def create_subscriber(
     "BatchSubscriber",
     "ConcurrentDefaultSubscriber",
     "ConcurrentBetweenPartitionsSubscriber",
+    "ConcurrentKeyedSubscriber",
 ]:
     _validate_input_for_misconfigure(
         *topics,
@@ -59,6 +62,7 @@ def create_subscriber(
         no_ack=no_ack,
         auto_commit=auto_commit,
         max_workers=max_workers,
+        ordering=ordering,
     )
 
     subscriber_config = KafkaSubscriberConfig(
@@ -100,6 +104,15 @@ def create_subscriber(
         )
 
     if max_workers > 1:
+        if ordering is not None:
+            return ConcurrentKeyedSubscriber(
+                subscriber_config,
+                specification,
+                calls,
+                max_workers=max_workers,
+                ordering=ordering,
+            )
+
         if subscriber_config.ack_first:
             return ConcurrentDefaultSubscriber(
                 subscriber_config,
@@ -125,6 +138,7 @@ def _validate_input_for_misconfigure(
     auto_commit: bool,
     no_ack: bool,
     max_workers: int,
+    ordering: Literal["key", "partition"] | None,
     pattern: str | None,
     partitions: Iterable["TopicPartition"],
 ) -> None:
@@ -157,7 +171,11 @@ def _validate_input_for_misconfigure(
     if ack_policy is EMPTY:
         ack_policy = AckPolicy.ACK_FIRST
 
-    if max_workers > 1 and ack_policy is not AckPolicy.ACK_FIRST:
+    if ordering is not None and ordering not in {"key", "partition"}:
+        msg = f"`ordering` should be one of `key` or `partition`, got `{ordering}`."
+        raise SetupError(msg)
+
+    if max_workers > 1 and ordering is None and ack_policy is not AckPolicy.ACK_FIRST:
         if len(topics) > 1:
             msg = "You must use a single topic with concurrent manual commit mode."
             raise SetupError(msg)
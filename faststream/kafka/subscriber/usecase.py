@@ -2,7 +2,7 @@ import logging
 from abc import abstractmethod
 from collections.abc import AsyncIterator, Callable, Sequence
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Literal, Optional, cast
 
 import anyio
 from aiokafka import ConsumerRecord, TopicPartition
@@ -14,13 +14,19 @@ from faststream._internal.endpoint.subscriber.usecase import SubscriberUsecase
 from faststream._internal.endpoint.utils import process_msg
 from faststream._internal.types import MsgType
 from faststream._internal.utils.path import compile_path
-from faststream.kafka.helpers import make_logging_listener
+from faststream.kafka.helpers import (
+    OffsetTracker,
+    TrackedConsumer,
+    TrackingRebalanceListener,
+    make_logging_listener,
+)
 from faststream.kafka.message import KafkaAckableMessage, KafkaMessage, KafkaRawMessage
 from faststream.kafka.parser import AioKafkaBatchParser, AioKafkaParser
 from faststream.kafka.publisher.fake import KafkaFakePublisher
 
 if TYPE_CHECKING:
     from aiokafka import AIOKafkaConsumer
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
 
     from faststream._internal.endpoint.publisher import PublisherProto
     from faststream._internal.endpoint.subscriber import SubscriberSpecification
@@ -455,3 +461,102 @@ class ConcurrentBetweenPartitionsSubscriber(DefaultSubscriber):
         message = await consumer.getone()
         message.consumer = consumer
         return cast("KafkaRawMessage", message)
+
+
+class ConcurrentKeyedSubscriber(DefaultSubscriber):
+    """Processes messages concurrently keeping their order per key or partition.
+
+    Messages are distributed between `max_workers` sequential lanes by
+    message key or partition. With manual commit mode offsets are
+    committed after message processing up to the lowest still processing
+    message of each partition.
+    """
+
+    def __init__(
+        self,
+        config: "KafkaSubscriberConfig",
+        specification: "SubscriberSpecification[Any, Any]",
+        calls: "CallsCollection[ConsumerRecord]",
+        *,
+        max_workers: int,
+        ordering: Literal["key", "partition"],
+    ) -> None:
+        super().__init__(config, specification, calls)
+
+        self.max_workers = max_workers
+        self.ordering = ordering
+
+        self._lanes: list[MemoryObjectSendStream[ConsumerRecord]] = []
+        self._offsets: OffsetTracker | None = (
+            None if config.ack_first else OffsetTracker()
+        )
+        self._tracked_consumer: TrackedConsumer | None = None
+
+        if self._offsets is not None:
+            # rebalanced partitions should not be committed by stale records
+            self._listener = TrackingRebalanceListener(self._offsets, self._listener)
+
+    async def start(self) -> None:
+        await super().start()
+
+        if self._offsets is not None:
+            assert self.consumer, "You should start subscriber at first."
+            self._tracked_consumer = TrackedConsumer(self.consumer, self._offsets)
+
+        for _ in range(self.max_workers):
+            send_stream: MemoryObjectSendStream[ConsumerRecord]
+            receive_stream: MemoryObjectReceiveStream[ConsumerRecord]
+            send_stream, receive_stream = anyio.create_memory_object_stream(
+                max_buffer_size=1,
+            )
+
+            self._lanes.append(send_stream)
+            self.add_task(self._serve_lane(receive_stream))
+
+    async def stop(self) -> None:
+        # stop consuming at first to not send messages to closed lanes
+        await super().stop()
+
+        for lane in self._lanes:
+            lane.close()
+        self._lanes.clear()
+
+        if self._offsets is not None:
+            self._offsets.reset()
+        self._tracked_consumer = None
+
+    async def consume_one(self, msg: "ConsumerRecord") -> None:
+        if self._offsets is not None:
+            self._offsets.add(msg)
+            # message acknowledgement should not commit the whole consumer position
+            msg.consumer = self._tracked_consumer
+
+        if self.ordering == "key" and msg.key is not None:
+            lane = hash(msg.key)
+        else:
+            lane = hash((msg.topic, msg.partition))
+
+        await self._lanes[lane % self.max_workers].send(msg)
+
+    async def _serve_lane(
+        self,
+        receive_stream: "MemoryObjectReceiveStream[ConsumerRecord]",
+    ) -> None:
+        async for msg in receive_stream:
+            if not self.running:
+                # buffered message was not processed, so its offset should not be committed
+                break
+
+            await self.consume(msg)
+
+            if self._offsets is not None and (offsets := self._offsets.complete(msg)):
+                await self._commit(offsets)
+
+    async def _commit(self, offsets: dict[TopicPartition, int]) -> None:
+        if self.consumer is None:
+            return
+
+        try:
+            await self.consumer.commit(offsets)
+        except KafkaError as e:
+            self._log(logging.ERROR, "Kafka offsets commit error", exc_info=e)
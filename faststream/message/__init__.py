@@ -1,12 +1,24 @@
 from .message import AckStatus, StreamMessage
 from .source_type import SourceType
-from .utils import decode_message, encode_message, gen_cor_id
+from .utils import (
+    decode_batch,
+    decode_message,
+    encode_message,
+    gen_cor_id,
+    get_decoder,
+    register_decoder,
+    set_id_factory,
+)
 
 __all__ = (
     "AckStatus",
     "SourceType",
     "StreamMessage",
+    "decode_batch",
     "decode_message",
     "encode_message",
     "gen_cor_id",
+    "get_decoder",
+    "register_decoder",
+    "set_id_factory",
 )
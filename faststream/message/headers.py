@@ -0,0 +1,10 @@
+from collections.abc import Iterable
+
+
+def decode_headers(headers: Iterable[tuple[str, bytes | str]]) -> dict[str, str]:
+    """Decode raw record headers to a plain `dict` of `str` values.
+
+    Values are decoded eagerly: parsers read message headers right away, and
+    the plain `dict` storage is safe to pass to C JSON encoders.
+    """
+    return {k: v if isinstance(v, str) else v.decode() for k, v in headers}
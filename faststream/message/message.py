@@ -6,9 +6,9 @@ from typing import (
     Optional,
     TypeVar,
 )
-from uuid import uuid4
 
 from .source_type import SourceType
+from .utils import gen_cor_id
 
 if TYPE_CHECKING:
     from faststream._internal.types import AsyncCallable
@@ -49,8 +49,9 @@ class StreamMessage(Generic[MsgType]):
         self.headers = headers or {}
         self.batch_headers = batch_headers or []
         self.path = path or {}
-        self.correlation_id = correlation_id or str(uuid4())
-        self.message_id = message_id or self.correlation_id
+        # IDs are generated on the first access only
+        self._correlation_id = correlation_id
+        self._message_id = message_id
 
         self.committed: AckStatus | None = None
         self.processed = False
@@ -62,6 +63,24 @@ class StreamMessage(Generic[MsgType]):
             Any,
         ] = {}  # Cache values between filters and tests
 
+    @property
+    def correlation_id(self) -> str:
+        if not self._correlation_id:
+            self._correlation_id = gen_cor_id()
+        return self._correlation_id
+
+    @correlation_id.setter
+    def correlation_id(self, value: str) -> None:
+        self._correlation_id = value
+
+    @property
+    def message_id(self) -> str:
+        return self._message_id or self.correlation_id
+
+    @message_id.setter
+    def message_id(self, value: str) -> None:
+        self._message_id = value
+
     def set_decoder(self, decoder: "AsyncCallable") -> None:
         self.__decoder = decoder
 
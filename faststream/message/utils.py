@@ -1,11 +1,14 @@
 import json
-from collections.abc import Sequence
+import os
+import threading
+from collections.abc import Callable, Sequence
 from contextlib import suppress
+from itertools import starmap
 from typing import TYPE_CHECKING, Any, Optional, Union, cast
-from uuid import uuid4
 
-from faststream._internal._compat import json_dumps, json_loads
+from faststream._internal._compat import json_dumps, json_loads, orjson
 from faststream._internal.constants import ContentTypes
+from faststream._internal.utils.nuid import NUID
 
 if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
@@ -15,30 +18,188 @@ if TYPE_CHECKING:
     from .message import StreamMessage
 
 
+_decode_json_lines: Callable[[bytes], list[Any]] | None
+
+try:
+    from msgspec.json import Decoder as _JSONDecoder
+except ImportError:
+    _decode_json_lines = None
+else:
+    _decode_json_lines = _JSONDecoder().decode_lines
+
+
+class _ThreadNUID(threading.local):
+    """NUID is not thread-safe, so each thread uses its own one."""
+
+    def __init__(self) -> None:
+        self.nuid = NUID()
+
+
+_local = _ThreadNUID()
+
+
+def _reset_after_fork() -> None:
+    # forked processes should not repeat parent IDs
+    global _local  # noqa: PLW0603
+    _local = _ThreadNUID()
+
+
+if hasattr(os, "register_at_fork"):  # pragma: no branch
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _next_nuid() -> str:
+    return _local.nuid.next_str()
+
+
+_id_factory: Callable[[], str] = _next_nuid
+
+
 def gen_cor_id() -> str:
-    """Generate random string to use as ID."""
-    return str(uuid4())
+    """Generate unique string to use as ID."""
+    return _id_factory()
+
+
+def set_id_factory(factory: Callable[[], str] | None) -> None:
+    """Replace messages ID generator.
+
+    Pass `None` to restore the default NUID-based generator.
+    """
+    global _id_factory  # noqa: PLW0603
+    _id_factory = factory or _next_nuid
 
 
 def decode_message(message: "StreamMessage[Any]") -> "DecodedMessage":
     """Decodes a message."""
     body: Any = getattr(message, "body", message)
-    m: DecodedMessage = body
+    return _decode_body(body, getattr(message, "content_type", None))
+
+
+def decode_batch(
+    bodies: Sequence[Any],
+    content_types: Sequence[str | None],
+) -> list["DecodedMessage"]:
+    """Decodes a batch of message bodies.
+
+    With `msgspec` installed, a batch of single-line JSON bodies is decoded
+    by a single call as newline-delimited JSON, which requires each body
+    to be a complete JSON value.
+    """
+    if (
+        _decode_json_lines is not None
+        and bodies
+        and all(c == ContentTypes.JSON.value for c in content_types)
+        and all(isinstance(b, bytes) and b and b"\n" not in b for b in bodies)
+    ):
+        with suppress(ValueError):
+            decoded = _decode_json_lines(b"\n".join(bodies))
+            # whitespace-only bodies are skipped as empty lines
+            if len(decoded) == len(bodies):
+                return cast("list[DecodedMessage]", decoded)
+
+    # mixed batch or some body is not a valid JSON
+    return list(starmap(_decode_body, zip(bodies, content_types, strict=True)))
+
+
+BodyDecoder = Callable[[Any], "DecodedMessage"]
+
 
-    if content_type := getattr(message, "content_type", False):
-        content_type = ContentTypes(cast("str", content_type))
+def _decode_raw(body: Any) -> "DecodedMessage":
+    # handlers expect raw payload as bytes
+    return bytes(body) if isinstance(body, memoryview) else body
 
-        if content_type is ContentTypes.TEXT:
-            m = body.decode()
 
-        elif content_type is ContentTypes.JSON:
-            m = json_loads(body)
+def _decode_text(body: Any) -> "DecodedMessage":
+    return str(body, "utf-8")
 
-    else:
+
+def _decode_json(body: Any) -> "DecodedMessage":
+    if isinstance(body, memoryview) and not orjson:
+        body = bytes(body)
+    return cast("DecodedMessage", json_loads(body))
+
+
+def _decode_msgpack(body: Any) -> "DecodedMessage":
+    try:
+        from msgspec.msgpack import decode
+    except ImportError:  # pragma: no cover
+        from msgpack import unpackb as decode  # type: ignore[no-redef]
+
+    return cast("DecodedMessage", decode(body))
+
+
+_DECODERS: dict[str, BodyDecoder] = {
+    ContentTypes.JSON.value: _decode_json,
+    ContentTypes.TEXT.value: _decode_text,
+    "application/octet-stream": _decode_raw,
+    "application/msgpack": _decode_msgpack,
+    "application/x-msgpack": _decode_msgpack,
+    # protobuf message can't be decoded without its schema
+    "application/protobuf": _decode_raw,
+    "application/x-protobuf": _decode_raw,
+}
+
+
+def register_decoder(content_type: str, decoder: BodyDecoder) -> None:
+    """Use the decoder for all messages with the content type.
+
+    Decoder takes message body as `bytes` or `memoryview` object.
+    """
+    _DECODERS[content_type] = decoder
+
+
+def get_decoder(content_type: str) -> BodyDecoder:
+    """Find decoder for the content type. Unknown content types are not decoded."""
+    if decoder := _DECODERS.get(content_type):
+        return decoder
+
+    # content type with parameters, e.g. `application/json; charset=utf-8`
+    media_type = content_type.partition(";")[0].strip().lower()
+    return _DECODERS.get(media_type, _decode_raw)
+
+
+# bytes JSON document without leading spaces can start with
+_JSON_START = frozenset(b'{["-0123456789 \t\r\n')
+_JSON_LITERALS = frozenset((b"true", b"false", b"null"))
+
+
+def _is_json_like(body: bytes | bytearray | memoryview) -> bool:
+    """Cheap check to not try to parse obviously not JSON payloads."""
+    if not body:
+        return False
+
+    if body[0] in _JSON_START:
+        return True
+
+    return len(body) <= 5 and bytes(body) in _JSON_LITERALS
+
+
+def is_json_body(body: Any, content_type: str | None) -> bool:
+    """Check the body is decoded as JSON by the default decoder."""
+    if not isinstance(body, (bytes, bytearray, memoryview)):
+        return False
+
+    if content_type:
+        return get_decoder(content_type) is _decode_json
+
+    return _is_json_like(body)
+
+
+def _decode_body(body: Any, content_type: str | None) -> "DecodedMessage":
+    if content_type:
+        return get_decoder(content_type)(body)
+
+    if isinstance(body, (bytes, bytearray, memoryview)):
         # content-type not set
-        with suppress(json.JSONDecodeError, UnicodeDecodeError):
-            m = json_loads(body)
+        if _is_json_like(body):
+            with suppress(json.JSONDecodeError, UnicodeDecodeError):
+                return _decode_json(body)
+
+        return _decode_raw(body)
 
+    m: DecodedMessage = body
+    with suppress(json.JSONDecodeError, UnicodeDecodeError):
+        m = json_loads(body)
     return m
 
 
@@ -45,6 +45,8 @@ class _LoggingMiddleware(BaseMiddleware):
         super().__init__(msg, context=context)
         self.logger = logger
         self.source_type = SourceType.CONSUME
+        # whether per-message records are sampled, decided once per message
+        self.sampled: bool | None = None
 
     async def consume_scope(
         self,
@@ -54,10 +56,13 @@ class _LoggingMiddleware(BaseMiddleware):
         source_type = self.source_type = msg.source_type
 
         if source_type is not SourceType.RESPONSE:
-            self.logger.log(
-                "Received",
-                extra=self.context.get_local("log_context", {}),
-            )
+            self.sampled = self.logger.sample_message()
+
+            if self.sampled:
+                self.logger.log_message(
+                    "Received",
+                    extra=self.context.get_local("log_context", {}),
+                )
 
         return await call_next(msg)
 
@@ -72,21 +77,26 @@ class _LoggingMiddleware(BaseMiddleware):
             c = self.context.get_local("log_context", {})
 
             if exc_type:
+                # errors are logged regardless of sampling
                 # TODO: move critical logging to `subscriber.consume()` method
                 if issubclass(exc_type, IgnoredException):
-                    self.logger.log(
+                    self.logger.log_message(
                         message=str(exc_val),
                         extra=c,
                     )
 
                 else:
-                    self.logger.log(
+                    self.logger.log_message(
                         message=f"{exc_type.__name__}: {exc_val}",
                         exc_info=exc_val,
                         extra=c,
                     )
 
-            self.logger.log(message="Processed", extra=c)
+            if self.sampled is None:
+                self.sampled = self.logger.sample_message()
+
+            if self.sampled:
+                self.logger.log_message(message="Processed", extra=c)
 
         await super().__aexit__(exc_type, exc_val, exc_tb)
 
@@ -411,12 +411,37 @@ class NatsBroker(
             int,
             Doc("Service messages log level."),
         ] = logging.INFO,
+        log_sample_ratio: Annotated[
+            float,
+            Doc(
+                "Fraction of messages to write `Received` and `Processed` records for. Errors are always logged."
+            ),
+        ] = 1.0,
+        log_rate_limit: Annotated[
+            int | None,
+            Doc(
+                "Maximum number of messages per second to write `Received` and `Processed` records for."
+            ),
+        ] = None,
+        log_in_background: Annotated[
+            bool,
+            Doc(
+                "Whether to write per-message records from a background thread instead of the event loop."
+            ),
+        ] = False,
         # FastDepends args
         apply_types: Annotated[
             bool,
             Doc("Whether to use FastDepends or not."),
         ] = True,
         serializer: Optional["SerializerProto"] = EMPTY,
+        decode_to_model: Annotated[
+            bool,
+            Doc(
+                "Whether to decode JSON messages right into the handler's pydantic model "
+                "or msgspec Struct argument, skipping the intermediate `dict`."
+            ),
+        ] = False,
     ) -> None:
         """Initialize the NatsBroker object."""
         secure_kwargs = parse_security(security)
@@ -487,10 +512,14 @@ class NatsBroker(
                 logger=make_nats_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    sample_ratio=log_sample_ratio,
+                    rate_limit=log_rate_limit,
+                    in_background=log_in_background,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
                     serializer=serializer,
+                    decode_to_model=decode_to_model,
                 ),
                 # subscriber args
                 broker_dependencies=dependencies,
@@ -522,12 +551,13 @@ class NatsBroker(
     ) -> None:
         await super().stop(exc_type, exc_val, exc_tb)
 
+        # requests inbox should be unsubscribed before the connection drain
+        await self.config.disconnect()
+
         if self._connection is not None:
             await self._connection.drain()
             self._connection = None
 
-        self.config.disconnect()
-
     @deprecated(
         "Deprecated in **FastStream 0.5.44**. "
         "Please, use `stop` method instead. "
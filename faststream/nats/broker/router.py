@@ -373,6 +373,13 @@ class NatsRouter(
             bool | None,
             Doc("Whetever to include operation in AsyncAPI schema or not."),
         ] = None,
+        shared_subscription: Annotated[
+            bool,
+            Doc(
+                "Serve router core subscribers by one wildcard subscription per subjects prefix "
+                "and route messages to them locally instead of a NATS subscription per subscriber.",
+            ),
+        ] = False,
     ) -> None:
         super().__init__(
             handlers=handlers,
@@ -383,6 +390,7 @@ class NatsRouter(
                 broker_decoder=decoder,
                 include_in_schema=include_in_schema,
                 prefix=prefix,
+                shared_subscription=shared_subscription,
             ),
             routers=routers,
         )
@@ -3,7 +3,11 @@ from typing import TYPE_CHECKING
 
 from faststream._internal.configs import BrokerConfig
 from faststream.nats.broker.state import BrokerState
-from faststream.nats.helpers import KVBucketDeclarer, OSBucketDeclarer
+from faststream.nats.helpers import (
+    KVBucketDeclarer,
+    OSBucketDeclarer,
+    SubjectDispatcher,
+)
 from faststream.nats.publisher.producer import FakeNatsFastProducer
 
 if TYPE_CHECKING:
@@ -19,6 +23,10 @@ class NatsBrokerConfig(BrokerConfig):
     connection_state: BrokerState = field(default_factory=BrokerState)
     kv_declarer: KVBucketDeclarer = field(default_factory=KVBucketDeclarer)
     os_declarer: OSBucketDeclarer = field(default_factory=OSBucketDeclarer)
+    subject_dispatcher: SubjectDispatcher = field(default_factory=SubjectDispatcher)
+
+    # router options
+    shared_subscription: bool = False
 
     def connect(self, connection: "Client") -> None:
         stream = connection.jetstream()
@@ -31,9 +39,9 @@ class NatsBrokerConfig(BrokerConfig):
 
         self.connection_state.connect(connection, stream)
 
-    def disconnect(self) -> None:
-        self.producer.disconnect()
-        self.js_producer.disconnect()
+    async def disconnect(self) -> None:
+        await self.producer.disconnect()
+        await self.js_producer.disconnect()
         self.kv_declarer.disconnect()
         self.os_declarer.disconnect()
 
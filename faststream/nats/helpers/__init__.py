@@ -1,9 +1,14 @@
 from faststream.nats.helpers.bucket_declarer import KVBucketDeclarer
 from faststream.nats.helpers.obj_storage_declarer import OSBucketDeclarer
+from faststream.nats.helpers.pull_credits import PullCredits
 from faststream.nats.helpers.stream_builder import StreamBuilder
+from faststream.nats.helpers.subject_dispatcher import SubjectDispatcher, SubjectTrie
 
 __all__ = (
     "KVBucketDeclarer",
     "OSBucketDeclarer",
+    "PullCredits",
     "StreamBuilder",
+    "SubjectDispatcher",
+    "SubjectTrie",
 )
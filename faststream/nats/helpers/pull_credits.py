@@ -0,0 +1,66 @@
+import anyio
+
+# NATS server default consumer `ack_wait`
+DEFAULT_ACK_WAIT = 30.0
+
+
+class PullCredits:
+    """Credit-based flow control for pipelined pull consuming.
+
+    Every fetched message takes a credit until it is processed. Credits limit
+    grows by one while handlers finish in time and is halved once the smoothed
+    handler latency reaches a half of consumer `ack_wait`, so messages are
+    processed before the server redelivers them.
+    """
+
+    __slots__ = (
+        "_ack_wait",
+        "_changed",
+        "_cooldown",
+        "in_flight",
+        "latency",
+        "limit",
+        "max_in_flight",
+    )
+
+    def __init__(self, max_in_flight: int, ack_wait: float | None = None) -> None:
+        self.max_in_flight = max_in_flight
+        self.limit = max_in_flight
+        self.in_flight = 0
+        self.latency: float | None = None
+
+        self._ack_wait = ack_wait or DEFAULT_ACK_WAIT
+        self._cooldown = 0
+        self._changed = anyio.Event()
+
+    async def wait_free(self) -> int:
+        """Wait for free credits and return their number."""
+        while self.in_flight >= self.limit:
+            await self._changed.wait()
+        return self.limit - self.in_flight
+
+    def take(self, count: int) -> None:
+        self.in_flight += count
+
+    def release(self, latency: float) -> None:
+        """Return message credit and adapt limit to its processing latency."""
+        self.in_flight -= 1
+
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = 0.8 * self.latency + 0.2 * latency
+
+        if self._cooldown > 0:
+            # let messages fetched with the previous limit drain
+            self._cooldown -= 1
+
+        elif self.latency >= self._ack_wait / 2:
+            self.limit = max(1, self.limit // 2)
+            self._cooldown = self.in_flight
+
+        elif self.limit < self.max_in_flight:
+            self.limit += 1
+
+        self._changed.set()
+        self._changed = anyio.Event()
@@ -0,0 +1,290 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterator
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import anyio
+
+from faststream._internal.configs import ConfigComposition
+
+if TYPE_CHECKING:
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+    from nats.aio.client import Client
+    from nats.aio.msg import Msg
+    from nats.aio.subscription import Subscription
+
+    from faststream._internal.configs import BrokerConfig
+    from faststream._internal.logger import LoggerState
+
+
+T = TypeVar("T")
+
+
+class _TrieNode(Generic[T]):
+    __slots__ = ("children", "tail", "values")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode[T]] = {}
+        # values subscribed exactly to the node subject
+        self.values: list[T] = []
+        # values subscribed to the node subject with trailing `>`
+        self.tail: list[T] = []
+
+
+class SubjectTrie(Generic[T]):
+    """NATS subjects tokens tree to match a subject with many subscriptions at once.
+
+    Supports `*` and `>` wildcards, so a subject is matched by a single walk
+    over its tokens instead of checking every subscription one by one.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self) -> None:
+        self._root: _TrieNode[T] = _TrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, subject: str, value: T) -> None:
+        *tokens, last = subject.split(".")
+
+        node = self._root
+        for token in tokens:
+            node = node.children.setdefault(token, _TrieNode())
+
+        if last == ">":
+            node.tail.append(value)
+        else:
+            node.children.setdefault(last, _TrieNode()).values.append(value)
+
+        self._size += 1
+
+    def remove(self, subject: str, value: T) -> None:
+        *tokens, last = subject.split(".")
+
+        path: list[tuple[_TrieNode[T], str]] = []
+        node = self._root
+        for token in tokens:
+            path.append((node, token))
+            node = node.children[token]
+
+        if last == ">":
+            node.tail.remove(value)
+        else:
+            path.append((node, last))
+            node = node.children[last]
+            node.values.remove(value)
+
+        self._size -= 1
+
+        # drop empty branches
+        for parent, token in reversed(path):
+            child = parent.children[token]
+            if child.children or child.values or child.tail:
+                break
+            del parent.children[token]
+
+    def match(self, subject: str) -> list[T]:
+        """Get all values subscribed to the subject."""
+        matched: list[T] = []
+
+        nodes = [self._root]
+        for token in subject.split("."):
+            next_nodes: list[_TrieNode[T]] = []
+
+            for node in nodes:
+                # `>` matches one or more tokens, so the rest of subject
+                matched.extend(node.tail)
+
+                if (child := node.children.get(token)) is not None:
+                    next_nodes.append(child)
+
+                if (child := node.children.get("*")) is not None:
+                    next_nodes.append(child)
+
+            if not (nodes := next_nodes):
+                return matched
+
+        for node in nodes:
+            matched.extend(node.values)
+
+        return matched
+
+
+class _SharedSubscription:
+    __slots__ = ("subscription", "trie")
+
+    def __init__(self) -> None:
+        self.trie: SubjectTrie[_DispatchedSubscription] = SubjectTrie()
+        self.subscription: Subscription | None = None
+
+    async def dispatch(self, msg: "Msg") -> None:
+        for target in self.trie.match(msg.subject):
+            target.put(msg)
+
+
+class _DispatchedSubscription:
+    """Subscriber part of a shared subscription.
+
+    Has its own buffer and consuming task, so a slow subscriber doesn't block
+    others served by the same shared subscription.
+    """
+
+    __slots__ = ("_dispatcher", "_key", "_logger", "_send", "_task", "subject")
+
+    def __init__(
+        self,
+        dispatcher: "SubjectDispatcher",
+        key: tuple[str, str],
+        subject: str,
+        *,
+        cb: Callable[["Msg"], Awaitable[Any]],
+        pending_msgs_limit: int,
+        logger: "LoggerState",
+    ) -> None:
+        self._dispatcher = dispatcher
+        self._key = key
+        self._logger = logger
+        self.subject = subject
+
+        send_stream, receive_stream = anyio.create_memory_object_stream["Msg"](
+            max_buffer_size=pending_msgs_limit,
+        )
+        self._send: MemoryObjectSendStream[Msg] = send_stream
+        self._task = asyncio.create_task(self._consume(receive_stream, cb))
+
+    def put(self, msg: "Msg") -> None:
+        try:
+            self._send.send_nowait(msg)
+        except anyio.WouldBlock:
+            # the same way as NATS client drops messages of a slow consumer
+            self._logger.log(
+                f"Slow consumer: `{self.subject}` pending messages limit is reached, message dropped",
+                log_level=logging.WARNING,
+            )
+
+    async def unsubscribe(self) -> None:
+        self._send.close()
+        # stop can be called by the subscriber itself, so buffered messages
+        # are just skipped by the stopped subscriber then
+        if asyncio.current_task() is not self._task:
+            self._task.cancel()
+        await self._dispatcher._remove(self._key, self)
+
+    @staticmethod
+    async def _consume(
+        receive_stream: "MemoryObjectReceiveStream[Msg]",
+        cb: Callable[["Msg"], Awaitable[Any]],
+    ) -> None:
+        async with receive_stream:
+            async for msg in receive_stream:
+                await cb(msg)
+
+
+class SubjectDispatcher:
+    """Serves core subscribers by one wildcard subscription per subjects prefix.
+
+    Messages are routed to the subscribers locally by a `SubjectTrie`,
+    so thousands of subjects don't require thousands of server subscriptions.
+    """
+
+    __slots__ = ("_lock", "_subscriptions")
+
+    def __init__(self) -> None:
+        # (wildcard subject, queue) -> shared subscription
+        self._subscriptions: dict[tuple[str, str], _SharedSubscription] = {}
+        self._lock = anyio.Lock()
+
+    async def subscribe(
+        self,
+        connection: "Client",
+        subject: str,
+        *,
+        wildcard: str,
+        queue: str,
+        cb: Callable[["Msg"], Awaitable[Any]],
+        pending_msgs_limit: int,
+        logger: "LoggerState",
+    ) -> _DispatchedSubscription:
+        key = (wildcard, queue)
+
+        async with self._lock:
+            if (shared := self._subscriptions.get(key)) is None:
+                shared = _SharedSubscription()
+                shared.subscription = await connection.subscribe(
+                    subject=wildcard,
+                    queue=queue,
+                    cb=shared.dispatch,
+                )
+                self._subscriptions[key] = shared
+
+            target = _DispatchedSubscription(
+                self,
+                key,
+                subject,
+                cb=cb,
+                pending_msgs_limit=pending_msgs_limit,
+                logger=logger,
+            )
+            shared.trie.add(subject, target)
+
+        return target
+
+    async def _remove(
+        self,
+        key: tuple[str, str],
+        target: _DispatchedSubscription,
+    ) -> None:
+        async with self._lock:
+            shared = self._subscriptions[key]
+            shared.trie.remove(target.subject, target)
+
+            if not shared.trie:
+                del self._subscriptions[key]
+                if shared.subscription is not None:
+                    await shared.subscription.unsubscribe()
+
+
+def get_shared_wildcard(subject: str, config: "BrokerConfig") -> str | None:
+    """Get a shared wildcard subscription subject for the subscriber subject.
+
+    Returns `None` if the subscriber is not in a `shared_subscription` router
+    or its subject can't be served by a wildcard subscription.
+    """
+    prefix: str | None = None
+
+    current_prefix = ""
+    for c in _iter_configs(config):
+        current_prefix += c.prefix
+        if getattr(c, "shared_subscription", False):
+            prefix = current_prefix
+            break
+
+    if prefix is None:
+        return None
+
+    *tokens, _ = subject.split(".")
+
+    # prefix complete tokens, `a.b.` and `a.b.c` both have `a` and `b`
+    root: list[str] = []
+    for token, prefix_token in zip(tokens, prefix.split(".")[:-1], strict=False):
+        if token != prefix_token or token in {"*", ">"}:
+            break
+        root.append(token)
+
+    if not root:
+        if not tokens or tokens[0] in {"*", ">"}:
+            return None
+        root.append(tokens[0])
+
+    return ".".join((*root, ">"))
+
+
+def _iter_configs(config: Any) -> Iterator["BrokerConfig"]:
+    if isinstance(config, ConfigComposition):
+        for c in config.configs:
+            yield from _iter_configs(c)
+    else:
+        yield config
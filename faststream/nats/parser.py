@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, Any
 
+from faststream._internal.utils.path import PARAM_REGEX
 from faststream.message import (
     StreamMessage,
     decode_message,
@@ -30,6 +31,7 @@ class NatsBaseParser:
     ) -> None:
         path_re, _ = compile_nats_wildcard(pattern)
         self.__path_re = path_re
+        self.__path_tokens = _compile_path_tokens(pattern) if path_re else None
 
     def get_path(
         self,
@@ -37,7 +39,14 @@ class NatsBaseParser:
     ) -> dict[str, Any] | None:
         path: dict[str, Any] | None = None
 
-        if (path_re := self.__path_re) is not None and (
+        if (path_tokens := self.__path_tokens) is not None:
+            # a prefix can only add tokens in front of the pattern ones
+            tokens = subject.split(".")
+            tokens_count, params = path_tokens
+            if len(tokens) >= tokens_count:
+                path = {name: tokens[idx] for idx, name in params}
+
+        elif (path_re := self.__path_re) is not None and (
             match := path_re.match(subject)
         ) is not None:
             path = match.groupdict()
@@ -175,3 +184,25 @@ class ObjParser(NatsBaseParser):
             raw_message=msg,
             body=msg.name,
         )
+
+
+def _compile_path_tokens(
+    pattern: str,
+) -> tuple[int, tuple[tuple[int, str], ...]] | None:
+    """Get `{param}` tokens positions from the pattern end.
+
+    Allows to get the path by a subject tokens index instead of the regex.
+    Returns `None` for patterns with `>` or params as a part of a token.
+    """
+    tokens = pattern.split(".")
+    if ">" in tokens:
+        return None
+
+    params: list[tuple[int, str]] = []
+    for idx, token in enumerate(tokens, start=-len(tokens)):
+        if match := PARAM_REGEX.fullmatch(token):
+            params.append((idx, match.group(1)))
+        elif "{" in token:
+            return None
+
+    return len(tokens), tuple(params)
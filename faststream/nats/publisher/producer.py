@@ -1,5 +1,6 @@
 import asyncio
 from abc import abstractmethod
+from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Optional
 
 import anyio
@@ -8,7 +9,8 @@ from typing_extensions import override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException
+from faststream._internal.utils.nuid import NUID
+from faststream.exceptions import FeatureNotSupportedException, IncorrectState
 from faststream.message import encode_message
 from faststream.nats.helpers.state import (
     ConnectedState,
@@ -22,6 +24,7 @@ if TYPE_CHECKING:
     from fast_depends.library.serializer import SerializerProto
     from nats.aio.client import Client
     from nats.aio.msg import Msg
+    from nats.aio.subscription import Subscription
     from nats.js import JetStreamContext
 
     from faststream._internal.types import (
@@ -38,7 +41,7 @@ class NatsFastProducer(ProducerProto[NatsPublishCommand]):
         serializer: Optional["SerializerProto"],
     ) -> None: ...
 
-    def disconnect(self) -> None: ...
+    async def disconnect(self) -> None: ...
 
     @abstractmethod
     async def publish(self, cmd: "NatsPublishCommand") -> Optional["PubAck"]: ...
@@ -78,7 +81,7 @@ class NatsFastProducerImpl(NatsFastProducer):
         self.serializer = serializer
         self.__state = ConnectedState(connection)
 
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
         self.__state = EmptyConnectionState()
 
     @override
@@ -133,6 +136,7 @@ class NatsJSFastProducer(NatsFastProducer):
         self._decoder = ParserComposition(decoder, default.decode_message)
 
         self.__state: ConnectionState[JetStreamContext] = EmptyConnectionState()
+        self.__inbox: _RequestInbox | None = None
 
     def connect(
         self,
@@ -141,10 +145,15 @@ class NatsJSFastProducer(NatsFastProducer):
     ) -> None:
         self.serializer = serializer
         self.__state = ConnectedState(connection)
+        self.__inbox = _RequestInbox()
 
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
         self.__state = EmptyConnectionState()
 
+        if self.__inbox is not None:
+            await self.__inbox.close()
+            self.__inbox = None
+
     @override
     async def publish(self, cmd: "NatsPublishCommand") -> "PubAck":
         payload, content_type = encode_message(cmd.body, self.serializer)
@@ -166,14 +175,11 @@ class NatsJSFastProducer(NatsFastProducer):
     async def request(self, cmd: "NatsPublishCommand") -> "Msg":
         payload, content_type = encode_message(cmd.body, self.serializer)
 
-        reply_to = self.__state.connection._nc.new_inbox()
-        future: asyncio.Future[Msg] = asyncio.Future()
-        sub = await self.__state.connection._nc.subscribe(
-            reply_to,
-            future=future,
-            max_msgs=1,
-        )
-        await sub.unsubscribe(limit=1)
+        if (inbox := self.__inbox) is None:
+            msg = "You should connect broker first."
+            raise IncorrectState(msg)
+
+        reply_to, future = await inbox.new_response(self.__state.connection._nc)
 
         headers_to_send = {
             "content-type": content_type or "",
@@ -181,34 +187,91 @@ class NatsJSFastProducer(NatsFastProducer):
             **cmd.headers_to_publish(js=False),
         }
 
-        with anyio.fail_after(cmd.timeout):
-            await self.__state.connection.publish(
-                subject=cmd.destination,
-                payload=payload,
-                headers=headers_to_send,
-                stream=cmd.stream,
-                timeout=cmd.timeout,
+        try:
+            with anyio.fail_after(cmd.timeout):
+                await self.__state.connection.publish(
+                    subject=cmd.destination,
+                    payload=payload,
+                    headers=headers_to_send,
+                    stream=cmd.stream,
+                    timeout=cmd.timeout,
+                )
+
+                response = await future
+
+        finally:
+            # release the inbox token on publish errors as well
+            future.cancel()
+
+        if (  # pragma: no cover
+            response.headers
+            and (
+                response.headers.get(nats.js.api.Header.STATUS)
+                == nats.aio.client.NO_RESPONDERS_STATUS
             )
+        ):
+            raise nats.errors.NoRespondersError
 
-            msg = await future
+        return response
 
-            if (  # pragma: no cover
-                msg.headers
-                and (
-                    msg.headers.get(nats.js.api.Header.STATUS)
-                    == nats.aio.client.NO_RESPONDERS_STATUS
-                )
-            ):
-                raise nats.errors.NoRespondersError
 
-            return msg
+class _RequestInbox:
+    """Wildcard inbox subscription shared by all JetStream requests.
+
+    Subscribes once per connection and routes responses by the reply
+    subject token, the same way `nats.Client.request` does for core NATS.
+    """
+
+    __slots__ = ("_lock", "_nuid", "_prefix", "_responses", "_subscription")
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._nuid = NUID()
+        self._prefix = ""
+        self._subscription: Subscription | None = None
+        self._responses: dict[str, asyncio.Future[Msg]] = {}
+
+    async def new_response(self, nc: "Client") -> tuple[str, "asyncio.Future[Msg]"]:
+        if self._subscription is None:
+            async with self._lock:
+                if self._subscription is None:
+                    self._prefix = f"{nc.new_inbox()}."
+                    self._subscription = await nc.subscribe(
+                        f"{self._prefix}*",
+                        cb=self._on_response,
+                    )
+
+        token = self._nuid.next().decode()
+
+        future: asyncio.Future[Msg] = asyncio.get_running_loop().create_future()
+        future.add_done_callback(lambda _: self._responses.pop(token, None))
+        self._responses[token] = future
+
+        return f"{self._prefix}{token}", future
+
+    async def _on_response(self, msg: "Msg") -> None:
+        token = msg.subject[len(self._prefix) :]
+
+        # late responses for timed out requests are dropped
+        if (future := self._responses.pop(token, None)) and not future.done():
+            future.set_result(msg)
+
+    async def close(self) -> None:
+        for future in tuple(self._responses.values()):
+            future.cancel()
+        self._responses.clear()
+
+        if (subscription := self._subscription) is not None:
+            self._subscription = None
+            with suppress(nats.errors.Error):
+                await subscription.unsubscribe()
 
 
 class FakeNatsFastProducer(NatsFastProducer):
     def connect(self, connection: Any, serializer: Optional["SerializerProto"]) -> None:
         raise NotImplementedError
 
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
         raise NotImplementedError
 
     @override
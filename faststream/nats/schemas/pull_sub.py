@@ -9,11 +9,15 @@ class PullSub:
         timeout (:obj:`float`, optional): Wait this time for required batch size will be accumulated in stream
             in seconds (default is `5.0`).
         batch (bool): Whether to propagate consuming batch as iterable object to your handler (default is `False`).
+        max_in_flight (:obj:`int`, optional): Keep up to this number of messages in processing and fetch new ones
+            as soon as previous are processed instead of waiting for the whole batch. The limit is lowered automatically
+            if handlers latency approaches consumer `ack_wait`. `batch_size` is not used in this mode (default is `None`).
     """
 
     __slots__ = (
         "batch",
         "batch_size",
+        "max_in_flight",
         "timeout",
     )
 
@@ -22,10 +26,12 @@ class PullSub:
         batch_size: int = 1,
         timeout: float | None = 5.0,
         batch: bool = False,
+        max_in_flight: int | None = None,
     ) -> None:
         self.batch_size = batch_size
         self.batch = batch
         self.timeout = timeout
+        self.max_in_flight = max_in_flight
 
     @overload
     @classmethod
@@ -353,6 +353,15 @@ def _validate_input_for_misconfigure(  # noqa: PLR0915
         msg = "JetStream Pull Subscriber can only be used with the `stream` option."
         raise SetupError(msg)
 
+    if pull_sub and pull_sub.max_in_flight:
+        if pull_sub.batch:
+            msg = "You can't use `max_in_flight` option with batch Pull Subscriber."
+            raise SetupError(msg)
+
+        if max_workers > 1:
+            msg = "You can't use both the `max_in_flight` and `max_workers` options simultaneously. `max_in_flight` already controls messages processing concurrency."
+            raise SetupError(msg)
+
     if not subject and not config:
         msg = "You must provide either the `subject` or `config` option."
         raise SetupError(msg)
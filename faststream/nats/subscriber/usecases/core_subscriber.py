@@ -1,4 +1,4 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import TYPE_CHECKING, Annotated, Any, Optional
 
 from nats.errors import TimeoutError
@@ -7,6 +7,7 @@ from typing_extensions import Doc, override
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin
 from faststream._internal.endpoint.utils import process_msg
 from faststream.middlewares import AckPolicy
+from faststream.nats.helpers.subject_dispatcher import get_shared_wildcard
 from faststream.nats.parser import NatsParser
 
 from .basic import DefaultSubscriber
@@ -19,11 +20,12 @@ if TYPE_CHECKING:
     from faststream._internal.endpoint.subscriber.call_item import CallsCollection
     from faststream.message import StreamMessage
     from faststream.nats.message import NatsMessage
+    from faststream.nats.subscriber.adapters import Unsubscriptable
     from faststream.nats.subscriber.config import NatsSubscriberConfig
 
 
 class CoreSubscriber(DefaultSubscriber["Msg"]):
-    subscription: Optional["Subscription"]
+    subscription: Optional["Unsubscriptable"]
     _fetch_sub: Optional["Subscription"]
 
     def __init__(
@@ -113,10 +115,31 @@ class CoreSubscriber(DefaultSubscriber["Msg"]):
         if self.subscription:
             return
 
-        self.subscription = await self.connection.subscribe(
-            subject=self.clear_subject,
+        self.subscription = await self._subscribe(self.consume)
+
+    async def _subscribe(
+        self,
+        cb: Callable[["Msg"], Awaitable[Any]],
+    ) -> "Unsubscriptable":
+        clear_subject = self.clear_subject
+
+        if not self.extra_options.get("max_msgs") and (
+            wildcard := get_shared_wildcard(clear_subject, self._outer_config)
+        ):
+            return await self._outer_config.subject_dispatcher.subscribe(
+                self.connection,
+                clear_subject,
+                wildcard=wildcard,
+                queue=self.queue,
+                cb=cb,
+                pending_msgs_limit=self.extra_options["pending_msgs_limit"],
+                logger=self._outer_config.logger,
+            )
+
+        return await self.connection.subscribe(
+            subject=clear_subject,
             queue=self.queue,
-            cb=self.consume,
+            cb=cb,
             **self.extra_options,
         )
 
@@ -144,9 +167,4 @@ class ConcurrentCoreSubscriber(ConcurrentMixin["Msg"], CoreSubscriber):
 
         self.start_consume_task()
 
-        self.subscription = await self.connection.subscribe(
-            subject=self.clear_subject,
-            queue=self.queue,
-            cb=self._put_msg,
-            **self.extra_options,
-        )
+        self.subscription = await self._subscribe(self._put_msg)
@@ -1,3 +1,4 @@
+import time
 from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any, Optional, cast
@@ -8,6 +9,7 @@ from typing_extensions import override
 
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin, TasksMixin
 from faststream._internal.endpoint.utils import process_msg
+from faststream.nats.helpers import PullCredits
 from faststream.nats.parser import (
     BatchParser,
 )
@@ -65,7 +67,11 @@ class PullStreamSubscriber(
             config=self.config,
             **self.extra_options,
         )
-        self.add_task(self._consume_pull(cb=self.consume))
+
+        if self.pull_sub.max_in_flight:
+            self.add_task(self._consume_pipelined(self.pull_sub.max_in_flight))
+        else:
+            self.add_task(self._consume_pull(cb=self.consume))
 
     async def _consume_pull(
         self,
@@ -87,6 +93,34 @@ class PullStreamSubscriber(
                     for msg in messages:
                         tg.start_soon(cb, msg)
 
+    async def _consume_pipelined(self, max_in_flight: int) -> None:
+        """Endless task fetching new messages as soon as previous are processed."""
+        assert self.subscription
+
+        credits = PullCredits(max_in_flight, ack_wait=self.config.ack_wait)
+
+        async with anyio.create_task_group() as tg:
+            while self.running:  # pragma: no branch
+                batch = await credits.wait_free()
+
+                messages = []
+                with suppress(TimeoutError, ConnectionClosedError):
+                    messages = await self.subscription.fetch(
+                        batch=batch,
+                        timeout=self.pull_sub.timeout,
+                    )
+
+                credits.take(len(messages))
+                for msg in messages:
+                    tg.start_soon(self._consume_with_credit, msg, credits)
+
+    async def _consume_with_credit(self, msg: "Msg", credits: PullCredits) -> None:
+        start = time.monotonic()
+        try:
+            await self.consume(msg)
+        finally:
+            credits.release(time.monotonic() - start)
+
 
 class ConcurrentPullStreamSubscriber(ConcurrentMixin["Msg"], PullStreamSubscriber):
     @override
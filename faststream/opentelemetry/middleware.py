@@ -1,14 +1,22 @@
+import asyncio
+import random
 import time
 from collections import defaultdict
 from collections.abc import Callable
-from copy import copy
+from contextlib import AbstractContextManager, nullcontext
 from typing import TYPE_CHECKING, Any, Generic, Optional, cast
 
 from opentelemetry import baggage, context, metrics, trace
 from opentelemetry.baggage.propagation import W3CBaggagePropagator
 from opentelemetry.context import Context
 from opentelemetry.semconv.trace import SpanAttributes
-from opentelemetry.trace import Link, Span
+from opentelemetry.trace import (
+    Link,
+    NonRecordingSpan,
+    Span,
+    SpanContext,
+    TraceFlags,
+)
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
 
 from faststream._internal.middlewares import BaseMiddleware
@@ -28,7 +36,7 @@ if TYPE_CHECKING:
     from contextvars import Token
     from types import TracebackType
 
-    from opentelemetry.metrics import Meter, MeterProvider
+    from opentelemetry.metrics import Counter, Histogram, Meter, MeterProvider
     from opentelemetry.trace import Tracer, TracerProvider
     from opentelemetry.util.types import Attributes
 
@@ -48,6 +56,7 @@ class TelemetryMiddleware(Generic[PublishCommandType]):
         "_metrics",
         "_settings_provider_factory",
         "_tracer",
+        "_traces_sample_ratio",
     )
 
     def __init__(
@@ -61,11 +70,18 @@ class TelemetryMiddleware(Generic[PublishCommandType]):
         meter_provider: Optional["MeterProvider"] = None,
         meter: Optional["Meter"] = None,
         include_messages_counters: bool = False,
+        metrics_export_interval: float | None = None,
+        traces_sample_ratio: float = 1.0,
     ) -> None:
         self._tracer = _get_tracer(tracer_provider)
         self._meter = _get_meter(meter_provider, meter)
-        self._metrics = _MetricsContainer(self._meter, include_messages_counters)
+        self._metrics = _MetricsContainer(
+            self._meter,
+            include_messages_counters,
+            export_interval=metrics_export_interval,
+        )
         self._settings_provider_factory = settings_provider_factory
+        self._traces_sample_ratio = traces_sample_ratio
 
     def __call__(
         self,
@@ -79,12 +95,61 @@ class TelemetryMiddleware(Generic[PublishCommandType]):
             tracer=self._tracer,
             metrics_container=self._metrics,
             settings_provider_factory=self._settings_provider_factory,
+            traces_sample_ratio=self._traces_sample_ratio,
             context=context,
         )
 
+    def flush_metrics(self) -> None:
+        """Record metrics aggregated by `metrics_export_interval` right now."""
+        self._metrics.flush()
+
+    def on_broker_stop(self) -> None:
+        self.flush_metrics()
+
+
+class _Measurements:
+    """Metrics of an attributes set with precomputed attributes dicts."""
+
+    __slots__ = (
+        "attributes",
+        "count",
+        "counter",
+        "counter_attributes",
+        "histogram",
+    )
+
+    def __init__(
+        self,
+        histogram: "Histogram",
+        counter: Optional["Counter"],
+        attributes: dict[str, Any],
+    ) -> None:
+        self.histogram = histogram
+        self.counter = counter
+
+        self.attributes = attributes
+        self.counter_attributes = {k: v for k, v in attributes.items() if k != ERROR_TYPE}
+
+        # aggregated messages count waiting for the flush
+        self.count = 0
+
+    def record(self, duration: float, msg_count: int) -> None:
+        self.histogram.record(amount=duration, attributes=self.attributes)
+        if self.counter is not None:
+            self.counter.add(amount=msg_count, attributes=self.counter_attributes)
+
+    def flush(self) -> None:
+        if self.counter is not None and self.count:
+            self.counter.add(amount=self.count, attributes=self.counter_attributes)
+        self.count = 0
+
 
 class _MetricsContainer:
     __slots__ = (
+        "_export_interval",
+        "_flush_handle",
+        "_flush_loop",
+        "_measurements",
         "include_messages_counters",
         "process_counter",
         "process_duration",
@@ -92,7 +157,13 @@ class _MetricsContainer:
         "publish_duration",
     )
 
-    def __init__(self, meter: "Meter", include_messages_counters: bool) -> None:
+    def __init__(
+        self,
+        meter: "Meter",
+        include_messages_counters: bool,
+        *,
+        export_interval: float | None = None,
+    ) -> None:
         self.include_messages_counters = include_messages_counters
 
         self.publish_duration = meter.create_histogram(
@@ -118,42 +189,99 @@ class _MetricsContainer:
                 description="Measures the number of published messages.",
             )
 
+        # (action, system, destination, error type) -> measurements
+        self._measurements: dict[
+            tuple[str, str, str, str | None],
+            _Measurements,
+        ] = {}
+
+        self._export_interval = export_interval
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_loop: asyncio.AbstractEventLoop | None = None
+
     def observe_publish(
         self,
-        attrs: dict[str, Any],
+        system: str,
+        destination: str,
+        error_type: str | None,
         duration: float,
         msg_count: int,
     ) -> None:
-        self.publish_duration.record(
-            amount=duration,
-            attributes=attrs,
-        )
-        if self.include_messages_counters:
-            counter_attrs = copy(attrs)
-            counter_attrs.pop(ERROR_TYPE, None)
-            self.publish_counter.add(
-                amount=msg_count,
-                attributes=counter_attrs,
+        key = (MessageAction.PUBLISH, system, destination, error_type)
+        if (measurements := self._measurements.get(key)) is None:
+            attrs = {
+                SpanAttributes.MESSAGING_SYSTEM: system,
+                SpanAttributes.MESSAGING_DESTINATION_NAME: destination,
+            }
+            if error_type is not None:
+                attrs[ERROR_TYPE] = error_type
+
+            measurements = self._measurements[key] = _Measurements(
+                self.publish_duration,
+                self.publish_counter if self.include_messages_counters else None,
+                attrs,
             )
 
+        self._observe(measurements, duration, msg_count)
+
     def observe_consume(
         self,
-        attrs: dict[str, Any],
+        system: str,
+        destination: str,
+        error_type: str | None,
         duration: float,
         msg_count: int,
     ) -> None:
-        self.process_duration.record(
-            amount=duration,
-            attributes=attrs,
-        )
-        if self.include_messages_counters:
-            counter_attrs = copy(attrs)
-            counter_attrs.pop(ERROR_TYPE, None)
-            self.process_counter.add(
-                amount=msg_count,
-                attributes=counter_attrs,
+        key = (MessageAction.PROCESS, system, destination, error_type)
+        if (measurements := self._measurements.get(key)) is None:
+            attrs = {
+                SpanAttributes.MESSAGING_SYSTEM: system,
+                MESSAGING_DESTINATION_PUBLISH_NAME: destination,
+            }
+            if error_type is not None:
+                attrs[ERROR_TYPE] = error_type
+
+            measurements = self._measurements[key] = _Measurements(
+                self.process_duration,
+                self.process_counter if self.include_messages_counters else None,
+                attrs,
             )
 
+        self._observe(measurements, duration, msg_count)
+
+    def flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+            self._flush_loop = None
+
+        for measurements in self._measurements.values():
+            measurements.flush()
+
+    def _observe(
+        self,
+        measurements: _Measurements,
+        duration: float,
+        msg_count: int,
+    ) -> None:
+        if self._export_interval is None or measurements.counter is None:
+            measurements.record(duration, msg_count)
+            return
+
+        # histogram buckets are defined by SDK views, so durations can't be
+        # aggregated here and are recorded right away
+        measurements.histogram.record(amount=duration, attributes=measurements.attributes)
+        measurements.count += msg_count
+
+        loop = asyncio.get_running_loop()
+        # a timer of a stopped or closed loop would never fire
+        if self._flush_handle is None or self._flush_loop is not loop:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+
+            self._flush_handle = loop.call_later(self._export_interval, self.flush)
+            self._flush_loop = loop
+
 
 class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
     def __init__(
@@ -168,11 +296,13 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
         ],
         metrics_container: _MetricsContainer,
         context: "ContextRepo",
+        traces_sample_ratio: float = 1.0,
     ) -> None:
         super().__init__(msg, context=context)
 
         self._tracer = tracer
         self._metrics = metrics_container
+        self._traces_sample_ratio = traces_sample_ratio
         self._current_span: Span | None = None
         self._origin_context: Context | None = None
         self._scope_tokens: list[tuple[str, Token[Any]]] = []
@@ -194,61 +324,82 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
         if current_baggage:
             headers.update(current_baggage.to_headers())
 
-        trace_attributes = provider.get_publish_attrs_from_cmd(msg)
-        metrics_attributes = {
-            SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
-            SpanAttributes.MESSAGING_DESTINATION_NAME: destination_name,
-        }
-
         # NOTE: if batch with single message?
         if (msg_count := len(msg.batch_bodies)) > 1:
-            trace_attributes[SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT] = msg_count
             current_context = _BAGGAGE_PROPAGATOR.extract(headers, current_context)
             _BAGGAGE_PROPAGATOR.inject(
                 headers,
                 baggage.set_baggage(WITH_BATCH, True, context=current_context),
             )
 
-        if self._current_span and self._current_span.is_recording():
-            current_context = trace.set_span_in_context(
+        parent_context = current_context
+        if self._current_span is not None:
+            parent_context = trace.set_span_in_context(
                 self._current_span,
                 current_context,
             )
-            _TRACE_PROPAGATOR.inject(headers, context=self._origin_context)
+
+        publish_span: AbstractContextManager[Span | None]
+        if (span_context := self._get_not_sampled_span(parent_context)) is not None:
+            # spans are not recorded, but the decision is propagated to consumers
+            _TRACE_PROPAGATOR.inject(
+                headers,
+                context=trace.set_span_in_context(NonRecordingSpan(span_context)),
+            )
+            publish_span = nullcontext()
 
         else:
-            create_span = self._tracer.start_span(
-                name=_create_span_name(destination_name, MessageAction.CREATE),
+            trace_attributes = provider.get_publish_attrs_from_cmd(msg)
+            if msg_count > 1:
+                trace_attributes[SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT] = msg_count
+
+            if self._current_span and self._current_span.is_recording():
+                current_context = parent_context
+                _TRACE_PROPAGATOR.inject(headers, context=self._origin_context)
+
+            else:
+                create_span = self._tracer.start_span(
+                    name=_create_span_name(destination_name, MessageAction.CREATE),
+                    kind=trace.SpanKind.PRODUCER,
+                    attributes=trace_attributes,
+                )
+                current_context = trace.set_span_in_context(create_span)
+                _TRACE_PROPAGATOR.inject(headers, context=current_context)
+                create_span.end()
+
+            publish_span = self._tracer.start_as_current_span(
+                name=_create_span_name(destination_name, MessageAction.PUBLISH),
                 kind=trace.SpanKind.PRODUCER,
                 attributes=trace_attributes,
+                context=current_context,
             )
-            current_context = trace.set_span_in_context(create_span)
-            _TRACE_PROPAGATOR.inject(headers, context=current_context)
-            create_span.end()
 
+        error_type: str | None = None
         start_time = time.perf_counter()
 
         try:
-            with self._tracer.start_as_current_span(
-                name=_create_span_name(destination_name, MessageAction.PUBLISH),
-                kind=trace.SpanKind.PRODUCER,
-                attributes=trace_attributes,
-                context=current_context,
-            ) as span:
-                span.set_attribute(
-                    SpanAttributes.MESSAGING_OPERATION,
-                    MessageAction.PUBLISH,
-                )
+            with publish_span as span:
+                if span is not None:
+                    span.set_attribute(
+                        SpanAttributes.MESSAGING_OPERATION,
+                        MessageAction.PUBLISH,
+                    )
                 msg.headers = headers
                 result = await call_next(msg)
 
         except Exception as e:
-            metrics_attributes[ERROR_TYPE] = type(e).__name__
+            error_type = type(e).__name__
             raise
 
         finally:
             duration = time.perf_counter() - start_time
-            self._metrics.observe_publish(metrics_attributes, duration, msg_count)
+            self._metrics.observe_publish(
+                provider.messaging_system,
+                destination_name,
+                error_type,
+                duration,
+                msg_count,
+            )
 
         for key, token in self._scope_tokens:
             self.context.reset_local(key, token)
@@ -263,45 +414,63 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
         if (provider := self.__settings_provider) is None:
             return await call_next(msg)
 
-        if _is_batch_message(msg):
-            links = _get_msg_links(msg)
+        if is_batch := _is_batch_message(msg):
             current_context = Context()
         else:
-            links = None
             current_context = _TRACE_PROPAGATOR.extract(msg.headers)
 
         destination_name = provider.get_consume_destination_name(msg)
-        trace_attributes = provider.get_consume_attrs_from_message(msg)
-        metrics_attributes = {
-            SpanAttributes.MESSAGING_SYSTEM: provider.messaging_system,
-            MESSAGING_DESTINATION_PUBLISH_NAME: destination_name,
-        }
-
-        if not len(current_context):
-            create_span = self._tracer.start_span(
-                name=_create_span_name(destination_name, MessageAction.CREATE),
-                kind=trace.SpanKind.CONSUMER,
-                attributes=trace_attributes,
-                links=links,
+
+        process_span: AbstractContextManager[Span]
+        if (span_context := self._get_not_sampled_span(current_context)) is not None:
+            # skip links and attributes building for not sampled messages
+            process_span = nullcontext(NonRecordingSpan(span_context))
+            msg_count = (
+                provider.get_consume_attrs_from_message(msg).get(
+                    SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT,
+                    1,
+                )
+                if is_batch
+                else 1
             )
-            current_context = trace.set_span_in_context(create_span)
-            create_span.end()
 
-        self._origin_context = current_context
-        start_time = time.perf_counter()
+        else:
+            links = _get_msg_links(msg) if is_batch else None
+            trace_attributes = provider.get_consume_attrs_from_message(msg)
+            msg_count = trace_attributes.get(
+                SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT,
+                1,
+            )
 
-        try:
-            with self._tracer.start_as_current_span(
+            if not len(current_context):
+                create_span = self._tracer.start_span(
+                    name=_create_span_name(destination_name, MessageAction.CREATE),
+                    kind=trace.SpanKind.CONSUMER,
+                    attributes=trace_attributes,
+                    links=links,
+                )
+                current_context = trace.set_span_in_context(create_span)
+                create_span.end()
+
+            process_span = self._tracer.start_as_current_span(
                 name=_create_span_name(destination_name, MessageAction.PROCESS),
                 kind=trace.SpanKind.CONSUMER,
                 context=current_context,
                 attributes=trace_attributes,
                 end_on_exit=False,
-            ) as span:
-                span.set_attribute(
-                    SpanAttributes.MESSAGING_OPERATION,
-                    MessageAction.PROCESS,
-                )
+            )
+
+        self._origin_context = current_context
+        error_type: str | None = None
+        start_time = time.perf_counter()
+
+        try:
+            with process_span as span:
+                if span.is_recording():
+                    span.set_attribute(
+                        SpanAttributes.MESSAGING_OPERATION,
+                        MessageAction.PROCESS,
+                    )
                 self._current_span = span
 
                 self._scope_tokens.append((
@@ -321,16 +490,18 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
                 context.detach(token)
 
         except Exception as e:
-            metrics_attributes[ERROR_TYPE] = type(e).__name__
+            error_type = type(e).__name__
             raise
 
         finally:
             duration = time.perf_counter() - start_time
-            msg_count = trace_attributes.get(
-                SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT,
-                1,
+            self._metrics.observe_consume(
+                provider.messaging_system,
+                destination_name,
+                error_type,
+                duration,
+                msg_count,
             )
-            self._metrics.observe_consume(metrics_attributes, duration, msg_count)
 
         return result
 
@@ -344,6 +515,30 @@ class BaseTelemetryMiddleware(BaseMiddleware[PublishCommandType]):
             self._current_span.end()
         return False
 
+    def _get_not_sampled_span(self, parent_context: Context) -> SpanContext | None:
+        """Make the head sampling decision before any span data is built.
+
+        Returns a not sampled span context to propagate if the message should
+        not be traced. Parent decision is respected, so a trace is never broken
+        in the middle.
+        """
+        if self._traces_sample_ratio >= 1:
+            return None
+
+        parent = trace.get_current_span(parent_context).get_span_context()
+        if parent.is_valid:
+            return None if parent.trace_flags.sampled else parent
+
+        if random.random() < self._traces_sample_ratio:  # noqa: S311
+            return None
+
+        return SpanContext(
+            trace_id=random.getrandbits(128),
+            span_id=random.getrandbits(64),
+            is_remote=False,
+            trace_flags=TraceFlags(TraceFlags.DEFAULT),
+        )
+
 
 def _get_meter(
     meter_provider: Optional["MeterProvider"] = None,
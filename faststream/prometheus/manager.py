@@ -1,9 +1,137 @@
+from typing import TYPE_CHECKING
+
 from .container import MetricsContainer
 from .types import ProcessingStatus, PublishingStatus
 
+if TYPE_CHECKING:
+    from prometheus_client import Counter, Gauge, Histogram
+
+
+class ConsumeMetrics:
+    """Metrics children of a handler with already resolved labels.
+
+    Status and exception children are created on the first use, so they
+    don't appear in the registry with zero values.
+    """
+
+    __slots__ = (
+        "_container",
+        "_exceptions",
+        "_labels",
+        "_processed",
+        "received_messages_in_process",
+        "received_messages_size_bytes",
+        "received_messages_total",
+        "received_processed_messages_duration_seconds",
+    )
+
+    def __init__(
+        self,
+        container: MetricsContainer,
+        *,
+        app_name: str,
+        broker: str,
+        handler: str,
+    ) -> None:
+        self._container = container
+        self._labels = {"app_name": app_name, "broker": broker, "handler": handler}
+
+        self.received_messages_total: Counter = container.received_messages_total.labels(
+            **self._labels
+        )
+        self.received_messages_size_bytes: Histogram = (
+            container.received_messages_size_bytes.labels(**self._labels)
+        )
+        self.received_messages_in_process: Gauge = (
+            container.received_messages_in_process.labels(**self._labels)
+        )
+        self.received_processed_messages_duration_seconds: Histogram = (
+            container.received_processed_messages_duration_seconds.labels(**self._labels)
+        )
+
+        self._processed: dict[ProcessingStatus, Counter] = {}
+        self._exceptions: dict[str, Counter] = {}
+
+    def received_processed_messages_total(self, status: ProcessingStatus) -> "Counter":
+        if (counter := self._processed.get(status)) is None:
+            counter = self._processed[status] = (
+                self._container.received_processed_messages_total.labels(
+                    **self._labels,
+                    status=status.value,
+                )
+            )
+        return counter
+
+    def received_processed_messages_exceptions_total(
+        self,
+        exception_type: str,
+    ) -> "Counter":
+        if (counter := self._exceptions.get(exception_type)) is None:
+            counter = self._exceptions[exception_type] = (
+                self._container.received_processed_messages_exceptions_total.labels(
+                    **self._labels,
+                    exception_type=exception_type,
+                )
+            )
+        return counter
+
+
+class PublishMetrics:
+    """Metrics children of a publishing destination with already resolved labels."""
+
+    __slots__ = (
+        "_container",
+        "_exceptions",
+        "_labels",
+        "_published",
+        "published_messages_duration_seconds",
+    )
+
+    def __init__(
+        self,
+        container: MetricsContainer,
+        *,
+        app_name: str,
+        broker: str,
+        destination: str,
+    ) -> None:
+        self._container = container
+        self._labels = {
+            "app_name": app_name,
+            "broker": broker,
+            "destination": destination,
+        }
+
+        self.published_messages_duration_seconds: Histogram = (
+            container.published_messages_duration_seconds.labels(**self._labels)
+        )
+
+        self._published: dict[PublishingStatus, Counter] = {}
+        self._exceptions: dict[str, Counter] = {}
+
+    def published_messages_total(self, status: PublishingStatus) -> "Counter":
+        if (counter := self._published.get(status)) is None:
+            counter = self._published[status] = (
+                self._container.published_messages_total.labels(
+                    **self._labels,
+                    status=status.value,
+                )
+            )
+        return counter
+
+    def published_messages_exceptions_total(self, exception_type: str) -> "Counter":
+        if (counter := self._exceptions.get(exception_type)) is None:
+            counter = self._exceptions[exception_type] = (
+                self._container.published_messages_exceptions_total.labels(
+                    **self._labels,
+                    exception_type=exception_type,
+                )
+            )
+        return counter
+
 
 class MetricsManager:
-    __slots__ = ("_app_name", "_container")
+    __slots__ = ("_app_name", "_consume_metrics", "_container", "_publish_metrics")
 
     def __init__(
         self, container: MetricsContainer, *, app_name: str = "faststream"
@@ -11,12 +139,32 @@ class MetricsManager:
         self._container = container
         self._app_name = app_name
 
+        # label children are cached to not resolve them for each message
+        self._consume_metrics: dict[tuple[str, str], ConsumeMetrics] = {}
+        self._publish_metrics: dict[tuple[str, str], PublishMetrics] = {}
+
+    def consume_metrics(self, broker: str, handler: str) -> ConsumeMetrics:
+        if (metrics := self._consume_metrics.get((broker, handler))) is None:
+            metrics = self._consume_metrics[broker, handler] = ConsumeMetrics(
+                self._container,
+                app_name=self._app_name,
+                broker=broker,
+                handler=handler,
+            )
+        return metrics
+
+    def publish_metrics(self, broker: str, destination: str) -> PublishMetrics:
+        if (metrics := self._publish_metrics.get((broker, destination))) is None:
+            metrics = self._publish_metrics[broker, destination] = PublishMetrics(
+                self._container,
+                app_name=self._app_name,
+                broker=broker,
+                destination=destination,
+            )
+        return metrics
+
     def add_received_message(self, broker: str, handler: str, amount: int = 1) -> None:
-        self._container.received_messages_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-        ).inc(amount)
+        self.consume_metrics(broker, handler).received_messages_total.inc(amount)
 
     def observe_received_messages_size(
         self,
@@ -24,11 +172,7 @@ class MetricsManager:
         handler: str,
         size: int,
     ) -> None:
-        self._container.received_messages_size_bytes.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-        ).observe(size)
+        self.consume_metrics(broker, handler).received_messages_size_bytes.observe(size)
 
     def add_received_message_in_process(
         self,
@@ -36,11 +180,7 @@ class MetricsManager:
         handler: str,
         amount: int = 1,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-        ).inc(amount)
+        self.consume_metrics(broker, handler).received_messages_in_process.inc(amount)
 
     def remove_received_message_in_process(
         self,
@@ -48,11 +188,7 @@ class MetricsManager:
         handler: str,
         amount: int = 1,
     ) -> None:
-        self._container.received_messages_in_process.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-        ).dec(amount)
+        self.consume_metrics(broker, handler).received_messages_in_process.dec(amount)
 
     def add_received_processed_message(
         self,
@@ -61,11 +197,8 @@ class MetricsManager:
         status: ProcessingStatus,
         amount: int = 1,
     ) -> None:
-        self._container.received_processed_messages_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-            status=status.value,
+        self.consume_metrics(broker, handler).received_processed_messages_total(
+            status
         ).inc(amount)
 
     def observe_received_processed_message_duration(
@@ -74,11 +207,9 @@ class MetricsManager:
         broker: str,
         handler: str,
     ) -> None:
-        self._container.received_processed_messages_duration_seconds.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-        ).observe(duration)
+        self.consume_metrics(
+            broker, handler
+        ).received_processed_messages_duration_seconds.observe(duration)
 
     def add_received_processed_message_exception(
         self,
@@ -86,12 +217,9 @@ class MetricsManager:
         handler: str,
         exception_type: str,
     ) -> None:
-        self._container.received_processed_messages_exceptions_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            handler=handler,
-            exception_type=exception_type,
-        ).inc()
+        self.consume_metrics(
+            broker, handler
+        ).received_processed_messages_exceptions_total(exception_type).inc()
 
     def add_published_message(
         self,
@@ -100,12 +228,9 @@ class MetricsManager:
         status: PublishingStatus,
         amount: int = 1,
     ) -> None:
-        self._container.published_messages_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            destination=destination,
-            status=status.value,
-        ).inc(amount)
+        self.publish_metrics(broker, destination).published_messages_total(status).inc(
+            amount
+        )
 
     def observe_published_message_duration(
         self,
@@ -113,11 +238,9 @@ class MetricsManager:
         broker: str,
         destination: str,
     ) -> None:
-        self._container.published_messages_duration_seconds.labels(
-            app_name=self._app_name,
-            broker=broker,
-            destination=destination,
-        ).observe(duration)
+        self.publish_metrics(
+            broker, destination
+        ).published_messages_duration_seconds.observe(duration)
 
     def add_published_message_exception(
         self,
@@ -125,9 +248,6 @@ class MetricsManager:
         destination: str,
         exception_type: str,
     ) -> None:
-        self._container.published_messages_exceptions_total.labels(
-            app_name=self._app_name,
-            broker=broker,
-            destination=destination,
-            exception_type=exception_type,
+        self.publish_metrics(broker, destination).published_messages_exceptions_total(
+            exception_type
         ).inc()
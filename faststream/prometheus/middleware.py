@@ -97,27 +97,17 @@ class BasePrometheusMiddleware(
         if self._settings_provider is None or msg.source_type is SourceType.RESPONSE:
             return await call_next(msg)
 
-        messaging_system = self._settings_provider.messaging_system
         consume_attrs = self._settings_provider.get_consume_attrs_from_message(msg)
-        destination_name = consume_attrs["destination_name"]
+        messages_count = consume_attrs["messages_count"]
 
-        self._metrics_manager.add_received_message(
-            amount=consume_attrs["messages_count"],
-            broker=messaging_system,
-            handler=destination_name,
+        metrics = self._metrics_manager.consume_metrics(
+            broker=self._settings_provider.messaging_system,
+            handler=consume_attrs["destination_name"],
         )
 
-        self._metrics_manager.observe_received_messages_size(
-            size=consume_attrs["message_size"],
-            broker=messaging_system,
-            handler=destination_name,
-        )
-
-        self._metrics_manager.add_received_message_in_process(
-            amount=consume_attrs["messages_count"],
-            broker=messaging_system,
-            handler=destination_name,
-        )
+        metrics.received_messages_total.inc(messages_count)
+        metrics.received_messages_size_bytes.observe(consume_attrs["message_size"])
+        metrics.received_messages_in_process.inc(messages_count)
 
         err: Exception | None = None
         start_time = time.perf_counter()
@@ -129,26 +119,16 @@ class BasePrometheusMiddleware(
             err = e
 
             if not isinstance(err, IgnoredException):
-                self._metrics_manager.add_received_processed_message_exception(
-                    exception_type=type(err).__name__,
-                    broker=messaging_system,
-                    handler=destination_name,
-                )
+                metrics.received_processed_messages_exceptions_total(
+                    type(err).__name__,
+                ).inc()
             raise
 
         finally:
             duration = time.perf_counter() - start_time
-            self._metrics_manager.observe_received_processed_message_duration(
-                duration=duration,
-                broker=messaging_system,
-                handler=destination_name,
-            )
-
-            self._metrics_manager.remove_received_message_in_process(
-                amount=consume_attrs["messages_count"],
-                broker=messaging_system,
-                handler=destination_name,
-            )
+            metrics.received_processed_messages_duration_seconds.observe(duration)
+
+            metrics.received_messages_in_process.dec(messages_count)
 
             status = ProcessingStatus.acked
 
@@ -159,12 +139,7 @@ class BasePrometheusMiddleware(
                     or ProcessingStatus.error
                 )
 
-            self._metrics_manager.add_received_processed_message(
-                amount=consume_attrs["messages_count"],
-                status=status,
-                broker=messaging_system,
-                handler=destination_name,
-            )
+            metrics.received_processed_messages_total(status).inc(messages_count)
 
         return result
 
@@ -176,10 +151,12 @@ class BasePrometheusMiddleware(
         if self._settings_provider is None or cmd.publish_type is PublishType.REPLY:
             return await call_next(cmd)
 
-        destination_name = self._settings_provider.get_publish_destination_name_from_cmd(
-            cmd
+        metrics = self._metrics_manager.publish_metrics(
+            broker=self._settings_provider.messaging_system,
+            destination=self._settings_provider.get_publish_destination_name_from_cmd(
+                cmd
+            ),
         )
-        messaging_system = self._settings_provider.messaging_system
 
         err: Exception | None = None
         start_time = time.perf_counter()
@@ -189,29 +166,14 @@ class BasePrometheusMiddleware(
 
         except Exception as e:
             err = e
-            self._metrics_manager.add_published_message_exception(
-                exception_type=type(err).__name__,
-                broker=messaging_system,
-                destination=destination_name,
-            )
+            metrics.published_messages_exceptions_total(type(err).__name__).inc()
             raise
 
         finally:
             duration = time.perf_counter() - start_time
-
-            self._metrics_manager.observe_published_message_duration(
-                duration=duration,
-                broker=messaging_system,
-                destination=destination_name,
-            )
+            metrics.published_messages_duration_seconds.observe(duration)
 
             status = PublishingStatus.error if err else PublishingStatus.success
-
-            self._metrics_manager.add_published_message(
-                amount=len(cmd.batch_bodies),
-                status=status,
-                broker=messaging_system,
-                destination=destination_name,
-            )
+            metrics.published_messages_total(status).inc(len(cmd.batch_bodies))
 
         return result
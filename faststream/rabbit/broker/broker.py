@@ -21,6 +21,7 @@ from faststream.message import gen_cor_id
 from faststream.rabbit.configs import RabbitBrokerConfig
 from faststream.rabbit.helpers.channel_manager import ChannelManagerImpl
 from faststream.rabbit.helpers.declarer import RabbitDeclarerImpl
+from faststream.rabbit.helpers.publishing_pool import PublishingChannelPool
 from faststream.rabbit.publisher.producer import (
     AioPikaFastProducerImpl,
 )
@@ -86,6 +87,8 @@ class RabbitBroker(
         fail_fast: bool = True,
         reconnect_interval: "TimeoutType" = 5.0,
         default_channel: Optional["Channel"] = None,
+        publishing_channels: int | None = None,
+        confirm_window: int = 128,
         app_id: str | None = SERVICE_NAME,
         # broker base args
         graceful_timeout: float | None = None,
@@ -104,9 +107,13 @@ class RabbitBroker(
         # logging args
         logger: Optional["LoggerProto"] = EMPTY,
         log_level: int = logging.INFO,
+        log_sample_ratio: float = 1.0,
+        log_rate_limit: int | None = None,
+        log_in_background: bool = False,
         # FastDepends args
         apply_types: bool = True,
         serializer: Optional["SerializerProto"] = EMPTY,
+        decode_to_model: bool = False,
     ) -> None:
         """Initialize the RabbitBroker.
 
@@ -121,6 +128,10 @@ class RabbitBroker(
             fail_fast: Broker startup raises `AMQPConnectionError` if RabbitMQ is unreachable.
             reconnect_interval: Time to sleep between reconnection attempts.
             default_channel: Default channel settings to use.
+            publishing_channels: Number of dedicated channels to spread `publish` calls across.
+                By default, all publishers use the default channel.
+            confirm_window: Maximum number of unconfirmed publishes per publishing channel.
+                Used with `publishing_channels` only.
             app_id: Application name to mark outgoing messages by.
             graceful_timeout: Graceful shutdown timeout. Broker waits for all running subscribers completion before shut down.
             decoder: Custom decoder object.
@@ -136,8 +147,14 @@ class RabbitBroker(
             tags: AsyncAPI server tags.
             logger: User-specified logger to pass into Context and log service messages.
             log_level: Service messages log level.
+            log_sample_ratio: Fraction of messages to write `Received` and `Processed` records for.
+                Errors are always logged.
+            log_rate_limit: Maximum number of messages per second to write `Received` and `Processed` records for.
+            log_in_background: Whether to write per-message records from a background thread instead of the event loop.
             apply_types: Whether to use FastDepends or not.
             serializer: FastDepends-compatible serializer to validate incoming messages.
+            decode_to_model: Whether to decode JSON messages right into the handler's pydantic model
+                or msgspec Struct argument, skipping the intermediate `dict`.
         """
         security_args = parse_security(security)
 
@@ -164,10 +181,19 @@ class RabbitBroker(
         cm = ChannelManagerImpl(default_channel)
         declarer = RabbitDeclarerImpl(cm)
 
+        publishing_pool = None
+        if publishing_channels:
+            publishing_pool = PublishingChannelPool(
+                publishing_channels,
+                confirm_window=confirm_window,
+                channel=default_channel,
+            )
+
         producer = AioPikaFastProducerImpl(
             declarer=declarer,
             decoder=decoder,
             parser=parser,
+            publishing_pool=publishing_pool,
         )
 
         super().__init__(
@@ -183,6 +209,7 @@ class RabbitBroker(
                 channel_manager=cm,
                 producer=producer,
                 declarer=declarer,
+                publishing_pool=publishing_pool,
                 app_id=app_id,
                 virtual_host=built_asyncapi_url.path,
                 # both args
@@ -192,10 +219,14 @@ class RabbitBroker(
                 logger=make_rabbit_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    sample_ratio=log_sample_ratio,
+                    rate_limit=log_rate_limit,
+                    in_background=log_in_background,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
                     serializer=serializer,
+                    decode_to_model=decode_to_model,
                 ),
                 # subscriber args
                 broker_dependencies=dependencies,
@@ -216,6 +247,12 @@ class RabbitBroker(
 
         self._channel: RobustChannel | None = None
 
+    @property
+    def publishing_pool(self) -> PublishingChannelPool | None:
+        """Publishing channels pool to inspect its load, if enabled."""
+        pool: PublishingChannelPool | None = self.config.publishing_pool
+        return pool
+
     @override
     async def _connect(self) -> "RobustConnection":
         connection = cast(
@@ -237,6 +274,10 @@ class RabbitBroker(
     ) -> None:
         await super().stop(exc_type, exc_val, exc_tb)
 
+        # RPC consumer should be cancelled before the channel is closed and
+        # publishing pool channels should be closed before the connection
+        await self.config.disconnect()
+
         if self._channel is not None:
             if not self._channel.is_closed:
                 await self._channel.close()
@@ -247,8 +288,6 @@ class RabbitBroker(
             await self._connection.close()
             self._connection = None
 
-        self.config.disconnect()
-
     @deprecated(
         "Deprecated in **FastStream 0.5.44**. "
         "Please, use `stop` method instead. "
@@ -375,6 +414,68 @@ class RabbitBroker(
         )
         return result
 
+    @override
+    async def publish_batch(
+        self,
+        *messages: "AioPikaSendableMessage",
+        queue: Union["RabbitQueue", str] = "",
+        exchange: Union["RabbitExchange", str, None] = None,
+        routing_key: str = "",
+        # publish options
+        mandatory: bool = True,
+        immediate: bool = False,
+        timeout: "TimeoutType" = None,
+        persist: bool = False,
+        reply_to: str | None = None,
+        correlation_id: str | None = None,
+        # message options
+        headers: Optional["HeadersType"] = None,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        expiration: Optional["DateType"] = None,
+        timestamp: Optional["DateType"] = None,
+        message_type: str | None = None,
+        user_id: str | None = None,
+        priority: int | None = None,
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"] | Exception]:
+        """Publish many messages with pipelined publisher confirms.
+
+        Messages are sent back to back on the same channel and their confirmations
+        are awaited together, so the whole batch takes about one round-trip instead
+        of one per message. Options are the same as for `publish` and are applied
+        to every message.
+
+        Returns:
+            A confirmation frame or a publishing error per message, in the messages order.
+        """
+        cmd = RabbitPublishCommand(
+            messages[0] if messages else None,
+            messages=messages[1:],
+            routing_key=routing_key or RabbitQueue.validate(queue).routing(),
+            exchange=RabbitExchange.validate(exchange),
+            # every message gets its own correlation_id unless it is set explicitly
+            correlation_id=correlation_id,
+            app_id=self.config.app_id,
+            mandatory=mandatory,
+            immediate=immediate,
+            persist=persist,
+            reply_to=reply_to,
+            headers=headers,
+            content_type=content_type,
+            content_encoding=content_encoding,
+            expiration=expiration,
+            message_type=message_type,
+            timestamp=timestamp,
+            user_id=user_id,
+            timeout=timeout,
+            priority=priority,
+            _publish_type=PublishType.PUBLISH,
+        )
+
+        result: list[aiormq.abc.ConfirmationFrameType | Exception | None]
+        result = await super()._basic_publish_batch(cmd, producer=self._producer)
+        return result
+
     @override
     async def request(  # type: ignore[override]
         self,
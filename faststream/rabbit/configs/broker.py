@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from faststream._internal.configs import BrokerConfig
 from faststream.rabbit.helpers.channel_manager import FakeChannelManager
@@ -9,7 +9,11 @@ from faststream.rabbit.publisher.producer import FakeAioPikaFastProducer
 if TYPE_CHECKING:
     from aio_pika import RobustConnection
 
-    from faststream.rabbit.helpers import ChannelManager, RabbitDeclarer
+    from faststream.rabbit.helpers import (
+        ChannelManager,
+        PublishingChannelPool,
+        RabbitDeclarer,
+    )
     from faststream.rabbit.publisher.producer import AioPikaFastProducer
 
 
@@ -18,6 +22,7 @@ class RabbitBrokerConfig(BrokerConfig):
     channel_manager: "ChannelManager" = field(default_factory=FakeChannelManager)
     declarer: "RabbitDeclarer" = field(default_factory=FakeRabbitDeclarer)
     producer: "AioPikaFastProducer" = field(default_factory=FakeAioPikaFastProducer)
+    publishing_pool: Optional["PublishingChannelPool"] = None
 
     virtual_host: str = ""
     app_id: str | None = None
@@ -27,9 +32,13 @@ class RabbitBrokerConfig(BrokerConfig):
 
     def connect(self, connection: "RobustConnection") -> None:
         self.channel_manager.connect(connection)
+        if self.publishing_pool is not None:
+            self.publishing_pool.connect(connection)
         self.producer.connect(serializer=self.fd_config._serializer)
 
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
+        await self.producer.disconnect()
         self.channel_manager.disconnect()
+        if self.publishing_pool is not None:
+            await self.publishing_pool.disconnect()
         self.declarer.disconnect()
-        self.producer.disconnect()
@@ -101,6 +101,14 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
         ] = 5.0,
         # channel args
         default_channel: Optional["Channel"] = None,
+        publishing_channels: Annotated[
+            int | None,
+            Doc("Number of dedicated channels to spread `publish` calls across."),
+        ] = None,
+        confirm_window: Annotated[
+            int,
+            Doc("Maximum number of unconfirmed publishes per publishing channel."),
+        ] = 128,
         app_id: Annotated[
             str | None,
             Doc("Application name to mark outgoing messages by."),
@@ -405,6 +413,8 @@ class RabbitRouter(StreamRouter[IncomingMessage]):
             decoder=decoder,
             parser=parser,
             default_channel=default_channel,
+            publishing_channels=publishing_channels,
+            confirm_window=confirm_window,
             middlewares=middlewares,
             security=security,
             specification_url=specification_url,
@@ -1,7 +1,9 @@
 from .channel_manager import ChannelManager
 from .declarer import RabbitDeclarer
+from .publishing_pool import PublishingChannelPool
 
 __all__ = (
     "ChannelManager",
+    "PublishingChannelPool",
     "RabbitDeclarer",
 )
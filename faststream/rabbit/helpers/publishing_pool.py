@@ -0,0 +1,118 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Optional, cast
+
+import anyio
+
+from faststream.rabbit.schemas import Channel
+
+from .state import ConnectedState, ConnectionState, EmptyConnectionState
+
+if TYPE_CHECKING:
+    import aio_pika
+
+
+class _PoolChannel:
+    __slots__ = ("channel", "in_flight")
+
+    def __init__(self, channel: "aio_pika.RobustChannel") -> None:
+        self.channel = channel
+        self.in_flight = 0
+
+
+class PublishingChannelPool:
+    """Dedicated publisher-confirm channels to spread publishes across.
+
+    Each publish takes the least loaded channel and waits if every channel
+    already has `confirm_window` unconfirmed publishes, so one slow confirm
+    or a flow-controlled channel doesn't stall all publishers.
+    """
+
+    __slots__ = (
+        "__channel",
+        "__connection",
+        "_channels",
+        "_lock",
+        "_released",
+        "confirm_window",
+        "size",
+    )
+
+    def __init__(
+        self,
+        size: int,
+        *,
+        confirm_window: int,
+        channel: Optional["Channel"] = None,
+    ) -> None:
+        self.size = size
+        self.confirm_window = confirm_window
+
+        self.__channel = channel or Channel()
+        self.__connection: ConnectionState = EmptyConnectionState()
+
+        self._channels: list[_PoolChannel] = []
+        self._lock = anyio.Lock()
+        self._released = anyio.Event()
+
+    @property
+    def channels_count(self) -> int:
+        """Number of opened publishing channels."""
+        return len(self._channels)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of publishes waiting for confirmation in all channels."""
+        return sum(ch.in_flight for ch in self._channels)
+
+    @property
+    def in_flight_per_channel(self) -> tuple[int, ...]:
+        return tuple(ch.in_flight for ch in self._channels)
+
+    def connect(self, connection: "aio_pika.RobustConnection") -> None:
+        self.__connection = ConnectedState(connection)
+
+    async def disconnect(self) -> None:
+        self.__connection = EmptyConnectionState()
+
+        channels, self._channels = self._channels, []
+        for pool_channel in channels:
+            if not pool_channel.channel.is_closed:
+                await pool_channel.channel.close()
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator["aio_pika.RobustChannel"]:
+        """Take a publishing slot in the least loaded channel."""
+        if not self._channels:
+            await self._open()
+
+        while True:
+            pool_channel = min(self._channels, key=lambda ch: ch.in_flight)
+            if pool_channel.in_flight < self.confirm_window:
+                break
+            await self._released.wait()
+
+        pool_channel.in_flight += 1
+        try:
+            yield pool_channel.channel
+
+        finally:
+            pool_channel.in_flight -= 1
+            self._released.set()
+            self._released = anyio.Event()
+
+    async def _open(self) -> None:
+        async with self._lock:
+            if self._channels:
+                return
+
+            connection = self.__connection.connection
+            for _ in range(self.size):
+                channel = cast(
+                    "aio_pika.RobustChannel",
+                    await connection.channel(
+                        publisher_confirms=self.__channel.publisher_confirms,
+                        on_return_raises=self.__channel.on_return_raises,
+                    ),
+                )
+                self._channels.append(_PoolChannel(channel))
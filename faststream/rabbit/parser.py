@@ -46,8 +46,8 @@ class AioPikaParser:
             headers=message.headers,
             reply_to=message.reply_to or "",
             content_type=message.content_type,
-            message_id=message.message_id or gen_cor_id(),
-            correlation_id=message.correlation_id or gen_cor_id(),
+            message_id=message.message_id,
+            correlation_id=message.correlation_id,
             path=path,
             raw_message=message,
         )
@@ -1,6 +1,11 @@
+import asyncio
 from abc import abstractmethod
+from collections import deque
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
 from typing import (
     TYPE_CHECKING,
+    Any,
     Optional,
     Protocol,
     cast,
@@ -11,14 +16,13 @@ from typing_extensions import Unpack, override
 
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.producer import ProducerProto
-from faststream.exceptions import FeatureNotSupportedException, IncorrectState
+from faststream.exceptions import IncorrectState
+from faststream.message import gen_cor_id
 from faststream.rabbit.parser import AioPikaParser
 from faststream.rabbit.response import RabbitPublishCommand
 from faststream.rabbit.schemas import RABBIT_REPLY, RabbitExchange
 
 if TYPE_CHECKING:
-    from types import TracebackType
-
     import aiormq
     from aio_pika import IncomingMessage, RobustQueue
     from aio_pika.abc import AbstractIncomingMessage, TimeoutType
@@ -29,37 +33,40 @@ if TYPE_CHECKING:
         AsyncCallable,
         CustomCallable,
     )
-    from faststream.rabbit.helpers import RabbitDeclarer
+    from faststream.rabbit.helpers import PublishingChannelPool, RabbitDeclarer
     from faststream.rabbit.types import AioPikaSendableMessage
 
     from .options import MessageOptions
 
+# publishes sent before awaiting the oldest confirmation
+CONFIRM_WINDOW = 1024
+
 
-class LockState(Protocol):
+class RPCState(Protocol):
     @property
-    def lock(self) -> "anyio.Lock": ...
+    def rpc(self) -> "_RPCMultiplexer": ...
 
 
-class LockUnset:
+class RPCUnset:
     __slots__ = ()
 
     @property
-    def lock(self) -> "anyio.Lock":
+    def rpc(self) -> "_RPCMultiplexer":
         msg = "You should call `producer.connect()` method at first."
         raise IncorrectState(msg)
 
 
-class RealLock:
-    __slots__ = ("lock",)
+class RealRPC:
+    __slots__ = ("rpc",)
 
     def __init__(self) -> None:
-        self.lock = anyio.Lock()
+        self.rpc = _RPCMultiplexer()
 
 
 class AioPikaFastProducer(ProducerProto[RabbitPublishCommand]):
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None: ...
 
-    def disconnect(self) -> None: ...
+    async def disconnect(self) -> None: ...
 
     @abstractmethod
     async def publish(
@@ -70,10 +77,11 @@ class AioPikaFastProducer(ProducerProto[RabbitPublishCommand]):
     @abstractmethod
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage": ...
 
-    @override
-    async def publish_batch(self, cmd: "RabbitPublishCommand") -> None:
-        msg = "RabbitMQ doesn't support publishing in batches."
-        raise FeatureNotSupportedException(msg)
+    @abstractmethod
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"] | Exception]: ...
 
 
 class FakeAioPikaFastProducer(AioPikaFastProducer):
@@ -83,7 +91,7 @@ class FakeAioPikaFastProducer(AioPikaFastProducer):
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
         raise NotImplementedError
 
-    def disconnect(self) -> None:
+    async def disconnect(self) -> None:
         raise NotImplementedError
 
     @override
@@ -93,6 +101,13 @@ class FakeAioPikaFastProducer(AioPikaFastProducer):
     ) -> Optional["aiormq.abc.ConfirmationFrameType"]:
         raise NotImplementedError
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"] | Exception]:
+        raise NotImplementedError
+
     @override
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage":
         raise NotImplementedError
@@ -110,10 +125,12 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         declarer: "RabbitDeclarer",
         parser: Optional["CustomCallable"],
         decoder: Optional["CustomCallable"],
+        publishing_pool: Optional["PublishingChannelPool"] = None,
     ) -> None:
         self.declarer = declarer
+        self.publishing_pool = publishing_pool
 
-        self.__lock: LockState = LockUnset()
+        self.__rpc: RPCState = RPCUnset()
         self.serializer: SerializerProto | None = None
 
         default_parser = AioPikaParser()
@@ -121,21 +138,27 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         self._decoder = ParserComposition(decoder, default_parser.decode_message)
 
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
-        """Lock initialization.
+        """RPC state initialization.
 
         Should be called in async context due `anyio.Lock` object can't be created outside event loop.
         """
         self.serializer = serializer
-        self.__lock = RealLock()
+        self.__rpc = RealRPC()
 
-    def disconnect(self) -> None:
-        self.__lock = LockUnset()
+    async def disconnect(self) -> None:
+        rpc, self.__rpc = self.__rpc, RPCUnset()
+        if isinstance(rpc, RealRPC):
+            # reply-to consumer should be cancelled before the channel is closed
+            await rpc.rpc.stop()
 
     @override
     async def publish(
         self,
         cmd: "RabbitPublishCommand",
     ) -> Optional["aiormq.abc.ConfirmationFrameType"]:
+        if self.publishing_pool is not None:
+            return await self._publish_pooled(cmd, self.publishing_pool)
+
         return await self._publish(
             message=cmd.body,
             exchange=cmd.exchange,
@@ -147,12 +170,69 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
             **cmd.message_options,
         )
 
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"] | Exception]:
+        """Publish messages back to back and await their confirmations together.
+
+        Returns a confirmation frame (or an error) per message in the same order,
+        so the caller can retry failed messages only.
+        """
+        exchange_obj = await self.declarer.declare_exchange(
+            exchange=cmd.exchange,
+            declare=False,
+        )
+
+        results: list[aiormq.abc.ConfirmationFrameType | Exception | None] = []
+        in_flight: deque[asyncio.Future[aiormq.abc.ConfirmationFrameType | None]]
+        in_flight = deque()
+
+        try:
+            for body in cmd.batch_bodies:
+                message = AioPikaParser.encode_message(
+                    message=body,
+                    serializer=self.serializer,
+                    reply_to=cmd.reply_to,
+                    headers=cmd.headers,
+                    correlation_id=cmd.correlation_id or gen_cor_id(),
+                    **cmd.message_options,
+                )
+
+                # channel lock keeps publishes order, confirmations are pipelined
+                in_flight.append(
+                    asyncio.ensure_future(
+                        exchange_obj.publish(
+                            message=message,
+                            routing_key=cmd.destination,
+                            mandatory=cmd.publish_options.get("mandatory", True),
+                            immediate=cmd.publish_options.get("immediate", False),
+                            timeout=cmd.timeout,
+                        ),
+                    ),
+                )
+
+                if len(in_flight) >= CONFIRM_WINDOW:
+                    results.append(await _confirmation(in_flight.popleft()))
+
+            while in_flight:
+                results.append(await _confirmation(in_flight.popleft()))
+
+        finally:
+            for fut in in_flight:
+                fut.cancel()
+
+        return results
+
     @override
     async def request(self, cmd: "RabbitPublishCommand") -> "IncomingMessage":
-        async with _RPCCallback(
-            self.__lock.lock,
-            await self.declarer.declare_queue(RABBIT_REPLY),
-        ) as response_queue:
+        rpc = self.__rpc.rpc
+        await rpc.start(await self.declarer.declare_queue(RABBIT_REPLY))
+
+        correlation_id = cmd.correlation_id or gen_cor_id()
+
+        with rpc.wait_response(correlation_id) as response_queue:
             with anyio.fail_after(cmd.timeout):
                 await self._publish(
                     message=cmd.body,
@@ -160,12 +240,42 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
                     routing_key=cmd.destination,
                     reply_to=RABBIT_REPLY.name,
                     headers=cmd.headers,
-                    correlation_id=cmd.correlation_id,
+                    correlation_id=correlation_id,
                     **cmd.publish_options,
                     **cmd.message_options,
                 )
                 return await response_queue.receive()
 
+    async def _publish_pooled(
+        self,
+        cmd: "RabbitPublishCommand",
+        pool: "PublishingChannelPool",
+    ) -> Optional["aiormq.abc.ConfirmationFrameType"]:
+        message = AioPikaParser.encode_message(
+            message=cmd.body,
+            serializer=self.serializer,
+            reply_to=cmd.reply_to,
+            headers=cmd.headers,
+            correlation_id=cmd.correlation_id,
+            **cmd.message_options,
+        )
+
+        if cmd.exchange.name:
+            # make sure the exchange exists, it is cached after the first check
+            await self.declarer.declare_exchange(exchange=cmd.exchange, declare=False)
+
+        async with pool.acquire() as channel:
+            underlay_channel = await channel.get_underlay_channel()
+            return await underlay_channel.basic_publish(
+                message.body,
+                exchange=cmd.exchange.name,
+                routing_key=cmd.destination,
+                properties=message.properties,
+                mandatory=cmd.publish_options.get("mandatory", True),
+                immediate=cmd.publish_options.get("immediate", False),
+                timeout=cmd.timeout,
+            )
+
     async def _publish(
         self,
         message: "AioPikaSendableMessage",
@@ -195,38 +305,89 @@ class AioPikaFastProducerImpl(AioPikaFastProducer):
         )
 
 
-class _RPCCallback:
-    """A class provides an RPC lock."""
+async def _confirmation(future: Awaitable[Any]) -> Any:
+    try:
+        return await future
+    except Exception as e:
+        return e
+
 
-    def __init__(self, lock: "anyio.Lock", callback_queue: "RobustQueue") -> None:
-        self.lock = lock
-        self.queue = callback_queue
+class _RPCMultiplexer:
+    """Shared `amq.rabbitmq.reply-to` consumer.
 
-    async def __aenter__(self) -> "MemoryObjectReceiveStream[IncomingMessage]":
-        send_response_stream: MemoryObjectSendStream[AbstractIncomingMessage]
-        receive_response_stream: MemoryObjectReceiveStream[AbstractIncomingMessage]
+    Starts a single consumer on the first request and routes responses
+    to waiting requests by `correlation_id`, so requests are not serialized.
+    A response with an unknown `correlation_id` is passed to the only
+    waiting request, if there is one, and dropped otherwise.
+    """
+
+    __slots__ = ("_consumer_tag", "_lock", "_queue", "_responses")
+
+    def __init__(self) -> None:
+        self._lock = anyio.Lock()
+        self._queue: RobustQueue | None = None
+        self._consumer_tag: str | None = None
+        self._responses: dict[str, MemoryObjectSendStream[IncomingMessage]] = {}
+
+    async def start(self, callback_queue: "RobustQueue") -> None:
+        if self._consumer_tag is not None:
+            return
+
+        async with self._lock:
+            if self._consumer_tag is None:
+                self._consumer_tag = await callback_queue.consume(
+                    callback=self._on_response,
+                    no_ack=True,
+                )
+                self._queue = callback_queue
+
+    async def stop(self) -> None:
+        if self._queue is not None:
+            if self._consumer_tag is not None:  # pragma: no branch
+                if not self._queue.channel.is_closed:
+                    await self._queue.cancel(self._consumer_tag)
+                self._consumer_tag = None
+
+            self._queue = None
+
+    async def _on_response(self, message: "AbstractIncomingMessage") -> None:
+        correlation_id = message.correlation_id
+
+        if correlation_id is None or correlation_id not in self._responses:
+            # responder did not echo `correlation_id`, so it can be matched
+            # to the request only if the request is the only one waiting
+            if len(self._responses) != 1:
+                # late response for a timed out request or ambiguous one
+                return
+
+            (correlation_id,) = self._responses
+
+        stream = self._responses.pop(correlation_id)
+        stream.send_nowait(cast("IncomingMessage", message))
+
+    @contextmanager
+    def wait_response(
+        self,
+        correlation_id: str,
+    ) -> Iterator["MemoryObjectReceiveStream[IncomingMessage]"]:
+        if correlation_id in self._responses:
+            msg = f"Request with `correlation_id={correlation_id}` is already in flight."
+            raise IncorrectState(msg)
+
+        send_response_stream: MemoryObjectSendStream[IncomingMessage]
+        receive_response_stream: MemoryObjectReceiveStream[IncomingMessage]
 
         (
             send_response_stream,
             receive_response_stream,
         ) = anyio.create_memory_object_stream(max_buffer_size=1)
-        await self.lock.acquire()
 
-        self.consumer_tag = await self.queue.consume(
-            callback=send_response_stream.send,
-            no_ack=True,
-        )
+        self._responses[correlation_id] = send_response_stream
 
-        return cast(
-            "MemoryObjectReceiveStream[IncomingMessage]",
-            receive_response_stream,
-        )
+        try:
+            yield receive_response_stream
 
-    async def __aexit__(
-        self,
-        exc_type: type[BaseException] | None = None,
-        exc_val: BaseException | None = None,
-        exc_tb: Optional["TracebackType"] = None,
-    ) -> None:
-        self.lock.release()
-        await self.queue.cancel(self.consumer_tag)
+        finally:
+            self._responses.pop(correlation_id, None)
+            send_response_stream.close()
+            receive_response_stream.close()
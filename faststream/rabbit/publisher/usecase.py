@@ -99,7 +99,7 @@ class RabbitPublisher(PublisherUsecase):
         else:
             headers = self.headers
 
-        correlation_id = publish_kwargs.pop("correlation_id", gen_cor_id())
+        correlation_id = publish_kwargs.pop("correlation_id", None) or gen_cor_id()
 
         cmd = RabbitPublishCommand(
             message,
@@ -118,6 +118,45 @@ class RabbitPublisher(PublisherUsecase):
         )
         return frame
 
+    async def publish_batch(
+        self,
+        *messages: "AioPikaSendableMessage",
+        queue: Union["RabbitQueue", str, None] = None,
+        exchange: Union["RabbitExchange", str, None] = None,
+        routing_key: str = "",
+        **publish_kwargs: "Unpack[PublishKwargs]",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"] | Exception]:
+        """Publish many messages with pipelined publisher confirms.
+
+        Returns a confirmation frame or a publishing error per message.
+        """
+        if "headers" in publish_kwargs:
+            headers = self.headers | (publish_kwargs.pop("headers") or {})
+        else:
+            headers = self.headers
+
+        # every message gets its own correlation_id unless it is set explicitly
+        correlation_id = publish_kwargs.pop("correlation_id", None)
+
+        cmd = RabbitPublishCommand(
+            messages[0] if messages else None,
+            messages=messages[1:],
+            routing_key=self.routing(queue=queue, routing_key=routing_key),
+            exchange=RabbitExchange.validate(exchange or self.exchange),
+            headers=headers,
+            correlation_id=correlation_id,
+            _publish_type=PublishType.PUBLISH,
+            **(self.publish_options | self.message_options | publish_kwargs),  # type: ignore[operator]
+        )
+
+        result: list[aiormq.abc.ConfirmationFrameType | Exception | None]
+        result = await self._basic_publish_batch(
+            cmd,
+            producer=self._outer_config.producer,
+            _extra_middlewares=(),
+        )
+        return result
+
     @override
     async def _publish(
         self,
@@ -158,7 +197,7 @@ class RabbitPublisher(PublisherUsecase):
         else:
             headers = self.headers
 
-        correlation_id = publish_kwargs.pop("correlation_id", gen_cor_id())
+        correlation_id = publish_kwargs.pop("correlation_id", None) or gen_cor_id()
 
         cmd = RabbitPublishCommand(
             message,
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Union
 
 from typing_extensions import Unpack, override
@@ -5,6 +6,7 @@ from typing_extensions import Unpack, override
 from faststream.rabbit.schemas.exchange import RabbitExchange
 from faststream.response import PublishCommand, Response
 from faststream.response.publish_type import PublishType
+from faststream.response.response import BatchPublishCommand
 
 if TYPE_CHECKING:
     from aio_pika.abc import TimeoutType
@@ -46,7 +48,7 @@ class RabbitResponse(Response):
     @override
     def as_publish_command(self) -> "RabbitPublishCommand":
         return RabbitPublishCommand(
-            message=self.body,
+            self.body,
             headers=self.headers,
             correlation_id=self.correlation_id,
             _publish_type=PublishType.PUBLISH,
@@ -56,11 +58,12 @@ class RabbitResponse(Response):
         )
 
 
-class RabbitPublishCommand(PublishCommand):
+class RabbitPublishCommand(BatchPublishCommand):
     def __init__(
         self,
         message: "AioPikaSendableMessage",
         *,
+        messages: Sequence["AioPikaSendableMessage"] = (),
         _publish_type: PublishType,
         routing_key: str = "",
         exchange: RabbitExchange | None = None,
@@ -75,7 +78,8 @@ class RabbitPublishCommand(PublishCommand):
         correlation_id = message_options.pop("correlation_id", None)
 
         super().__init__(
-            body=message,
+            message,
+            *messages,
             destination=routing_key,
             correlation_id=correlation_id,
             headers=headers,
@@ -96,13 +100,18 @@ class RabbitPublishCommand(PublishCommand):
     def from_cmd(
         cls,
         cmd: Union["PublishCommand", "RabbitPublishCommand"],
+        *,
+        batch: bool = False,
     ) -> "RabbitPublishCommand":
         if isinstance(cmd, RabbitPublishCommand):
             # NOTE: Should return a copy probably.
             return cmd
 
+        body, extra_bodies = cls._parse_bodies(cmd.body, batch=batch)
+
         return cls(
-            message=cmd.body,
+            body,
+            messages=extra_bodies,
             routing_key=cmd.destination,
             correlation_id=cmd.correlation_id,
             headers=cmd.headers,
@@ -212,8 +212,26 @@ class FakeProducer(AioPikaFastProducer):
         cmd: "RabbitPublishCommand",
     ) -> None:
         """Publish a message to a RabbitMQ queue or exchange."""
+        await self._publish_body(cmd, cmd.body)
+
+    @override
+    async def publish_batch(
+        self,
+        cmd: "RabbitPublishCommand",
+    ) -> list[Optional["aiormq.abc.ConfirmationFrameType"] | Exception]:
+        """Publish batch messages to a RabbitMQ queue or exchange one by one."""
+        bodies = cmd.batch_bodies
+        for body in bodies:
+            await self._publish_body(cmd, body)
+        return [None] * len(bodies)
+
+    async def _publish_body(
+        self,
+        cmd: "RabbitPublishCommand",
+        body: "AioPikaSendableMessage",
+    ) -> None:
         incoming = build_message(
-            message=cmd.body,
+            message=body,
             exchange=cmd.exchange,
             routing_key=cmd.destination,
             correlation_id=cmd.correlation_id,
@@ -10,7 +10,7 @@ try:
         RedisStreamMessage,
     )
     from .broker import RedisBroker, RedisPublisher, RedisRoute, RedisRouter
-    from .parser import BinaryMessageFormatV1, JSONMessageFormat
+    from .parser import BinaryMessageFormatV1, BinaryMessageFormatV2, JSONMessageFormat
     from .response import RedisPublishCommand, RedisResponse
     from .schemas import ListSub, PubSub, StreamSub
     from .testing import TestRedisBroker
@@ -25,6 +25,7 @@ except ImportError as e:
 
 __all__ = (
     "BinaryMessageFormatV1",
+    "BinaryMessageFormatV2",
     "JSONMessageFormat",
     "ListSub",
     "Pipeline",
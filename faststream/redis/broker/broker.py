@@ -177,12 +177,37 @@ class RedisBroker(
             int,
             Doc("Service messages log level."),
         ] = logging.INFO,
+        log_sample_ratio: Annotated[
+            float,
+            Doc(
+                "Fraction of messages to write `Received` and `Processed` records for. Errors are always logged."
+            ),
+        ] = 1.0,
+        log_rate_limit: Annotated[
+            int | None,
+            Doc(
+                "Maximum number of messages per second to write `Received` and `Processed` records for."
+            ),
+        ] = None,
+        log_in_background: Annotated[
+            bool,
+            Doc(
+                "Whether to write per-message records from a background thread instead of the event loop."
+            ),
+        ] = False,
         # FastDepends args
         apply_types: Annotated[
             bool,
             Doc("Whether to use FastDepends or not."),
         ] = True,
         serializer: Optional["SerializerProto"] = EMPTY,
+        decode_to_model: Annotated[
+            bool,
+            Doc(
+                "Whether to decode JSON messages right into the handler's pydantic model "
+                "or msgspec Struct argument, skipping the intermediate `dict`."
+            ),
+        ] = False,
     ) -> None:
         if message_format == JSONMessageFormat:
             warnings.warn(
@@ -246,10 +271,14 @@ class RedisBroker(
                 logger=make_redis_logger_state(
                     logger=logger,
                     log_level=log_level,
+                    sample_ratio=log_sample_ratio,
+                    rate_limit=log_rate_limit,
+                    in_background=log_in_background,
                 ),
                 fd_config=FastDependsConfig(
                     use_fastdepends=apply_types,
                     serializer=serializer,
+                    decode_to_model=decode_to_model,
                 ),
                 # subscriber args
                 broker_dependencies=dependencies,
@@ -460,6 +460,9 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             ),
         ] = (),
         message_format: type["MessageFormat"] | None = None,
+        linger_ms: float | None = None,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1024 * 1024,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -484,6 +487,9 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             ),
         ] = (),
         message_format: type["MessageFormat"] | None = None,
+        linger_ms: float | None = None,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1024 * 1024,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -508,6 +514,9 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             ),
         ] = (),
         message_format: type["MessageFormat"] | None = None,
+        linger_ms: float | None = None,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1024 * 1024,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -532,6 +541,9 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             ),
         ] = (),
         message_format: type["MessageFormat"] | None = None,
+        linger_ms: float | None = None,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1024 * 1024,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -556,6 +568,9 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             ),
         ] = (),
         message_format: type["MessageFormat"] | None = None,
+        linger_ms: float | None = None,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1024 * 1024,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -580,6 +595,9 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             ),
         ] = (),
         message_format: type["MessageFormat"] | None = None,
+        linger_ms: float | None = None,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1024 * 1024,
         # AsyncAPI information
         title: str | None = None,
         description: str | None = None,
@@ -602,6 +620,10 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             reply_to: Reply message destination PubSub object name.
             middlewares: Publisher middlewares to wrap outgoing messages.
             message_format: Which format to use when parsing messages.
+            linger_ms: Time to wait for concurrent `publish` calls to send them
+                by a single Redis pipeline. Messages are sent one by one if not set.
+            max_batch_size: Max number of messages to collect during `linger_ms`.
+            max_batch_bytes: Max size of messages to collect during `linger_ms`.
             title: AsyncAPI publisher object title.
             description: AsyncAPI publisher object description.
             schema: AsyncAPI publishing message type. Should be any python-native
@@ -618,6 +640,9 @@ class RedisRegistrator(Registrator[UnifyRedisDict, RedisBrokerConfig]):
             config=cast("RedisBrokerConfig", self.config),
             middlewares=middlewares,
             message_format=message_format,
+            linger_ms=linger_ms,
+            max_batch_size=max_batch_size,
+            max_batch_bytes=max_batch_bytes,
             # AsyncAPI
             title_=title,
             description_=description,
@@ -0,0 +1,3 @@
+from .ack_buffer import StreamAckBuffer
+
+__all__ = ("StreamAckBuffer",)
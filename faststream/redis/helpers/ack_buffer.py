@@ -0,0 +1,53 @@
+from collections import defaultdict
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from redis.asyncio.client import Redis
+
+
+class StreamAckBuffer:
+    """Collects stream message ids to acknowledge them by pipelined `XACK` calls.
+
+    Ids are grouped by stream and consumer group, so each flush sends a single
+    `XACK` with all buffered ids per pair.
+    """
+
+    __slots__ = ("_pending", "_size", "max_size", "redis")
+
+    def __init__(self, redis: "Redis[bytes]", *, max_size: int) -> None:
+        self.redis = redis
+        self.max_size = max_size
+
+        self._pending: defaultdict[tuple[str, str], list[bytes]] = defaultdict(list)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    async def add(self, stream: str, group: str, ids: Sequence[bytes]) -> None:
+        self._pending[stream, group].extend(ids)
+        self._size += len(ids)
+
+        if self._size >= self.max_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, defaultdict(list)
+        self._size = 0
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for (stream, group), ids in pending.items():
+                    pipe.xack(stream, group, *ids)
+                await pipe.execute()
+
+        except Exception:
+            # keep ids to retry them by the next flush
+            for key, ids in pending.items():
+                self._pending[key].extend(ids)
+                self._size += len(ids)
+            raise
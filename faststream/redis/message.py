@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from redis.asyncio import Redis
 
     from faststream._internal.basic_types import DecodedMessage
+    from faststream.redis.helpers import StreamAckBuffer
 
 
 BaseMessage: TypeAlias = Union[
@@ -115,11 +116,17 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
         self,
         redis: Optional["Redis[bytes]"] = None,
         group: str | None = None,
+        ack_buffer: Optional["StreamAckBuffer"] = None,
     ) -> None:
-        if not self.committed and group is not None and redis is not None:
+        if not self.committed and group is not None:
             ids = self.raw_message["message_ids"]
             channel = self.raw_message["channel"]
-            await redis.xack(channel, group, *ids)  # type: ignore[no-untyped-call]
+
+            if ack_buffer is not None:
+                await ack_buffer.add(channel, group, ids)
+            elif redis is not None:
+                await redis.xack(channel, group, *ids)  # type: ignore[no-untyped-call]
+
         await super().ack()
 
     @override
@@ -127,6 +134,7 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
         self,
         redis: Optional["Redis[bytes]"] = None,
         group: str | None = None,
+        ack_buffer: Optional["StreamAckBuffer"] = None,
     ) -> None:
         await super().nack()
 
@@ -135,6 +143,7 @@ class _RedisStreamMessageMixin(BrokerStreamMessage[_StreamMsgType]):
         self,
         redis: Optional["Redis[bytes]"] = None,
         group: str | None = None,
+        ack_buffer: Optional["StreamAckBuffer"] = None,
     ) -> None:
         await super().reject()
 
@@ -13,11 +13,15 @@ class RedisTelemetryMiddleware(TelemetryMiddleware[RedisPublishCommand]):
         tracer_provider: TracerProvider | None = None,
         meter_provider: MeterProvider | None = None,
         meter: Meter | None = None,
+        metrics_export_interval: float | None = None,
+        traces_sample_ratio: float = 1.0,
     ) -> None:
         super().__init__(
             settings_provider_factory=lambda _: RedisTelemetrySettingsProvider(),
             tracer_provider=tracer_provider,
             meter_provider=meter_provider,
             meter=meter,
+            metrics_export_interval=metrics_export_interval,
+            traces_sample_ratio=traces_sample_ratio,
             include_messages_counters=True,
         )
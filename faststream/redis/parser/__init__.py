@@ -1,4 +1,4 @@
-from .binary import BinaryMessageFormatV1
+from .binary import BinaryMessageFormatV1, BinaryMessageFormatV2
 from .json import JSONMessageFormat
 from .message import MessageFormat
 from .parsers import (
@@ -13,6 +13,7 @@ from .parsers import (
 
 __all__ = (
     "BinaryMessageFormatV1",
+    "BinaryMessageFormatV2",
     "JSONMessageFormat",
     "MessageFormat",
     "ParserConfig",
@@ -1,6 +1,6 @@
 import enum
 from collections.abc import Sequence
-from struct import pack, unpack
+from struct import pack, unpack, unpack_from
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from faststream._internal._compat import json_loads
@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 class FastStreamMessageVersion(int, enum.Enum):
     v1 = 1
+    v2 = 2
 
 
 class BinaryMessageFormatV1(MessageFormat):
@@ -68,6 +69,13 @@ class BinaryMessageFormatV1(MessageFormat):
             message_version = reader.read_short()
 
             if (
+                magic_header == cls.IDENTITY_HEADER
+                and message_version == FastStreamMessageVersion.v2.value
+            ):
+                body, headers = BinaryMessageFormatV2.parse(data)
+                final_data = bytes(body)
+
+            elif (
                 magic_header == cls.IDENTITY_HEADER
                 and message_version == FastStreamMessageVersion.v1.value
             ):
@@ -96,6 +104,103 @@ class BinaryMessageFormatV1(MessageFormat):
         return final_data, headers
 
 
+class BinaryMessageFormatV2(MessageFormat):
+    """Binary message format parsed without copying the message data.
+
+    All headers lengths are stored in a single table right after the metadata,
+    so the whole layout is read by one `struct.unpack_from` call and the parsed
+    body is a `memoryview` over the received message.
+    """
+
+    IDENTITY_HEADER = BinaryMessageFormatV1.IDENTITY_HEADER
+
+    # identity header, version, number of headers, data offset
+    METADATA = ">8sHHI"
+    METADATA_SIZE = 16
+
+    @classmethod
+    def encode(
+        cls,
+        *,
+        message: Union[Sequence["SendableMessage"], "SendableMessage"],
+        reply_to: str | None,
+        headers: dict[str, Any] | None,
+        correlation_id: str,
+        serializer: Optional["SerializerProto"] = None,
+    ) -> bytes:
+        msg = cls.build(
+            message=message,
+            reply_to=reply_to,
+            headers=headers,
+            correlation_id=correlation_id,
+            serializer=serializer,
+        )
+
+        headers_parts = [
+            x if isinstance(x, bytes) else x.encode()
+            for item in msg.headers.items()
+            for x in item
+        ]
+        lengths = [len(x) for x in headers_parts]
+
+        data_start = cls.METADATA_SIZE + 2 * len(lengths) + sum(lengths)
+        metadata = pack(
+            f"{cls.METADATA}{len(lengths)}H",
+            cls.IDENTITY_HEADER,
+            FastStreamMessageVersion.v2.value,
+            len(msg.headers),
+            data_start,
+            *lengths,
+        )
+        return b"".join((metadata, *headers_parts, msg.data))
+
+    @classmethod
+    def parse(cls, data: bytes) -> tuple[bytes | memoryview, dict[str, Any]]:
+        try:
+            magic_header, message_version, headers_count, data_start = unpack_from(
+                cls.METADATA, data
+            )
+        except Exception:
+            # Raw Redis message format
+            return data, {}
+
+        if (
+            magic_header != cls.IDENTITY_HEADER
+            or message_version != FastStreamMessageVersion.v2.value
+        ):
+            # previous formats
+            return BinaryMessageFormatV1.parse(data)
+
+        view = memoryview(data)
+        try:
+            lengths = unpack_from(f">{2 * headers_count}H", view, cls.METADATA_SIZE)
+            headers_start = cls.METADATA_SIZE + 4 * headers_count
+
+            headers_view = view[headers_start:data_start]
+            headers_block = str(headers_view, "utf-8")
+            if len(headers_block) == len(headers_view):
+                # ASCII-only headers can be sliced by bytes lengths
+                parts = _split(headers_block, lengths)
+            else:
+                parts = [str(x, "utf-8") for x in _split(headers_view, lengths)]
+
+        except Exception:
+            # Raw Redis message format
+            return data, {}
+
+        headers = dict(zip(parts[::2], parts[1::2], strict=True))
+        return view[data_start:], headers
+
+
+def _split(data: Any, lengths: Sequence[int]) -> list[Any]:
+    parts = []
+    offset = 0
+    for length in lengths:
+        parts.append(data[offset : offset + length])
+        offset += length
+    return parts
+
+
 class BinaryWriter:
     def __init__(self) -> None:
         self.data = bytearray()
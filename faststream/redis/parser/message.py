@@ -71,5 +71,5 @@ class MessageFormat(ABC):
 
     @classmethod
     @abstractmethod
-    def parse(cls, data: bytes) -> tuple[bytes, dict[str, Any]]:
+    def parse(cls, data: bytes) -> tuple[bytes | memoryview, dict[str, Any]]:
         raise NotImplementedError
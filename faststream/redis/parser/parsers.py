@@ -5,7 +5,7 @@ from typing import TYPE_CHECKING, Any, Optional, Protocol
 from faststream._internal._compat import dump_json, json_loads
 from faststream._internal.basic_types import DecodedMessage
 from faststream._internal.constants import EMPTY, ContentTypes
-from faststream.message import decode_message, gen_cor_id
+from faststream.message import decode_message
 from faststream.redis.message import (
     RedisBatchListMessage,
     RedisBatchStreamMessage,
@@ -50,8 +50,6 @@ class SimpleParser:
     ) -> "StreamMessage[Mapping[str, Any]]":
         data, headers, batch_headers = self._parse_data(message)
 
-        id_ = gen_cor_id()
-
         return self.msg_class(
             raw_message=message,
             body=data,
@@ -60,14 +58,14 @@ class SimpleParser:
             batch_headers=batch_headers,
             reply_to=headers.get("reply_to", ""),
             content_type=headers.get("content-type"),
-            message_id=headers.get("message_id", id_),
-            correlation_id=headers.get("correlation_id", id_),
+            message_id=headers.get("message_id"),
+            correlation_id=headers.get("correlation_id"),
         )
 
     def _parse_data(
         self,
         message: Mapping[str, Any],
-    ) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
+    ) -> tuple[bytes | memoryview, dict[str, Any], list[dict[str, Any]]]:
         return (*self.config.message_format.parse(message["data"]), [])
 
     def get_path(self, message: Mapping[str, Any]) -> dict[str, Any]:
@@ -101,7 +99,7 @@ class RedisBatchListParser(SimpleParser):
     def _parse_data(
         self,
         message: Mapping[str, Any],
-    ) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
+    ) -> tuple[bytes | memoryview, dict[str, Any], list[dict[str, Any]]]:
         body: list[Any] = []
         batch_headers: list[dict[str, Any]] = []
 
@@ -128,7 +126,7 @@ class RedisStreamParser(SimpleParser):
     def _parse_data(
         self,
         message: Mapping[str, Any],
-    ) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
+    ) -> tuple[bytes | memoryview, dict[str, Any], list[dict[str, Any]]]:
         data = message["data"]
         return (
             *self.config.message_format.parse(data.get(bDATA_KEY) or dump_json(data)),
@@ -142,7 +140,7 @@ class RedisBatchStreamParser(SimpleParser):
     def _parse_data(
         self,
         message: Mapping[str, Any],
-    ) -> tuple[bytes, dict[str, Any], list[dict[str, Any]]]:
+    ) -> tuple[bytes | memoryview, dict[str, Any], list[dict[str, Any]]]:
         body: list[Any] = []
         batch_headers: list[dict[str, Any]] = []
 
@@ -171,6 +169,10 @@ def _decode_batch_body_item(
     msg_content: bytes, message_format: type["MessageFormat"]
 ) -> tuple[Any, dict[str, Any]]:
     msg_body, headers = message_format.parse(msg_content)
+    if isinstance(msg_body, memoryview):
+        # batch body is serialized again, so there is nothing to save
+        msg_body = bytes(msg_body)
+
     try:
         return json_loads(msg_body), headers
     except Exception:
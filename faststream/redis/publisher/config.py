@@ -24,6 +24,10 @@ class RedisPublisherConfig(PublisherUsecaseConfig):
 
     _message_format: type["MessageFormat"] | None = None
 
+    linger_ms: float | None = None
+    max_batch_size: int = 100
+    max_batch_bytes: int = 1024 * 1024
+
     @property
     def message_format(self) -> type["MessageFormat"]:
         return self._message_format or self._outer_config.message_format
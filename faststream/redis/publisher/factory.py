@@ -40,6 +40,9 @@ def create_publisher(
     config: "RedisBrokerConfig",
     middlewares: Sequence["PublisherMiddleware"],
     message_format: type["MessageFormat"] | None,
+    linger_ms: float | None,
+    max_batch_size: int,
+    max_batch_bytes: int,
     # AsyncAPI args
     title_: str | None,
     description_: str | None,
@@ -61,6 +64,9 @@ def create_publisher(
         headers=headers,
         middlewares=middlewares,
         _message_format=message_format,
+        linger_ms=linger_ms,
+        max_batch_size=max_batch_size,
+        max_batch_bytes=max_batch_bytes,
         _outer_config=config,
     )
 
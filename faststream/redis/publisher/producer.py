@@ -1,4 +1,7 @@
-from typing import TYPE_CHECKING, Any, Optional, cast
+import asyncio
+from collections.abc import Coroutine, Iterator
+from contextlib import contextmanager, suppress
+from typing import TYPE_CHECKING, Any, Optional, TypeAlias, Union, cast
 
 import anyio
 from typing_extensions import override
@@ -6,12 +9,15 @@ from typing_extensions import override
 from faststream._internal.endpoint.utils import ParserComposition
 from faststream._internal.producer import ProducerProto
 from faststream._internal.utils.nuid import NUID
+from faststream.exceptions import IncorrectState
 from faststream.redis.message import DATA_KEY
 from faststream.redis.parser import RedisPubSubParser, SimpleParserConfig
 from faststream.redis.response import DestinationType, RedisPublishCommand
 
 if TYPE_CHECKING:
+    from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
     from fast_depends.library.serializer import SerializerProto
+    from redis.asyncio.client import Pipeline, PubSub, Redis
 
     from faststream._internal.types import CustomCallable
     from faststream.redis.configs import ConnectionState
@@ -31,6 +37,10 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
         decoder: Optional["CustomCallable"],
         message_format: type["MessageFormat"],
         serializer: Optional["SerializerProto"],
+        linger_ms: float | None = None,
+        max_batch_size: int = 100,
+        max_batch_bytes: int = 1024 * 1024,
+        rpc_producer: Optional["RedisFastProducer"] = None,
     ) -> None:
         self._connection = connection
 
@@ -45,6 +55,19 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
         )
         self.serializer = serializer
 
+        self._rpc: _RPCMultiplexer | None = None
+        # publisher producers share the reply subscription of the broker one
+        self._rpc_producer = rpc_producer
+
+        self._batcher: _PublishBatcher | None = None
+        if linger_ms is not None:
+            self._batcher = _PublishBatcher(
+                connection,
+                linger_ms=linger_ms,
+                max_batch_size=max_batch_size,
+                max_batch_bytes=max_batch_bytes,
+            )
+
     @override
     async def publish(self, cmd: "RedisPublishCommand") -> int | bytes:
         msg = cmd.message_format.encode(
@@ -55,45 +78,29 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
             serializer=self.serializer,
         )
 
+        if self._batcher is not None and cmd.pipeline is None:
+            return await self._batcher.publish(msg, cmd)
+
         return await self.__publish(msg, cmd)
 
     @override
     async def request(self, cmd: "RedisPublishCommand") -> "Any":
-        nuid = NUID()
-        reply_to = str(nuid.next(), "utf-8")
-        psub = self._connection.client.pubsub()
-        await psub.subscribe(reply_to)
-
-        msg = cmd.message_format.encode(
-            message=cmd.body,
-            reply_to=reply_to,
-            headers=cmd.headers,
-            correlation_id=cmd.correlation_id or "",
-            serializer=self.serializer,
-        )
+        rpc = self._get_rpc()
+        await rpc.start(self._connection.client)
 
-        await self.__publish(msg, cmd)
-
-        with anyio.fail_after(cmd.timeout) as scope:
-            # skip subscribe message
-            await psub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=cmd.timeout or 0.0,
-            )
-
-            # get real response
-            response_msg = await psub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=cmd.timeout or 0.0,
+        with rpc.wait_response() as (reply_to, response_stream):
+            msg = cmd.message_format.encode(
+                message=cmd.body,
+                reply_to=reply_to,
+                headers=cmd.headers,
+                correlation_id=cmd.correlation_id or "",
+                serializer=self.serializer,
             )
 
-        await psub.unsubscribe()
-        await psub.aclose()  # type: ignore[attr-defined]
+            await self.__publish(msg, cmd)
 
-        if scope.cancel_called:
-            raise TimeoutError
-
-        return response_msg
+            with anyio.fail_after(cmd.timeout):
+                return await response_stream.receive()
 
     @override
     async def publish_batch(self, cmd: "RedisPublishCommand") -> int:
@@ -117,25 +124,270 @@ class RedisFastProducer(ProducerProto[RedisPublishCommand]):
         cmd: "RedisPublishCommand",
     ) -> int | bytes:
         connection = cmd.pipeline or self._connection.client
+        return await _send_message(connection, msg, cmd)
 
-        if cmd.destination_type is DestinationType.Channel:
-            return await connection.publish(cmd.destination, msg)
-
-        if cmd.destination_type is DestinationType.List:
-            return await connection.rpush(cmd.destination, msg)
+    def _get_rpc(self) -> "_RPCMultiplexer":
+        if self._rpc_producer is not None:
+            return self._rpc_producer._get_rpc()
 
-        if cmd.destination_type is DestinationType.Stream:
-            return cast(
-                "bytes",
-                await connection.xadd(
-                    name=cmd.destination,
-                    fields={DATA_KEY: msg},
-                    maxlen=cmd.maxlen,
-                ),
-            )
+        if self._rpc is None:
+            error_msg = "You should call `producer.connect()` method at first."
+            raise IncorrectState(error_msg)
 
-        error_msg = "unreachable"
-        raise AssertionError(error_msg)
+        return self._rpc
 
     def connect(self, serializer: Optional["SerializerProto"] = None) -> None:
         self.serializer = serializer
+        self._rpc = _RPCMultiplexer()
+
+    async def disconnect(self) -> None:
+        if self._batcher is not None:
+            await self._batcher.close()
+
+        if self._rpc is not None:
+            await self._rpc.stop()
+            self._rpc = None
+
+
+async def _send_message(
+    connection: Union["Redis[bytes]", "Pipeline[bytes]"],
+    msg: bytes,
+    cmd: "RedisPublishCommand",
+) -> int | bytes:
+    if cmd.destination_type is DestinationType.Channel:
+        return await connection.publish(cmd.destination, msg)
+
+    if cmd.destination_type is DestinationType.List:
+        return await connection.rpush(cmd.destination, msg)
+
+    if cmd.destination_type is DestinationType.Stream:
+        return cast(
+            "bytes",
+            await connection.xadd(
+                name=cmd.destination,
+                fields={DATA_KEY: msg},
+                maxlen=cmd.maxlen,
+            ),
+        )
+
+    error_msg = "unreachable"
+    raise AssertionError(error_msg)
+
+
+_BatchItem: TypeAlias = tuple[bytes, RedisPublishCommand, "asyncio.Future[Any]"]
+
+
+class _PublishBatcher:
+    """Collects concurrent `publish()` calls to send them by a single pipeline.
+
+    A batch is sent after `linger_ms` since its first message or as soon as
+    it reaches `max_batch_size` messages or `max_batch_bytes` bytes.
+    Every caller gets the result of its own command.
+    """
+
+    __slots__ = (
+        "_batch",
+        "_batch_bytes",
+        "_connection",
+        "_linger_task",
+        "_lock",
+        "_tasks",
+        "linger",
+        "max_batch_bytes",
+        "max_batch_size",
+    )
+
+    def __init__(
+        self,
+        connection: "ConnectionState",
+        *,
+        linger_ms: float,
+        max_batch_size: int,
+        max_batch_bytes: int,
+    ) -> None:
+        self._connection = connection
+
+        self.linger = linger_ms / 1000
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+
+        self._batch: list[_BatchItem] = []
+        self._batch_bytes = 0
+
+        # serializes pipelines to keep messages order
+        self._lock = asyncio.Lock()
+        self._linger_task: asyncio.Task[None] | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def publish(self, msg: bytes, cmd: "RedisPublishCommand") -> int | bytes:
+        result: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+
+        self._batch.append((msg, cmd, result))
+        self._batch_bytes += len(msg)
+
+        if (
+            len(self._batch) >= self.max_batch_size
+            or self._batch_bytes >= self.max_batch_bytes
+        ):
+            if self._linger_task is not None:
+                self._linger_task.cancel()
+                self._linger_task = None
+
+            # send in background to not lose the batch if caller was cancelled
+            self._add_task(self._send(self._take_batch()))
+
+        elif self._linger_task is None:
+            self._linger_task = self._add_task(self._flush_later())
+
+        response: int | bytes = await result
+        return response
+
+    async def close(self) -> None:
+        """Send the pending batch and wait for all sent ones."""
+        if self._linger_task is not None:
+            self._linger_task.cancel()
+            self._linger_task = None
+
+        if self._batch:
+            await self._send(self._take_batch())
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _add_task(self, coro: Coroutine[Any, Any, None]) -> "asyncio.Task[None]":
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _take_batch(
+        self,
+    ) -> list[_BatchItem]:
+        batch, self._batch = self._batch, []
+        self._batch_bytes = 0
+        return batch
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.linger)
+        self._linger_task = None
+        await self._send(self._take_batch())
+
+    async def _send(
+        self,
+        batch: list[_BatchItem],
+    ) -> None:
+        async with self._lock:
+            try:
+                async with self._connection.client.pipeline(transaction=False) as pipe:
+                    for msg, cmd, _ in batch:
+                        await _send_message(pipe, msg, cmd)
+
+                    responses = await pipe.execute(raise_on_error=False)
+
+            except Exception as e:
+                for *_, result in batch:
+                    if not result.done():
+                        result.set_exception(e)
+
+            else:
+                for (*_, result), response in zip(batch, responses, strict=False):
+                    if result.done():
+                        continue
+
+                    if isinstance(response, Exception):
+                        result.set_exception(response)
+                    else:
+                        result.set_result(response)
+
+
+class _RPCMultiplexer:
+    """Shared reply subscription for `request()` calls.
+
+    Subscribes once to a per-producer inbox pattern and routes responses
+    to waiting requests by their reply channel.
+    """
+
+    __slots__ = ("_inbox", "_lock", "_nuid", "_responses", "_subscription", "_task")
+
+    def __init__(self) -> None:
+        self._nuid = NUID()
+        self._inbox = f"_INBOX.{self._nuid.next().decode()}"
+
+        self._lock = anyio.Lock()
+        self._subscription: PubSub | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._responses: dict[str, MemoryObjectSendStream[Any]] = {}
+
+    async def start(self, client: "Redis[bytes]") -> None:
+        if self._subscription is not None:
+            return
+
+        async with self._lock:
+            if self._subscription is not None:
+                return
+
+            psub = client.pubsub()
+            await psub.psubscribe(f"{self._inbox}.*")
+            # wait for subscription confirmation to not lose the first response
+            await psub.get_message(timeout=None)
+
+            self._task = asyncio.create_task(self._read_responses(psub))
+            self._subscription = psub
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        if self._subscription is not None:
+            with suppress(Exception):
+                await self._subscription.punsubscribe()
+                await self._subscription.aclose()  # type: ignore[attr-defined]
+            self._subscription = None
+
+        for stream in self._responses.values():
+            stream.close()
+        self._responses.clear()
+
+    async def _read_responses(self, psub: "PubSub") -> None:
+        while True:
+            try:
+                async for raw_msg in psub.listen():
+                    if raw_msg["type"] != "pmessage":
+                        continue
+
+                    channel = raw_msg["channel"]
+                    if isinstance(channel, bytes):
+                        channel = channel.decode()
+
+                    # late responses for timed out requests are dropped
+                    if (stream := self._responses.pop(channel, None)) is not None:
+                        stream.send_nowait(raw_msg)
+
+            except Exception:
+                # PubSub reconnects and resubscribes on the next read
+                await anyio.sleep(1)
+
+    @contextmanager
+    def wait_response(self) -> Iterator[tuple[str, "MemoryObjectReceiveStream[Any]"]]:
+        reply_to = f"{self._inbox}.{self._nuid.next().decode()}"
+
+        send_response_stream: MemoryObjectSendStream[Any]
+        receive_response_stream: MemoryObjectReceiveStream[Any]
+
+        (
+            send_response_stream,
+            receive_response_stream,
+        ) = anyio.create_memory_object_stream(max_buffer_size=1)
+
+        self._responses[reply_to] = send_response_stream
+
+        try:
+            yield reply_to, receive_response_stream
+
+        finally:
+            self._responses.pop(reply_to, None)
+            send_response_stream.close()
+            receive_response_stream.close()
@@ -54,8 +54,25 @@ class LogicPublisher(PublisherUsecase):
             decoder=broker_producer._decoder.custom_func,
             message_format=self.config.message_format,
             serializer=self.config._outer_config.fd_config._serializer,
+            linger_ms=self.config.linger_ms,
+            max_batch_size=self.config.max_batch_size,
+            max_batch_bytes=self.config.max_batch_bytes,
+            rpc_producer=(
+                broker_producer
+                if isinstance(broker_producer, RedisFastProducer)
+                else None
+            ),
         )
 
+    async def stop(self) -> None:
+        await super().stop()
+
+        broker_producer = self.config._outer_config.producer
+        if self.producer is not broker_producer:
+            # send messages waiting for the linger timeout
+            await self.producer.disconnect()
+            self.producer = broker_producer
+
     @abstractmethod
     def subscriber_property(self, *, name_only: bool) -> dict[str, Any]:
         raise NotImplementedError
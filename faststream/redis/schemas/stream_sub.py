@@ -9,6 +9,8 @@ class StreamSub(NameRequired):
     """A class to represent a Redis Stream subscriber."""
 
     __slots__ = (
+        "ack_batch_size",
+        "ack_flush_interval",
         "batch",
         "consumer",
         "group",
@@ -31,6 +33,8 @@ class StreamSub(NameRequired):
         last_id: str | None = None,
         maxlen: int | None = None,
         max_records: int | None = None,
+        ack_batch_size: int | None = None,
+        ack_flush_interval: int | None = None,
     ) -> None:
         if (group and not consumer) or (not group and consumer):
             msg = "You should specify `group` and `consumer` both"
@@ -59,6 +63,13 @@ class StreamSub(NameRequired):
                     stacklevel=1,
                 )
 
+        elif ack_batch_size:
+            warnings.warn(
+                message="`ack_batch_size` has no effect without consumer group",
+                category=RuntimeWarning,
+                stacklevel=1,
+            )
+
         if last_id is None:
             last_id = ">" if group and consumer else "$"
 
@@ -72,6 +83,8 @@ class StreamSub(NameRequired):
         self.last_id = last_id
         self.maxlen = maxlen
         self.max_records = max_records
+        self.ack_batch_size = ack_batch_size
+        self.ack_flush_interval = ack_flush_interval or 100
 
     def add_prefix(self, prefix: str) -> "StreamSub":
         new_stream = deepcopy(self)
@@ -1,12 +1,15 @@
+import logging
 import math
 from collections.abc import AsyncIterator, Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Optional, TypeAlias
 
+import anyio
 from redis.exceptions import ResponseError
 from typing_extensions import override
 
 from faststream._internal.endpoint.subscriber.mixins import ConcurrentMixin
 from faststream._internal.endpoint.utils import process_msg
+from faststream.redis.helpers import StreamAckBuffer
 from faststream.redis.message import (
     BatchStreamMessage,
     DefaultStreamMessage,
@@ -48,6 +51,8 @@ class _StreamHandlerMixin(LogicSubscriber):
         self._stream_sub = config.stream_sub
         self.last_id = config.stream_sub.last_id
 
+        self._ack_buffer: StreamAckBuffer | None = None
+
     @property
     def stream_sub(self) -> "StreamSub":
         return self._stream_sub.add_prefix(self._outer_config.prefix)
@@ -74,12 +79,16 @@ class _StreamHandlerMixin(LogicSubscriber):
 
         client = self._client
 
+        stream = self.stream_sub
+
         self.extra_watcher_options.update(
             redis=client,
-            group=self.stream_sub.group,
+            group=stream.group,
         )
 
-        stream = self.stream_sub
+        if stream.group and stream.ack_batch_size and not stream.no_ack:
+            self._ack_buffer = StreamAckBuffer(client, max_size=stream.ack_batch_size)
+            self.extra_watcher_options.update(ack_buffer=self._ack_buffer)
 
         read: Callable[
             [str],
@@ -166,6 +175,38 @@ class _StreamHandlerMixin(LogicSubscriber):
 
         await super().start(read)
 
+        if self._ack_buffer is not None:
+            self.add_task(self._flush_acks(self._ack_buffer, stream.ack_flush_interval))
+
+    async def stop(self) -> None:
+        await super().stop()
+
+        if (ack_buffer := self._ack_buffer) is not None:
+            self._ack_buffer = None
+            self.extra_watcher_options.pop("ack_buffer", None)
+
+            try:
+                await ack_buffer.flush()
+            except Exception as e:
+                self._log(
+                    log_level=logging.ERROR,
+                    message="Stream acks flush error",
+                    exc_info=e,
+                )
+
+    async def _flush_acks(self, ack_buffer: StreamAckBuffer, interval: int) -> None:
+        while True:
+            await anyio.sleep(interval / 1000)
+
+            try:
+                await ack_buffer.flush()
+            except Exception as e:
+                self._log(
+                    log_level=logging.ERROR,
+                    message="Stream acks flush error",
+                    exc_info=e,
+                )
+
     @override
     async def get_one(
         self,
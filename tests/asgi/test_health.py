@@ -0,0 +1,90 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.asgi.health import BrokerHealthCheck
+
+
+def make_broker(*subscribers: MagicMock) -> MagicMock:
+    broker = MagicMock(subscribers=list(subscribers))
+    broker.ping = AsyncMock(return_value=True)
+    return broker
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_probes_share_ping() -> None:
+    broker = make_broker()
+    release = asyncio.Event()
+
+    async def ping(timeout: float | None) -> bool:
+        await release.wait()
+        return True
+
+    broker.ping.side_effect = ping
+    health_check = BrokerHealthCheck(broker, timeout=1.0)
+
+    probes = asyncio.gather(*(health_check() for _ in range(3)))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await probes == [True, True, True]
+    broker.ping.assert_awaited_once_with(1.0)
+
+    # no cache, so the next probe pings again
+    assert await health_check()
+    assert broker.ping.await_count == 2
+
+
+@pytest.mark.asyncio()
+async def test_cached_result() -> None:
+    broker = make_broker()
+    broker.ping.return_value = False
+    health_check = BrokerHealthCheck(broker, cache_ttl=60)
+
+    assert not await health_check()
+    assert not await health_check()
+    broker.ping.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_cancelled_probe_does_not_cancel_ping() -> None:
+    broker = make_broker()
+    release = asyncio.Event()
+
+    async def ping(timeout: float | None) -> bool:
+        await release.wait()
+        return True
+
+    broker.ping.side_effect = ping
+    health_check = BrokerHealthCheck(broker)
+
+    cancelled = asyncio.create_task(health_check())
+    waiting = asyncio.create_task(health_check())
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    release.set()
+
+    assert await waiting
+    broker.ping.assert_awaited_once()
+
+
+@pytest.mark.asyncio()
+async def test_subscriber_activity() -> None:
+    subscriber = MagicMock(running=True, last_consumed_at=None)
+    broker = make_broker(subscriber)
+    health_check = BrokerHealthCheck(broker, activity_ttl=60)
+
+    assert await health_check()
+    broker.ping.assert_awaited_once()
+
+    subscriber.last_consumed_at = time.monotonic()
+    broker.ping.return_value = False
+
+    assert await health_check()
+    broker.ping.assert_awaited_once()
+
+    subscriber.running = False
+    assert not await health_check()
@@ -79,6 +79,31 @@ class AsgiTestcase:
                 response = client.get("/health")
                 assert response.status_code == 500
 
+    @pytest.mark.asyncio()
+    async def test_asgi_ping_subscriber_activity(self) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber("test")
+        async def handler(msg: Any) -> None: ...
+
+        app = AsgiFastStream(
+            broker,
+            asgi_routes=[
+                ("/health", make_ping_asgi(broker, timeout=5.0, activity_ttl=60)),
+            ],
+        )
+        async with self.get_test_broker(broker) as br:
+            br.ping = AsyncMock()
+            br.ping.return_value = False
+
+            await br.publish("hi", "test")
+
+            with TestClient(app) as client:
+                response = client.get("/health")
+                assert response.status_code == 204
+
+            br.ping.assert_not_called()
+
     @pytest.mark.asyncio()
     async def test_asyncapi_asgi(self) -> None:
         broker = self.get_broker()
@@ -1,12 +1,13 @@
 import asyncio
 from contextlib import asynccontextmanager
 from typing import Annotated, Any, TypeVar
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 from fastapi import BackgroundTasks, Depends, FastAPI, Header
 from fastapi.exceptions import RequestValidationError
 from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
 from faststream import (
     Context as FSContext,
@@ -386,6 +387,36 @@ class FastAPILocalTestcase(BaseTestcaseConfig):
             )
             assert await r.decode() == "hi", r
 
+    async def test_handler_without_depends_skips_solving(self, queue: str) -> None:
+        router = self.router_class()
+
+        class User(BaseModel):
+            name: str
+            age: int
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @router.subscriber(*args, **kwargs)
+        async def hello(user: User, w=Header()) -> User:
+            return User(name=w + user.name, age=user.age + 1)
+
+        with patch(
+            "faststream._internal.fastapi.route.solve_faststream_dependency",
+        ) as solve:
+            async with self.patch_broker(router.broker) as br:
+                r = await br.request(
+                    {"name": "john", "age": 1},
+                    queue,
+                    headers={"w": "hi "},
+                    timeout=0.5,
+                )
+                assert await r.decode() == {"name": "hi john", "age": 2}, r
+
+                with pytest.raises(RequestValidationError):
+                    await br.publish({"name": "john"}, queue, headers={"w": ""})
+
+        solve.assert_not_called()
+
     async def test_depends(self, mock: Mock, queue: str) -> None:
         router = self.router_class()
 
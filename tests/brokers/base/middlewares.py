@@ -252,6 +252,99 @@ class MiddlewaresOrderTestcase(BaseTestcaseConfig):
         call_order = [c.args[0] for c in mock.call_args_list]
         assert call_order == ["outer", "middle", "inner"], call_order
 
+    async def test_consume_pipeline_reused(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        broker = self.get_broker(middlewares=(BaseMiddleware,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+        sub = broker.subscriber(*args, **kwargs)
+
+        @sub
+        async def handler(msg) -> None:
+            mock(msg)
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("1", queue)
+
+            pipeline = sub._pipeline
+            assert pipeline is not None
+            assert BaseMiddleware in pipeline.middlewares
+
+            await br.publish("2", queue)
+            assert sub._pipeline is pipeline
+
+        assert mock.call_count == 2
+        assert sub._pipeline is None
+
+    async def test_routed_consume_pipeline(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        class LateMiddleware(BaseMiddleware):
+            async def consume_scope(self, call_next, cmd):
+                mock.late()
+                return await call_next(cmd)
+
+        broker = self.get_broker()
+        router = self.get_router(middlewares=(BaseMiddleware,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+        sub = router.subscriber(*args, **kwargs)
+
+        @sub
+        async def handler(msg) -> None:
+            mock(msg)
+
+        broker.include_router(router)
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("1", queue)
+
+            pipeline = sub._pipeline
+            await br.publish("2", queue)
+            assert sub._pipeline is pipeline
+
+            router.add_middleware(LateMiddleware)
+
+            await br.publish("3", queue)
+            assert sub._pipeline is not pipeline
+            mock.late.assert_called_once()
+
+        assert mock.call_count == 3
+
+    async def test_middleware_added_after_start(
+        self,
+        queue: str,
+        mock: MagicMock,
+    ) -> None:
+        class LateMiddleware(BaseMiddleware):
+            async def consume_scope(self, call_next, cmd):
+                mock.late()
+                return await call_next(cmd)
+
+        broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(msg) -> None:
+            mock(msg)
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("1", queue)
+            assert not mock.late.called
+
+            br.add_middleware(LateMiddleware)
+
+            await br.publish("2", queue)
+            mock.late.assert_called_once()
+
+        assert mock.call_count == 2
+
 
 @pytest.mark.asyncio()
 class LocalMiddlewareTestcase(BaseTestcaseConfig):
@@ -55,6 +55,34 @@ class RequestsTestcase(BaseTestcaseConfig):
         assert await response.decode() == "Response"
         assert response.correlation_id == "1", response.correlation_id
 
+    async def test_concurrent_requests(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(msg: str) -> str:
+            return msg
+
+        async with self.patch_broker(broker):
+            await broker.start()
+
+            responses = await asyncio.gather(
+                *(
+                    broker.request(
+                        str(i),
+                        queue,
+                        timeout=self.timeout,
+                        correlation_id=str(i),
+                    )
+                    for i in range(10)
+                )
+            )
+
+        for i, response in enumerate(responses):
+            assert await response.decode() == str(i)
+            assert response.correlation_id == str(i), response.correlation_id
+
     async def test_publisher_base_request(self, queue: str) -> None:
         broker = self.get_broker()
 
@@ -43,6 +43,33 @@ class TestConsume(ConfluentTestcaseConfig, BrokerRealConsumeTestcase):
 
         assert [{1, "hi"}] == [set(r.result()) for r in result]
 
+    @pytest.mark.asyncio()
+    async def test_consume_prefetch(self, queue: str, mock: MagicMock) -> None:
+        consume_broker = self.get_broker()
+
+        event = asyncio.Event()
+
+        args, kwargs = self.get_subscriber_params(queue, prefetch=10)
+
+        @consume_broker.subscriber(*args, **kwargs)
+        async def handler(msg: int) -> None:
+            mock(msg)
+            if mock.call_count == 3:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            await br.publish_batch(1, 2, 3, topic=queue)
+
+            await asyncio.wait(
+                (asyncio.create_task(event.wait()),),
+                timeout=self.timeout,
+            )
+
+        assert event.is_set()
+        assert [c.args[0] for c in mock.call_args_list] == [1, 2, 3]
+
     @pytest.mark.asyncio()
     async def test_consume_batch_headers(
         self,
@@ -31,6 +31,24 @@ def test_max_workers_with_ack_policy(queue: str) -> None:
         broker.subscriber(queue, max_workers=3, ack_policy=AckPolicy.REJECT_ON_ERROR)
 
 
+@pytest.mark.confluent()
+def test_prefetch_with_ack_policy(queue: str) -> None:
+    broker = KafkaBroker()
+
+    broker.subscriber(queue, prefetch=10, ack_policy=AckPolicy.ACK_FIRST)
+
+    with pytest.raises(SetupError, match="ACK_FIRST"):
+        broker.subscriber(
+            queue,
+            group_id="test",
+            prefetch=10,
+            ack_policy=AckPolicy.REJECT_ON_ERROR,
+        )
+
+    with pytest.raises(SetupError):
+        broker.subscriber(queue, prefetch=10, batch=True)
+
+
 @pytest.mark.confluent()
 def test_deprecated_options(queue: str) -> None:
     broker = KafkaBroker()
@@ -127,6 +127,20 @@ class TestTestclient(ConfluentMemoryTestcaseConfig, BrokerTestclientTestcase):
             await br.publish_batch("hello", topic=queue)
             m.mock.assert_called_once_with(["hello"])
 
+    async def test_batch_pub_mixed_content_types(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg) -> None:
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch({"a": 1}, [1, 2], "hello", b"raw", topic=queue)
+            m.mock.assert_called_once_with([{"a": 1}, [1, 2], "hello", b"raw"])
+
     async def test_batch_publisher_mock(self, queue: str) -> None:
         broker = self.get_broker()
 
@@ -0,0 +1,38 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from aiokafka import AIOKafkaProducer
+
+from faststream.kafka._compat import select_key_partition, serialize_record
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_select_key_partition(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Installed `aiokafka` still has internals used to select key partition."""
+    producer = AIOKafkaProducer(key_serializer=str.encode)
+
+    monkeypatch.setattr(producer.client, "_wait_on_metadata", AsyncMock())
+    partitions = {0, 1, 2}
+    monkeypatch.setattr(producer._metadata, "partitions_for_topic", lambda t: partitions)
+    monkeypatch.setattr(
+        producer._metadata,
+        "available_partitions_for_topic",
+        lambda t: partitions,
+    )
+
+    expected = producer._partitioner(b"key", [0, 1, 2], [0, 1, 2])
+
+    assert await select_key_partition(producer, "topic", "key", b"key") == expected
+    producer.client._wait_on_metadata.assert_awaited_once_with("topic")
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_serialize_record(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Installed `aiokafka` still has internals used to serialize records."""
+    producer = AIOKafkaProducer(key_serializer=str.encode, value_serializer=str.encode)
+    # set by `producer.start()`
+    monkeypatch.setattr(producer, "_producer_magic", 2, raising=False)
+
+    assert serialize_record(producer, "topic", "key", "value") == (b"key", b"value")
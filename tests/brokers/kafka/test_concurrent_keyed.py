@@ -0,0 +1,144 @@
+import asyncio
+from typing import Any
+
+import pytest
+from aiokafka import ConsumerRecord, TopicPartition
+from aiokafka.errors import ConsumerStoppedError
+
+from faststream import AckPolicy
+from faststream.kafka import KafkaBroker, KafkaMessage
+
+
+class FakeConsumer:
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[ConsumerRecord | None] = asyncio.Queue()
+        self.commits: list[Any] = []
+
+    def subscribe(self, **kwargs: Any) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        self.queue.put_nowait(None)
+
+    async def getone(self) -> ConsumerRecord:
+        msg = await self.queue.get()
+        if msg is None:
+            raise ConsumerStoppedError
+        return msg
+
+    async def commit(self, offsets: Any = None) -> None:
+        self.commits.append(offsets)
+
+
+def make_record(offset: int, partition: int = 0, key: Any = None) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic="topic",
+        partition=partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=key,
+        value=b"",
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=(),
+    )
+
+
+@pytest.mark.asyncio()
+@pytest.mark.kafka()
+async def test_stop_with_message_in_flight() -> None:
+    consumer = FakeConsumer()
+
+    broker = KafkaBroker(graceful_timeout=1.0)
+    broker.config.broker_config.builder = lambda **kwargs: consumer
+    broker._setup_logger()
+
+    started, release = asyncio.Event(), asyncio.Event()
+
+    sub = broker.subscriber(
+        "topic",
+        group_id="group",
+        max_workers=2,
+        ordering="partition",
+    )
+
+    @sub
+    async def handler(msg: Any) -> None:
+        started.set()
+        await release.wait()
+
+    await sub.start()
+    tasks = list(sub.tasks)
+
+    consumer.queue.put_nowait(make_record(0))
+    await asyncio.wait_for(started.wait(), timeout=1.0)
+
+    stop_task = asyncio.create_task(sub.stop())
+    await asyncio.sleep(0)
+
+    # message fetched while subscriber is stopping gracefully
+    consumer.queue.put_nowait(make_record(1))
+    await asyncio.sleep(0.01)
+
+    release.set()
+    await asyncio.wait_for(stop_task, timeout=1.0)
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    for t in tasks:
+        assert t.cancelled() or t.exception() is None, t.exception()
+
+
+@pytest.mark.asyncio()
+@pytest.mark.kafka()
+async def test_stop_does_not_commit_buffered_messages() -> None:
+    consumer = FakeConsumer()
+
+    broker = KafkaBroker(graceful_timeout=1.0)
+    broker.config.broker_config.builder = lambda **kwargs: consumer
+    broker._setup_logger()
+
+    events = {0: asyncio.Event(), 1: asyncio.Event()}
+    processed: list[tuple[int, int]] = []
+
+    sub = broker.subscriber(
+        "topic",
+        group_id="group",
+        max_workers=2,
+        ordering="key",
+        ack_policy=AckPolicy.ACK,
+    )
+
+    @sub
+    async def handler(msg: Any, message: KafkaMessage) -> None:
+        record = message.raw_message
+        if record.offset == 0:
+            await events[record.partition].wait()
+        processed.append((record.partition, record.offset))
+
+    await sub.start()
+
+    # keys 0 and 1 are processed by different lanes
+    consumer.queue.put_nowait(make_record(0, partition=1, key=0))
+    for offset in range(3):
+        consumer.queue.put_nowait(make_record(offset, key=1))
+    await asyncio.sleep(0.01)
+
+    stop_task = asyncio.create_task(sub.stop())
+    await asyncio.sleep(0)
+
+    # the second lane has buffered messages while the first one is still processing
+    events[0].set()
+    await asyncio.sleep(0.01)
+    events[1].set()
+    await asyncio.wait_for(stop_task, timeout=1.0)
+
+    assert processed == [(0, 0), (1, 0)]
+    assert consumer.commits == [
+        {TopicPartition("topic", 0): 1},
+        {TopicPartition("topic", 1): 1},
+    ]
@@ -448,6 +448,46 @@ class TestConsume(KafkaTestcaseConfig, BrokerRealConsumeTestcase):
         assert event2.is_set()
         assert mock.call_count == 2, mock.call_count
 
+    @pytest.mark.asyncio()
+    @pytest.mark.slow()
+    async def test_concurrent_consume_keyed(self, queue: str) -> None:
+        event = asyncio.Event()
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        consumed: dict[bytes, list[int]] = {b"a": [], b"b": []}
+
+        args, kwargs = self.get_subscriber_params(
+            queue,
+            group_id="service_1",
+            max_workers=2,
+            ordering="key",
+            ack_policy=AckPolicy.ACK,
+        )
+
+        @consume_broker.subscriber(*args, **kwargs)
+        async def handler(msg: int, message: KafkaMessage) -> None:
+            # the first messages are processed longer to break global order
+            await asyncio.sleep(0.1 if msg < 2 else 0)
+
+            consumed[message.raw_message.key].append(msg)
+            if sum(map(len, consumed.values())) == 10:
+                event.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            for i in range(10):
+                await br.publish(i, queue, key=b"a" if i % 2 else b"b")
+
+            await asyncio.wait(
+                (asyncio.create_task(event.wait()),),
+                timeout=self.timeout,
+            )
+
+        assert event.is_set()
+        assert consumed == {b"a": [1, 3, 5, 7, 9], b"b": [0, 2, 4, 6, 8]}
+
     @pytest.mark.asyncio()
     @pytest.mark.slow()
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
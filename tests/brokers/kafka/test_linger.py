@@ -0,0 +1,268 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from aiokafka.producer.message_accumulator import BatchBuilder
+from aiokafka.structs import RecordMetadata, TopicPartition
+
+from faststream.kafka.publisher.linger import LingerAccumulator
+from faststream.kafka.publisher.producer import AioKafkaFastProducerImpl
+from faststream.kafka.publisher.state import RealProducer
+from faststream.kafka.response import KafkaPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+class FakeClient:
+    async def _wait_on_metadata(self, topic: str) -> None:
+        pass
+
+
+class RecordingBatch(BatchBuilder):  # type: ignore[misc]
+    def __init__(self) -> None:
+        super().__init__(2, 16384, 0, is_transactional=False)
+        self.appended: list[tuple[Any, Any]] = []
+
+    def append(self, *, key: Any, value: Any, **kwargs: Any) -> Any:
+        self.appended.append((key, value))
+        return super().append(key=key, value=value, **kwargs)
+
+
+class FakeAIOKafkaProducer:
+    def __init__(
+        self,
+        error: Exception | None = None,
+        *,
+        key_serializer: Callable[[Any], bytes] | None = None,
+        value_serializer: Callable[[Any], bytes] | None = None,
+    ) -> None:
+        self.client = FakeClient()
+        self.sent: list[tuple[str, int | None, int]] = []
+        self.batches: list[RecordingBatch] = []
+        self.error = error
+        self._offset = 0
+        self._key_serializer = key_serializer
+        self._value_serializer = value_serializer
+
+    def create_batch(self) -> BatchBuilder:
+        batch = RecordingBatch()
+        self.batches.append(batch)
+        return batch
+
+    def _serialize(self, topic: str, key: Any, value: Any) -> tuple[Any, Any]:
+        if self._key_serializer is not None:
+            key = self._key_serializer(key)
+        if self._value_serializer is not None:
+            value = self._value_serializer(value)
+        return key, value
+
+    def _partition(self, topic: str, partition: Any, key: Any, *args: Any) -> int:
+        return len(key) % 2
+
+    async def send_batch(
+        self,
+        batch: BatchBuilder,
+        topic: str,
+        *,
+        partition: int | None,
+    ) -> "asyncio.Future[RecordMetadata]":
+        if self.error:
+            raise self.error
+
+        count = batch.record_count()
+        self.sent.append((topic, partition, count))
+
+        partition = partition or 0
+        future: asyncio.Future[RecordMetadata] = asyncio.Future()
+        future.set_result(
+            RecordMetadata(
+                topic,
+                partition,
+                TopicPartition(topic, partition),
+                self._offset,
+                -1,
+                0,
+                0,
+            ),
+        )
+        self._offset += count
+        return future
+
+
+class FakeSendProducer:
+    """Producer without private internals used to batch records."""
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, bytes]] = []
+
+    async def send(self, topic: str, **kwargs: Any) -> "asyncio.Future[None]":
+        self.sent.append((topic, kwargs["key"]))
+        future: asyncio.Future[None] = asyncio.Future()
+        future.set_result(None)
+        return future
+
+
+def make_cmd(
+    body: bytes = b"msg",
+    *,
+    key: Any = None,
+    linger_ms: float | None = 5,
+    max_batch_bytes: int | None = None,
+) -> KafkaPublishCommand:
+    return KafkaPublishCommand(
+        body,
+        topic="topic",
+        key=key,
+        linger_ms=linger_ms,
+        max_batch_bytes=max_batch_bytes,
+        _publish_type=PublishType.PUBLISH,
+    )
+
+
+@pytest.mark.kafka()
+class TestLingerAccumulator:
+    @pytest.mark.asyncio()
+    async def test_concurrent_publishes_aggregated(self) -> None:
+        producer = FakeAIOKafkaProducer()
+        accumulator = LingerAccumulator()
+
+        futures = await asyncio.gather(
+            *(
+                accumulator.add(producer, make_cmd(), value=b"msg", headers=[])
+                for _ in range(3)
+            )
+        )
+        assert producer.sent == []
+
+        results = await asyncio.gather(*futures)
+
+        assert producer.sent == [("topic", None, 3)]
+        assert [r.offset for r in results] == [0, 1, 2]
+
+    @pytest.mark.asyncio()
+    async def test_max_batch_bytes(self) -> None:
+        producer = FakeAIOKafkaProducer()
+        accumulator = LingerAccumulator()
+
+        cmd = make_cmd(linger_ms=10_000, max_batch_bytes=1)
+        future = await accumulator.add(producer, cmd, value=b"msg", headers=[])
+
+        result = await asyncio.wait_for(future, timeout=1)
+
+        assert producer.sent == [("topic", None, 1)]
+        assert result.offset == 0
+
+    @pytest.mark.asyncio()
+    async def test_keyed_records_grouped_by_partition(self) -> None:
+        producer = FakeAIOKafkaProducer()
+        accumulator = LingerAccumulator()
+
+        futures = [
+            await accumulator.add(producer, make_cmd(key=key), value=b"", headers=[])
+            for key in (b"a", b"bb", b"c")
+        ]
+        await asyncio.gather(*futures)
+
+        assert sorted(producer.sent) == [("topic", 0, 1), ("topic", 1, 2)]
+
+    @pytest.mark.asyncio()
+    async def test_keyed_record_sent_without_partitioner(self) -> None:
+        producer = FakeSendProducer()
+        accumulator = LingerAccumulator()
+
+        future = await accumulator.add(
+            producer,  # type: ignore[arg-type]
+            make_cmd(key=b"a"),
+            value=b"",
+            headers=[],
+        )
+        await future
+
+        assert producer.sent == [("topic", b"a")]
+
+    @pytest.mark.asyncio()
+    async def test_producer_serializers_applied(self) -> None:
+        producer = FakeAIOKafkaProducer(
+            key_serializer=lambda k: f"key-{k}".encode(),
+            value_serializer=bytes.upper,
+        )
+        accumulator = LingerAccumulator()
+
+        future = await accumulator.add(
+            producer,
+            make_cmd(key="a"),
+            value=b"msg",
+            headers=[],
+        )
+        await future
+
+        # partition is selected by the serialized key too
+        assert producer.sent == [("topic", len(b"key-a") % 2, 1)]
+        (batch,) = producer.batches
+        assert batch.appended == [(b"key-a", b"MSG")]
+
+    @pytest.mark.asyncio()
+    async def test_publishers_settings_not_shared(self) -> None:
+        producer = FakeAIOKafkaProducer()
+        accumulator = LingerAccumulator()
+
+        slow = await accumulator.add(
+            producer,
+            make_cmd(linger_ms=10_000),
+            value=b"msg",
+            headers=[],
+        )
+        fast = await accumulator.add(
+            producer,
+            make_cmd(linger_ms=1),
+            value=b"msg",
+            headers=[],
+        )
+
+        await asyncio.wait_for(fast, timeout=1)
+
+        assert producer.sent == [("topic", None, 1)]
+        assert not slow.done()
+
+        await accumulator.flush()
+        assert producer.sent == [("topic", None, 1), ("topic", None, 1)]
+
+    @pytest.mark.asyncio()
+    async def test_flush(self) -> None:
+        producer = FakeAIOKafkaProducer()
+        accumulator = LingerAccumulator()
+
+        cmd = make_cmd(linger_ms=10_000)
+        future = await accumulator.add(producer, cmd, value=b"msg", headers=[])
+
+        await accumulator.flush()
+
+        assert producer.sent == [("topic", None, 1)]
+        assert future.done()
+
+    @pytest.mark.asyncio()
+    async def test_send_error_propagated(self) -> None:
+        producer = FakeAIOKafkaProducer(error=ValueError("boom"))
+        accumulator = LingerAccumulator()
+
+        future = await accumulator.add(producer, make_cmd(), value=b"msg", headers=[])
+
+        with pytest.raises(ValueError, match="boom"):
+            await future
+
+
+@pytest.mark.kafka()
+@pytest.mark.asyncio()
+async def test_producer_publish_lingered() -> None:
+    fake = FakeAIOKafkaProducer()
+
+    producer = AioKafkaFastProducerImpl(parser=None, decoder=None)
+    producer._producer = RealProducer(fake)  # type: ignore[arg-type]
+
+    results = await asyncio.gather(
+        producer.publish(make_cmd(b"1")),
+        producer.publish(make_cmd(b"2")),
+    )
+
+    assert fake.sent == [("topic", None, 2)]
+    assert [r.offset for r in results] == [0, 1]
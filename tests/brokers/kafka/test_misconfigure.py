@@ -8,6 +8,7 @@ from faststream.kafka import KafkaBroker, KafkaRouter, TopicPartition
 from faststream.kafka.subscriber.usecase import (
     ConcurrentBetweenPartitionsSubscriber,
     ConcurrentDefaultSubscriber,
+    ConcurrentKeyedSubscriber,
 )
 from faststream.nats import NatsRouter
 from faststream.rabbit import RabbitRouter
@@ -63,6 +64,11 @@ from faststream.rabbit import RabbitRouter
             },
             id="partitions with manual commit",
         ),
+        pytest.param(
+            ("topic",),
+            {"max_workers": 3, "ordering": "offset"},
+            id="wrong ordering",
+        ),
     ),
 )
 def test_wrong_destination(args: list[str], kwargs: dict[str, Any]) -> None:
@@ -116,6 +122,25 @@ def test_max_workers_configuration(queue: str) -> None:
         )
 
 
+@pytest.mark.kafka()
+def test_keyed_concurrency_configuration() -> None:
+    broker = KafkaBroker()
+
+    sub = broker.subscriber("topic", max_workers=3, ordering="key")
+    assert isinstance(sub, ConcurrentKeyedSubscriber)
+
+    # single consumer supports multiple topics with manual commit
+    sub = broker.subscriber(
+        "topic1",
+        "topic2",
+        group_id="test",
+        max_workers=3,
+        ordering="partition",
+        ack_policy=AckPolicy.ACK,
+    )
+    assert isinstance(sub, ConcurrentKeyedSubscriber)
+
+
 @pytest.mark.kafka()
 def test_use_only_kafka_router() -> None:
     broker = KafkaBroker()
@@ -128,3 +153,11 @@ def test_use_only_kafka_router() -> None:
 
     with pytest.raises(SetupError):
         broker.include_routers(routers)
+
+
+@pytest.mark.kafka()
+def test_batch_publisher_linger() -> None:
+    broker = KafkaBroker()
+
+    with pytest.raises(SetupError):
+        broker.publisher("topic", batch=True, linger_ms=5)
@@ -0,0 +1,88 @@
+import pytest
+from aiokafka import ConsumerRecord, TopicPartition
+
+from faststream.kafka.helpers import OffsetTracker
+
+
+def make_record(offset: int, partition: int = 0) -> ConsumerRecord:
+    return ConsumerRecord(
+        topic="topic",
+        partition=partition,
+        offset=offset,
+        timestamp=0,
+        timestamp_type=0,
+        key=None,
+        value=b"",
+        checksum=None,
+        serialized_key_size=0,
+        serialized_value_size=0,
+        headers=(),
+    )
+
+
+@pytest.mark.kafka()
+def test_commit_lowest_completed_offset() -> None:
+    tracker = OffsetTracker()
+
+    records = [make_record(i) for i in range(3)]
+    for r in records:
+        tracker.add(r)
+
+    tp = TopicPartition("topic", 0)
+
+    # the first record is still in progress
+    assert tracker.complete(records[2]) == {}
+    assert tracker.complete(records[1]) == {}
+
+    assert tracker.complete(records[0]) == {tp: 3}
+
+
+@pytest.mark.kafka()
+def test_partitions_are_tracked_separately() -> None:
+    tracker = OffsetTracker()
+
+    first, second = make_record(10, partition=0), make_record(5, partition=1)
+    tracker.add(first)
+    tracker.add(second)
+
+    assert tracker.complete(second) == {TopicPartition("topic", 1): 6}
+    assert tracker.complete(first) == {TopicPartition("topic", 0): 11}
+
+
+@pytest.mark.kafka()
+def test_nacked_record_is_not_committed() -> None:
+    tracker = OffsetTracker()
+    tp = TopicPartition("topic", 0)
+
+    records = [make_record(i) for i in range(3)]
+    for r in records:
+        tracker.add(r)
+
+    # the first record is nacked and sought back
+    tracker.seek(tp, 0)
+    assert tracker.complete(records[0]) == {}
+    assert tracker.complete(records[1]) == {}
+    assert tracker.complete(records[2]) == {}
+
+    # the record is delivered again
+    redelivered = make_record(0)
+    tracker.add(redelivered)
+    assert tracker.complete(redelivered) == {tp: 3}
+
+
+@pytest.mark.kafka()
+def test_revoked_partition_is_reset() -> None:
+    tracker = OffsetTracker()
+    tp = TopicPartition("topic", 0)
+
+    stale = make_record(5)
+    tracker.add(stale)
+
+    tracker.reset({tp})
+
+    # the partition is assigned again from the committed offset
+    redelivered = make_record(5)
+    tracker.add(redelivered)
+
+    assert tracker.complete(stale) == {}
+    assert tracker.complete(redelivered) == {tp: 6}
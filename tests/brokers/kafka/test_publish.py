@@ -181,3 +181,33 @@ class TestPublish(KafkaTestcaseConfig, BrokerPublishTestcase):
             with pytest.raises(BatchBufferOverflowException) as e:
                 await br.publish_batch(1, "Hello, world!", topic=queue, no_confirm=True)
             assert e.value.message_position == 1
+
+    @pytest.mark.asyncio()
+    async def test_linger_publisher(self, queue: str) -> None:
+        pub_broker = self.get_broker()
+
+        msgs_queue = asyncio.Queue(maxsize=3)
+
+        @pub_broker.subscriber(queue)
+        async def handler(msg) -> None:
+            await msgs_queue.put(msg)
+
+        publisher = pub_broker.publisher(queue, linger_ms=10)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            records = await asyncio.gather(
+                publisher.publish(1),
+                publisher.publish(2),
+                publisher.publish(3),
+            )
+            assert all(isinstance(r, RecordMetadata) for r in records)
+            assert len({(r.partition, r.offset) for r in records}) == 3
+
+            result, _ = await asyncio.wait(
+                [asyncio.create_task(msgs_queue.get()) for _ in range(3)],
+                timeout=3,
+            )
+
+        assert {1, 2, 3} == {r.result() for r in result}
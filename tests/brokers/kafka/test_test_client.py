@@ -108,6 +108,25 @@ class TestTestclient(KafkaMemoryTestcaseConfig, BrokerTestclientTestcase):
 
             publisher.flush.assert_awaited_once()
 
+    async def test_linger_publisher_mock(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        publisher = broker.publisher(queue + "1", linger_ms=10)
+
+        @publisher
+        @broker.subscriber(queue)
+        async def m(msg):
+            return 1
+
+        async with self.patch_broker(broker) as br:
+            await br.publish("hello", queue)
+
+            m.mock.assert_called_once_with("hello")
+            publisher.mock.assert_called_once_with(1)
+
     async def test_batch_publisher_autoflush_mock(
         self,
         queue: str,
@@ -182,6 +201,34 @@ class TestTestclient(KafkaMemoryTestcaseConfig, BrokerTestclientTestcase):
             await br.publish_batch("hello", topic=queue)
             m.mock.assert_called_once_with(["hello"])
 
+    async def test_batch_pub_mixed_content_types(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg) -> None:
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch({"a": 1}, [1, 2], "hello", b"raw", topic=queue)
+            m.mock.assert_called_once_with([{"a": 1}, [1, 2], "hello", b"raw"])
+
+    async def test_batch_pub_json_only(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue, batch=True)
+        async def m(msg) -> None:
+            pass
+
+        async with self.patch_broker(broker) as br:
+            await br.publish_batch({"a": 1}, [1, 2], 3, topic=queue)
+            m.mock.assert_called_once_with([{"a": 1}, [1, 2], 3])
+
     async def test_batch_publisher_mock(
         self,
         queue: str,
@@ -1,7 +1,7 @@
 import pytest
 
 from faststream.exceptions import SetupError
-from faststream.nats import NatsRouter
+from faststream.nats import NatsRouter, PullSub
 from faststream.nats.broker.broker import NatsBroker
 from faststream.rabbit import RabbitRouter
 
@@ -18,3 +18,21 @@ def test_use_only_nats_router() -> None:
 
     with pytest.raises(SetupError):
         broker.include_routers(routers)
+
+
+@pytest.mark.nats()
+@pytest.mark.parametrize(
+    "options",
+    (
+        pytest.param({"pull_sub": PullSub(batch=True, max_in_flight=10)}, id="batch"),
+        pytest.param(
+            {"pull_sub": PullSub(max_in_flight=10), "max_workers": 2},
+            id="max_workers",
+        ),
+    ),
+)
+def test_max_in_flight_misconfigure(options: dict) -> None:
+    broker = NatsBroker()
+
+    with pytest.raises(SetupError):
+        broker.subscriber("test", stream="stream", **options)
@@ -0,0 +1,51 @@
+import anyio
+import pytest
+
+from faststream.nats.helpers import PullCredits
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_wait_free_credits() -> None:
+    credits = PullCredits(3, ack_wait=10)
+
+    assert await credits.wait_free() == 3
+
+    credits.take(3)
+
+    with anyio.move_on_after(0.01) as scope:
+        await credits.wait_free()
+    assert scope.cancelled_caught
+
+    credits.release(0.1)
+    assert await credits.wait_free() == 1
+
+
+@pytest.mark.nats()
+def test_decrease_limit_on_slow_handlers() -> None:
+    credits = PullCredits(8, ack_wait=10)
+    credits.take(8)
+
+    credits.release(6)
+    assert credits.limit == 4
+
+    # messages fetched before decrease don't change limit
+    for _ in range(credits.in_flight):
+        credits.release(6)
+    assert credits.limit == 4
+
+    credits.take(1)
+    credits.release(6)
+    assert credits.limit == 2
+
+
+@pytest.mark.nats()
+def test_increase_limit_on_fast_handlers() -> None:
+    credits = PullCredits(4, ack_wait=10)
+    credits.limit = 1
+
+    for _ in range(10):
+        credits.take(1)
+        credits.release(0.1)
+
+    assert credits.limit == 4
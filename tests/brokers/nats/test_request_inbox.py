@@ -0,0 +1,54 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.nats.publisher.producer import _RequestInbox
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.subscriptions: list[tuple[str, Any, MagicMock]] = []
+
+    def new_inbox(self) -> str:
+        return "_INBOX.test"
+
+    async def subscribe(self, subject: str, cb: Any) -> MagicMock:
+        sub = MagicMock(unsubscribe=AsyncMock())
+        self.subscriptions.append((subject, cb, sub))
+        return sub
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_concurrent_responses_routed() -> None:
+    inbox = _RequestInbox()
+    nc = FakeClient()
+
+    waiters = await asyncio.gather(*(inbox.new_response(nc) for _ in range(10)))
+
+    # single wildcard subscription for all requests
+    ((subject, cb, _),) = nc.subscriptions
+    assert subject == "_INBOX.test.*"
+
+    for reply_to, _ in reversed(waiters):
+        await cb(MagicMock(subject=reply_to, data=reply_to))
+
+    for reply_to, future in waiters:
+        assert (await future).data == reply_to
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+async def test_close_unsubscribes() -> None:
+    inbox = _RequestInbox()
+    nc = FakeClient()
+
+    _, future = await inbox.new_response(nc)
+
+    await inbox.close()
+
+    assert future.cancelled()
+    ((*_, sub),) = nc.subscriptions
+    sub.unsubscribe.assert_awaited_once()
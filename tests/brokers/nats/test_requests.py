@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from faststream import BaseMiddleware
@@ -45,6 +47,37 @@ class NatsRequestsTestcase(RequestsTestcase):
         assert await response.decode() == "Response"
         assert response.correlation_id == "1"
 
+    async def test_concurrent_stream_requests(self, queue: str) -> None:
+        broker = self.get_broker()
+
+        stream_name = f"{queue}st"
+
+        args, kwargs = self.get_subscriber_params(queue, stream=stream_name)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(msg: str) -> str:
+            return msg
+
+        async with self.patch_broker(broker):
+            await broker.start()
+
+            responses = await asyncio.gather(
+                *(
+                    broker.request(
+                        str(i),
+                        queue,
+                        stream=stream_name,
+                        timeout=self.timeout,
+                        correlation_id=str(i),
+                    )
+                    for i in range(10)
+                )
+            )
+
+        for i, response in enumerate(responses):
+            assert await response.decode() == str(i)
+            assert response.correlation_id == str(i), response.correlation_id
+
     async def test_publisher_stream_request(self, queue: str) -> None:
         broker = self.get_broker()
 
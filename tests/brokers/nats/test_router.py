@@ -95,6 +95,42 @@ class TestRouter(NatsTestcaseConfig, RouterTestcase):
         assert event.is_set()
         mock.assert_called_once_with(name="john", id=2)
 
+    async def test_shared_subscription(
+        self,
+        event: asyncio.Event,
+        mock: MagicMock,
+        queue: str,
+    ) -> None:
+        pub_broker = self.get_broker(apply_types=True)
+
+        router = self.get_router(prefix=f"{queue}.", shared_subscription=True)
+
+        @router.subscriber("in.{name}")
+        async def h(name: str = Path()) -> None:
+            mock.path(name)
+
+        @router.subscriber("in.>")
+        async def h2() -> None:
+            mock.tail()
+            event.set()
+
+        pub_broker.include_router(router)
+
+        await pub_broker.start()
+
+        await asyncio.wait(
+            (
+                asyncio.create_task(pub_broker.publish("", f"{queue}.in.john")),
+                asyncio.create_task(event.wait()),
+            ),
+            timeout=self.timeout,
+        )
+        await asyncio.sleep(0.1)
+
+        assert event.is_set()
+        mock.path.assert_called_once_with("john")
+        mock.tail.assert_called_once()
+
     async def test_router_delay_handler_path(
         self,
         event: asyncio.Event,
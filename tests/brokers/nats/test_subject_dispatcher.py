@@ -0,0 +1,228 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream.nats import NatsBroker, NatsRouter
+from faststream.nats.helpers import SubjectDispatcher, SubjectTrie
+from faststream.nats.helpers.subject_dispatcher import get_shared_wildcard
+from faststream.nats.parser import NatsBaseParser
+
+
+class FakeSubscription:
+    def __init__(self, subject: str, queue: str, cb: Any) -> None:
+        self.subject = subject
+        self.queue = queue
+        self.cb = cb
+        self.unsubscribed = False
+
+    async def unsubscribe(self) -> None:
+        self.unsubscribed = True
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.subscriptions: list[FakeSubscription] = []
+
+    async def subscribe(self, subject: str, queue: str, cb: Any) -> FakeSubscription:
+        sub = FakeSubscription(subject, queue, cb)
+        self.subscriptions.append(sub)
+        return sub
+
+
+@dataclass
+class FakeMsg:
+    subject: str
+
+
+@pytest.mark.nats()
+class TestSubjectTrie:
+    @pytest.mark.parametrize(
+        ("subject", "expected"),
+        (
+            pytest.param("a.b.c", {"a.b.c", "a.*.c", "a.>", "*.b.>", ">"}, id="all"),
+            pytest.param("a.b", {"a.>", ">"}, id="prefix"),
+            pytest.param("a", {">"}, id="single token"),
+            pytest.param("a.b.c.d", {"a.>", "*.b.>", ">"}, id="tail"),
+            pytest.param("x.y.c", {">"}, id="only full wildcard"),
+        ),
+    )
+    def test_match(self, subject: str, expected: set[str]) -> None:
+        trie: SubjectTrie[str] = SubjectTrie()
+        for pattern in ("a.b.c", "a.*.c", "a.>", "*.b.>", ">", "a.b.c.d.e"):
+            trie.add(pattern, pattern)
+
+        assert set(trie.match(subject)) == expected
+
+    def test_remove(self) -> None:
+        trie: SubjectTrie[str] = SubjectTrie()
+        trie.add("a.b", "first")
+        trie.add("a.b", "second")
+        trie.add("a.>", "tail")
+        assert len(trie) == 3
+
+        trie.remove("a.b", "first")
+        assert trie.match("a.b") == ["tail", "second"]
+
+        trie.remove("a.b", "second")
+        trie.remove("a.>", "tail")
+        assert len(trie) == 0
+        assert trie.match("a.b") == []
+        assert not trie._root.children
+
+
+@pytest.mark.nats()
+class TestSharedWildcard:
+    def test_not_shared(self) -> None:
+        router = NatsRouter(prefix="a.")
+        assert get_shared_wildcard("a.b", router.config) is None
+
+    @pytest.mark.parametrize(
+        ("prefix", "subject", "expected"),
+        (
+            pytest.param("orders.", "orders.created", "orders.>", id="prefix"),
+            pytest.param("app.orders.", "app.orders.*.x", "app.orders.>", id="long"),
+            pytest.param("orders", "orders_created.x", "orders_created.>", id="partial"),
+            pytest.param("", "orders.created", "orders.>", id="first token"),
+            pytest.param("a.", "a.b", "a.>", id="last token"),
+            pytest.param("", "orders", None, id="single token"),
+            pytest.param("", "*.created", None, id="wildcard"),
+        ),
+    )
+    def test_wildcard(self, prefix: str, subject: str, expected: str | None) -> None:
+        router = NatsRouter(prefix=prefix, shared_subscription=True)
+        assert get_shared_wildcard(subject, router.config) == expected
+
+    def test_nested_router(self) -> None:
+        broker = NatsBroker()
+        router = NatsRouter(prefix="app.", shared_subscription=True)
+        nested = NatsRouter(prefix="orders.")
+
+        router.include_router(nested)
+        broker.include_router(router)
+
+        assert get_shared_wildcard("app.orders.created", nested.config) == "app.>"
+
+
+@pytest.mark.nats()
+@pytest.mark.asyncio()
+class TestSubjectDispatcher:
+    async def test_dispatch(self) -> None:
+        connection = FakeConnection()
+        dispatcher = SubjectDispatcher()
+        mock = MagicMock()
+        event = asyncio.Event()
+
+        async def first(msg: FakeMsg) -> None:
+            mock.first(msg.subject)
+
+        async def second(msg: FakeMsg) -> None:
+            mock.second(msg.subject)
+            event.set()
+
+        sub1 = await dispatcher.subscribe(
+            connection,
+            "a.*",
+            wildcard="a.>",
+            queue="",
+            cb=first,
+            pending_msgs_limit=10,
+            logger=MagicMock(),
+        )
+        sub2 = await dispatcher.subscribe(
+            connection,
+            "a.>",
+            wildcard="a.>",
+            queue="",
+            cb=second,
+            pending_msgs_limit=10,
+            logger=MagicMock(),
+        )
+
+        assert len(connection.subscriptions) == 1
+        shared = connection.subscriptions[0]
+        assert shared.subject == "a.>"
+
+        await shared.cb(FakeMsg("a.b.c"))
+        await asyncio.wait_for(event.wait(), timeout=1)
+
+        mock.first.assert_not_called()
+        mock.second.assert_called_once_with("a.b.c")
+
+        await sub2.unsubscribe()
+        assert not shared.unsubscribed
+
+        await sub1.unsubscribe()
+        assert shared.unsubscribed
+
+    async def test_queue_groups_are_separated(self) -> None:
+        connection = FakeConnection()
+        dispatcher = SubjectDispatcher()
+
+        async def handler(msg: FakeMsg) -> None: ...
+
+        for queue in ("", "", "workers"):
+            await dispatcher.subscribe(
+                connection,
+                "a.b",
+                wildcard="a.>",
+                queue=queue,
+                cb=handler,
+                pending_msgs_limit=10,
+                logger=MagicMock(),
+            )
+
+        assert [(s.subject, s.queue) for s in connection.subscriptions] == [
+            ("a.>", ""),
+            ("a.>", "workers"),
+        ]
+
+    async def test_slow_consumer_drops_messages(self) -> None:
+        connection = FakeConnection()
+        dispatcher = SubjectDispatcher()
+        logger = MagicMock()
+        release = asyncio.Event()
+
+        async def handler(msg: FakeMsg) -> None:
+            await release.wait()
+
+        sub = await dispatcher.subscribe(
+            connection,
+            "a.b",
+            wildcard="a.>",
+            queue="",
+            cb=handler,
+            pending_msgs_limit=1,
+            logger=logger,
+        )
+        shared = connection.subscriptions[0]
+
+        for _ in range(3):
+            await shared.cb(FakeMsg("a.b"))
+            await asyncio.sleep(0)
+
+        logger.log.assert_called_once()
+
+        release.set()
+        await sub.unsubscribe()
+
+
+@pytest.mark.nats()
+@pytest.mark.parametrize(
+    ("pattern", "subject", "expected"),
+    (
+        pytest.param(
+            "in.{name}.{id}", "in.john.1", {"name": "john", "id": "1"}, id="tokens"
+        ),
+        pytest.param("{name}.nested", "root.john.nested", {"name": "john"}, id="prefix"),
+        pytest.param("in.{name}.>", "in.john.1.2", {"name": "john"}, id="tail"),
+        pytest.param("in.x{name}", "in.xjohn", {"name": "john"}, id="part of token"),
+        pytest.param("in.{name}", "in", None, id="not matched"),
+        pytest.param("in", "in", None, id="no params"),
+    ),
+)
+def test_parser_path(pattern: str, subject: str, expected: dict[str, str] | None) -> None:
+    parser = NatsBaseParser(pattern=pattern)
+    assert parser.get_path(subject) == expected
@@ -0,0 +1,193 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from faststream.rabbit.publisher.producer import AioPikaFastProducerImpl
+from faststream.rabbit.response import RabbitPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+class FakeExchange:
+    def __init__(self) -> None:
+        self.published: list[bytes] = []
+        self.correlation_ids: list[str | None] = []
+        self.confirms: list[asyncio.Future[Any]] = []
+        self.all_sent = asyncio.Event()
+
+    async def publish(self, message: Any, routing_key: str, **kwargs: Any) -> Any:
+        self.published.append(message.body)
+        self.correlation_ids.append(message.correlation_id)
+
+        confirm: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self.confirms.append(confirm)
+        if len(self.confirms) == 3:
+            self.all_sent.set()
+        return await confirm
+
+
+class FakeReplyQueue:
+    def __init__(self) -> None:
+        self.channel = MagicMock(is_closed=False)
+        self.cancel = AsyncMock()
+        self.callback: Any = None
+
+    async def consume(self, callback: Any, no_ack: bool) -> str:
+        self.callback = callback
+        return "consumer-tag"
+
+
+class FakeResponder:
+    """Replies to every request with its body, echoing `correlation_id` or not."""
+
+    def __init__(self, queue: FakeReplyQueue, *, echo_correlation_id: bool) -> None:
+        self.queue = queue
+        self.echo_correlation_id = echo_correlation_id
+        self.tasks: set[asyncio.Task[None]] = set()
+
+    async def publish(self, message: Any, routing_key: str, **kwargs: Any) -> None:
+        response = MagicMock(
+            body=message.body,
+            correlation_id=message.correlation_id if self.echo_correlation_id else None,
+        )
+        self.tasks.add(asyncio.create_task(self.queue.callback(response)))
+
+
+class FakeDeclarer:
+    def __init__(
+        self,
+        exchange: FakeExchange | FakeResponder,
+        queue: FakeReplyQueue | None = None,
+    ) -> None:
+        self.exchange = exchange
+        self.queue = queue
+
+    async def declare_exchange(self, *args: Any, **kwargs: Any) -> Any:
+        return self.exchange
+
+    async def declare_queue(self, *args: Any, **kwargs: Any) -> Any:
+        return self.queue
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_publish_batch_pipelines_confirms() -> None:
+    exchange = FakeExchange()
+    producer = AioPikaFastProducerImpl(
+        declarer=FakeDeclarer(exchange),  # type: ignore[arg-type]
+        parser=None,
+        decoder=None,
+    )
+
+    cmd = RabbitPublishCommand(
+        "1",
+        messages=("2", "3"),
+        routing_key="queue",
+        _publish_type=PublishType.PUBLISH,
+    )
+    task = asyncio.create_task(producer.publish_batch(cmd))
+
+    # all messages are sent before any confirmation arrives
+    await asyncio.wait_for(exchange.all_sent.wait(), timeout=1)
+    assert exchange.published == [b"1", b"2", b"3"]
+    # each message has its own correlation_id
+    assert len(set(exchange.correlation_ids)) == 3
+
+    error = RuntimeError("nack")
+    exchange.confirms[0].set_result("ack")
+    exchange.confirms[1].set_exception(error)
+    exchange.confirms[2].set_result("ack")
+
+    assert await task == ["ack", error, "ack"]
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_publish_batch_with_correlation_id() -> None:
+    exchange = FakeExchange()
+    producer = AioPikaFastProducerImpl(
+        declarer=FakeDeclarer(exchange),  # type: ignore[arg-type]
+        parser=None,
+        decoder=None,
+    )
+
+    cmd = RabbitPublishCommand(
+        "1",
+        messages=("2", "3"),
+        correlation_id="batch",
+        _publish_type=PublishType.PUBLISH,
+    )
+    task = asyncio.create_task(producer.publish_batch(cmd))
+
+    await asyncio.wait_for(exchange.all_sent.wait(), timeout=1)
+    for confirm in exchange.confirms:
+        confirm.set_result("ack")
+    await task
+
+    assert exchange.correlation_ids == ["batch", "batch", "batch"]
+
+
+@pytest.mark.rabbit()
+def test_publish_command_message_keyword() -> None:
+    cmd = RabbitPublishCommand(message="hi", _publish_type=PublishType.PUBLISH)
+
+    assert cmd.body == "hi"
+    assert cmd.batch_bodies == ("hi",)
+
+
+def make_rpc_producer(*, echo_correlation_id: bool) -> tuple[Any, FakeReplyQueue]:
+    queue = FakeReplyQueue()
+    producer = AioPikaFastProducerImpl(
+        declarer=FakeDeclarer(  # type: ignore[arg-type]
+            FakeResponder(queue, echo_correlation_id=echo_correlation_id),
+            queue,
+        ),
+        parser=None,
+        decoder=None,
+    )
+    producer.connect()
+    return producer, queue
+
+
+def make_request(body: str) -> RabbitPublishCommand:
+    return RabbitPublishCommand(
+        body,
+        routing_key="queue",
+        timeout=1.0,
+        _publish_type=PublishType.REQUEST,
+    )
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_concurrent_requests() -> None:
+    producer, _ = make_rpc_producer(echo_correlation_id=True)
+
+    responses = await asyncio.gather(
+        *(producer.request(make_request(str(i))) for i in range(10)),
+    )
+
+    assert [r.body for r in responses] == [str(i).encode() for i in range(10)]
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_request_response_without_correlation_id() -> None:
+    producer, _ = make_rpc_producer(echo_correlation_id=False)
+
+    # the only waiting request gets the response
+    response = await producer.request(make_request("hi"))
+
+    assert response.body == b"hi"
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_disconnect_cancels_reply_consumer() -> None:
+    producer, queue = make_rpc_producer(echo_correlation_id=True)
+
+    await producer.request(make_request("hi"))
+    await producer.disconnect()
+
+    queue.cancel.assert_awaited_once_with("consumer-tag")
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from dirty_equals import IsNow
+from pamqp.commands import Basic
 
 from faststream import Context
 from faststream.rabbit import RabbitResponse
@@ -198,3 +199,51 @@ class TestPublish(RabbitTestcaseConfig, BrokerPublishTestcase):
 
         assert event.is_set()
         mock.assert_called_with("Hello!")
+
+    @pytest.mark.asyncio()
+    async def test_publish_batch(self, queue: str) -> None:
+        pub_broker = self.get_broker()
+
+        msgs_queue = asyncio.Queue(maxsize=3)
+
+        @pub_broker.subscriber(queue)
+        async def handler(msg) -> None:
+            await msgs_queue.put(msg)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            results = await br.publish_batch(1, "hi", b"bytes", queue=queue)
+            assert len(results) == 3
+            assert all(isinstance(r, Basic.Ack) for r in results)
+
+            result, _ = await asyncio.wait(
+                [asyncio.create_task(msgs_queue.get()) for _ in range(3)],
+                timeout=self.timeout,
+            )
+
+        assert {1, "hi", b"bytes"} == {r.result() for r in result}
+
+    @pytest.mark.asyncio()
+    async def test_publish_by_publishing_pool(self, queue: str) -> None:
+        pub_broker = self.get_broker(publishing_channels=2, confirm_window=8)
+
+        msgs_queue = asyncio.Queue(maxsize=10)
+
+        @pub_broker.subscriber(queue)
+        async def handler(msg) -> None:
+            await msgs_queue.put(msg)
+
+        async with self.patch_broker(pub_broker) as br:
+            await br.start()
+
+            await asyncio.gather(*(br.publish(i, queue) for i in range(10)))
+            assert br.publishing_pool.channels_count == 2
+            assert br.publishing_pool.in_flight == 0
+
+            result, _ = await asyncio.wait(
+                [asyncio.create_task(msgs_queue.get()) for _ in range(10)],
+                timeout=self.timeout,
+            )
+
+        assert set(range(10)) == {r.result() for r in result}
@@ -0,0 +1,113 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import anyio
+import pytest
+
+from faststream.rabbit.helpers import PublishingChannelPool
+from faststream.rabbit.publisher.producer import AioPikaFastProducerImpl
+from faststream.rabbit.response import RabbitPublishCommand
+from faststream.response.publish_type import PublishType
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.channels: list[MagicMock] = []
+
+    async def channel(self, **kwargs: Any) -> MagicMock:
+        channel = MagicMock(kwargs=kwargs)
+        channel.get_underlay_channel = AsyncMock(return_value=channel)
+        channel.basic_publish = AsyncMock()
+        channel.close = AsyncMock()
+        channel.is_closed = False
+        self.channels.append(channel)
+        return channel
+
+
+def make_pool(size: int, window: int) -> tuple[PublishingChannelPool, FakeConnection]:
+    connection = FakeConnection()
+    pool = PublishingChannelPool(size, confirm_window=window)
+    pool.connect(connection)  # type: ignore[arg-type]
+    return pool, connection
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+class TestPublishingChannelPool:
+    async def test_open_channels_lazily(self) -> None:
+        pool, connection = make_pool(3, 10)
+        assert pool.channels_count == 0
+
+        async with pool.acquire():
+            pass
+
+        assert pool.channels_count == 3
+        assert all(ch.kwargs["publisher_confirms"] for ch in connection.channels)
+
+    async def test_spread_publishes(self) -> None:
+        pool, _ = make_pool(2, 10)
+
+        async with pool.acquire() as first, pool.acquire() as second:
+            assert first is not second
+            assert pool.in_flight == 2
+            assert pool.in_flight_per_channel == (1, 1)
+
+        assert pool.in_flight == 0
+
+    async def test_wait_for_window(self) -> None:
+        pool, _ = make_pool(1, 1)
+
+        acquired = anyio.Event()
+
+        async def second_publish() -> None:
+            async with pool.acquire():
+                acquired.set()
+
+        async with anyio.create_task_group() as tg:
+            async with pool.acquire():
+                tg.start_soon(second_publish)
+                await anyio.sleep(0.01)
+                assert not acquired.is_set()
+
+            with anyio.fail_after(1):
+                await acquired.wait()
+
+    async def test_disconnect(self) -> None:
+        pool, connection = make_pool(2, 10)
+
+        async with pool.acquire():
+            pass
+
+        await pool.disconnect()
+        assert pool.channels_count == 0
+
+        for channel in connection.channels:
+            channel.close.assert_awaited_once()
+
+
+@pytest.mark.rabbit()
+@pytest.mark.asyncio()
+async def test_producer_publish_by_pool() -> None:
+    pool, connection = make_pool(2, 10)
+
+    producer = AioPikaFastProducerImpl(
+        declarer=MagicMock(),
+        parser=None,
+        decoder=None,
+        publishing_pool=pool,
+    )
+
+    cmd = RabbitPublishCommand(
+        "hello",
+        routing_key="queue",
+        _publish_type=PublishType.PUBLISH,
+    )
+    await producer.publish(cmd)
+
+    published = [ch for ch in connection.channels if ch.basic_publish.await_count]
+    assert len(published) == 1
+
+    args, kwargs = published[0].basic_publish.await_args
+    assert args == (b"hello",)
+    assert kwargs["routing_key"] == "queue"
+    assert kwargs["exchange"] == ""
@@ -55,6 +55,22 @@ class TestTestclient(RabbitMemoryTestcaseConfig, BrokerTestclientTestcase):
             with pytest.raises(SubscriberNotFound):
                 await br.request("", "")
 
+    async def test_publish_batch(
+        self,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        @broker.subscriber(queue)
+        async def handler(m) -> None: ...
+
+        async with self.patch_broker(broker) as br:
+            results = await br.publish_batch(1, "hi", queue=queue)
+
+            assert results == [None, None]
+            assert handler.mock.call_count == 2
+            handler.mock.assert_called_with("hi")
+
     async def test_consume_manual_ack(
         self,
         queue: str,
@@ -0,0 +1,57 @@
+from typing import Any
+
+import pytest
+
+from faststream.redis.helpers import StreamAckBuffer
+
+
+class FakePipeline:
+    def __init__(self, client: "FakeRedis") -> None:
+        self.client = client
+        self.commands: list[tuple[Any, ...]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    def xack(self, *args: Any) -> None:
+        self.commands.append(args)
+
+    async def execute(self) -> None:
+        if self.client.fail:
+            self.client.fail = False
+            raise ConnectionError
+
+        self.client.acked.extend(self.commands)
+
+
+class FakeRedis:
+    def __init__(self) -> None:
+        self.fail = True
+        self.acked: list[tuple[Any, ...]] = []
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_failed_flush_keeps_ids() -> None:
+    redis = FakeRedis()
+    buffer = StreamAckBuffer(redis, max_size=10)  # type: ignore[arg-type]
+
+    await buffer.add("stream", "group", (b"1-0", b"2-0"))
+
+    with pytest.raises(ConnectionError):
+        await buffer.flush()
+
+    assert len(buffer) == 2
+    assert redis.acked == []
+
+    await buffer.add("stream", "group", (b"3-0",))
+    await buffer.flush()
+
+    assert len(buffer) == 0
+    assert redis.acked == [("stream", "group", b"1-0", b"2-0", b"3-0")]
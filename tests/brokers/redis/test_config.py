@@ -83,3 +83,12 @@ def test_stream_sub_with_no_ack_group() -> None:
 def test_no_ack() -> None:
     config = RedisSubscriberConfig(_outer_config=MagicMock(), _no_ack=True)
     assert config.ack_policy is AckPolicy.MANUAL
+
+
+@pytest.mark.redis()
+def test_stream_sub_ack_batch_without_group() -> None:
+    with pytest.warns(
+        RuntimeWarning,
+        match="`ack_batch_size` has no effect without consumer group",
+    ):
+        StreamSub("test_stream", ack_batch_size=10)
@@ -776,6 +776,44 @@ class TestConsumeStream(RedisTestcaseConfig):
 
         assert event.is_set()
 
+    async def test_consume_ack_batched(
+        self,
+        queue: str,
+    ) -> None:
+        consumed = asyncio.Event()
+
+        consume_broker = self.get_broker(apply_types=True)
+
+        @consume_broker.subscriber(
+            stream=StreamSub(
+                queue,
+                group="group",
+                consumer=queue,
+                ack_batch_size=3,
+                ack_flush_interval=60_000,
+            ),
+        )
+        async def handler(msg: str) -> None:
+            if msg == "3":
+                consumed.set()
+
+        async with self.patch_broker(consume_broker) as br:
+            await br.start()
+
+            with patch.object(Redis, "xack", spy_decorator(Redis.xack)) as m:
+                for i in range(1, 4):
+                    await br.publish(str(i), stream=queue)
+
+                await asyncio.wait_for(consumed.wait(), timeout=3)
+                await asyncio.sleep(0.1)
+
+                # three ids acked by a single XACK call
+                m.mock.assert_called_once()
+                assert len(m.mock.call_args.args) == 6
+
+            pending = await br._connection.xpending(queue, "group")
+            assert pending["pending"] == 0
+
     @pytest.mark.flaky(reruns=3, reruns_delay=1)
     async def test_consume_and_delete_acked(
         self,
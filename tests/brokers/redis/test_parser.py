@@ -8,6 +8,7 @@ from faststream._internal._compat import json_dumps
 from faststream.redis import RedisBroker, TestRedisBroker
 from faststream.redis.parser import (
     BinaryMessageFormatV1,
+    BinaryMessageFormatV2,
     JSONMessageFormat,
     MessageFormat,
 )
@@ -39,15 +40,73 @@ class TestCustomParser(RedisTestcaseConfig, CustomParserTestcase):
         ),
     ),
 )
+@pytest.mark.parametrize(
+    "message_format",
+    (
+        pytest.param(BinaryMessageFormatV1, id="v1"),
+        pytest.param(BinaryMessageFormatV2, id="v2"),
+    ),
+)
 @pytest.mark.redis()
-def test_binary_message_encode_parse(input: Any, should_be: bytes) -> None:
-    raw_message = BinaryMessageFormatV1.encode(
+def test_binary_message_encode_parse(
+    input: Any,
+    should_be: bytes,
+    message_format: type[MessageFormat],
+) -> None:
+    raw_message = message_format.encode(
         message=input, reply_to=None, headers=None, correlation_id="id"
     )
-    parsed, _ = BinaryMessageFormatV1.parse(raw_message)
+    parsed, _ = message_format.parse(raw_message)
     assert parsed == should_be
 
 
+@pytest.mark.redis()
+def test_binary_v2_parse_without_copy() -> None:
+    raw_message = BinaryMessageFormatV2.encode(
+        message=b"data",
+        reply_to="reply",
+        headers={"key": "значение"},
+        correlation_id="id",
+    )
+
+    parsed, headers = BinaryMessageFormatV2.parse(raw_message)
+
+    assert isinstance(parsed, memoryview)
+    assert parsed.obj is raw_message
+    assert parsed == b"data"
+    assert headers == {
+        "correlation_id": "id",
+        "reply_to": "reply",
+        "key": "значение",
+    }
+
+
+@pytest.mark.parametrize(
+    ("encoder", "parser"),
+    (
+        pytest.param(BinaryMessageFormatV1, BinaryMessageFormatV2, id="v1 to v2"),
+        pytest.param(BinaryMessageFormatV2, BinaryMessageFormatV1, id="v2 to v1"),
+    ),
+)
+@pytest.mark.redis()
+def test_binary_formats_compatibility(
+    encoder: type[MessageFormat],
+    parser: type[MessageFormat],
+) -> None:
+    raw_message = encoder.encode(
+        message="hello", reply_to=None, headers={"key": "value"}, correlation_id="id"
+    )
+
+    parsed, headers = parser.parse(raw_message)
+
+    assert parsed == b"hello"
+    assert headers == {
+        "correlation_id": "id",
+        "content-type": "text/plain",
+        "key": "value",
+    }
+
+
 @pytest.mark.parametrize(
     ("input", "should_be"),
     (
@@ -103,6 +162,11 @@ class TestFormats:
                 b"\x89BIN\x0d\x0a\x1a\x0a\x00\x01\x00\00\x00\x12\x00\x00\x00\x14\x00\x00hello",
                 id="binary",
             ),
+            pytest.param(
+                BinaryMessageFormatV2,
+                b"\x89BIN\x0d\x0a\x1a\x0a\x00\x02\x00\x00\x00\x00\x00\x10hello",
+                id="binary v2",
+            ),
         ),
     )
     async def test_consume_in_different_formats(
@@ -148,6 +212,11 @@ class TestFormats:
                 b"\x89BIN\x0d\x0a\x1a\x0a\x00\x01\x00\00\x00\x12\x00\x00\x00\x14\x00\x00hello",
                 id="binary",
             ),
+            pytest.param(
+                BinaryMessageFormatV2,
+                b"\x89BIN\x0d\x0a\x1a\x0a\x00\x02\x00\x00\x00\x00\x00\x10hello",
+                id="binary v2",
+            ),
         ),
     )
     async def test_publish_in_different_formats(
@@ -0,0 +1,142 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from faststream.exceptions import IncorrectState
+from faststream.redis import RedisBroker
+from faststream.redis.publisher.producer import RedisFastProducer
+
+
+class FakePubSub:
+    def __init__(self) -> None:
+        self.messages: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self.patterns: list[str] = []
+
+    async def psubscribe(self, pattern: str) -> None:
+        self.patterns.append(pattern)
+
+    async def get_message(self, timeout: float | None = None) -> dict[str, Any]:
+        return {"type": "psubscribe"}
+
+    async def listen(self) -> AsyncIterator[dict[str, Any]]:
+        while True:
+            yield await self.messages.get()
+
+    async def punsubscribe(self) -> None:
+        self.patterns.clear()
+
+    async def aclose(self) -> None: ...
+
+
+class FakePipeline:
+    def __init__(self, client: "FakeRedis") -> None:
+        self.client = client
+        self.commands: list[tuple[str, bytes]] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        pass
+
+    async def rpush(self, name: str, msg: bytes) -> None:
+        self.commands.append((name, msg))
+
+    async def execute(self, raise_on_error: bool = True) -> list[int]:
+        self.client.pipelines.append(self.commands)
+        return list(range(1, len(self.commands) + 1))
+
+
+class FakeRedis:
+    """Replies to every published message by its `reply_to`."""
+
+    def __init__(self, broker: RedisBroker) -> None:
+        self.message_format = broker.config.message_format
+        self.pubsubs: list[FakePubSub] = []
+        self.pipelines: list[list[tuple[str, bytes]]] = []
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def pubsub(self) -> FakePubSub:
+        psub = FakePubSub()
+        self.pubsubs.append(psub)
+        return psub
+
+    async def publish(self, channel: str, msg: bytes) -> int:
+        data, headers = self.message_format.parse(msg)
+        response = self.message_format.encode(
+            message=data * 2,
+            reply_to=None,
+            headers={},
+            correlation_id=headers["correlation_id"],
+        )
+        for psub in self.pubsubs:
+            psub.messages.put_nowait({
+                "type": "pmessage",
+                "pattern": None,
+                "channel": headers["reply_to"].encode(),
+                "data": response,
+            })
+        return 1
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+class TestRequest:
+    async def test_not_connected(self) -> None:
+        broker = RedisBroker()
+        publisher = broker.publisher("test")
+        await publisher.start()
+
+        with pytest.raises(IncorrectState):
+            await publisher.request("hi")
+
+    async def test_publisher_request(self) -> None:
+        broker = RedisBroker()
+        publisher = broker.publisher("test")
+
+        client = FakeRedis(broker)
+        broker.config.connection._client = client  # type: ignore[assignment]
+        broker.config.producer.connect()
+
+        await publisher.start()
+
+        try:
+            response = await publisher.request("hi", timeout=1)
+            assert await response.decode() == b"hihi"
+
+            response = await broker.request("ho", "test", timeout=1)
+            assert await response.decode() == b"hoho"
+
+            # publisher uses reply subscription of the broker producer
+            assert isinstance(publisher.producer, RedisFastProducer)
+            assert len(client.pubsubs) == 1
+
+        finally:
+            await broker.config.producer.disconnect()
+
+
+@pytest.mark.redis()
+@pytest.mark.asyncio()
+async def test_publisher_stop_flushes_linger_batch() -> None:
+    broker = RedisBroker()
+    publisher = broker.publisher(list="test", linger_ms=60_000)
+
+    client = FakeRedis(broker)
+    broker.config.connection._client = client  # type: ignore[assignment]
+
+    await publisher.start()
+
+    publish_task = asyncio.create_task(publisher.publish("hi"))
+    await asyncio.sleep(0.01)
+    assert not publish_task.done()
+
+    await publisher.stop()
+
+    assert await asyncio.wait_for(publish_task, timeout=1) == 1
+    assert len(client.pipelines) == 1
+    assert client.pipelines[0][0][0] == "test"
+    assert publisher.producer is broker.config.producer
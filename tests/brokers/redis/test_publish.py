@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline as RedisPipeline
 
 from faststream import Context
 from faststream.redis import ListSub, Pipeline, RedisResponse, StreamSub
@@ -255,6 +256,48 @@ class TestPublish(RedisTestcaseConfig, BrokerPublishTestcase):
 
         assert mock.call_count == 10
 
+    @pytest.mark.parametrize(
+        ("type_queue"),
+        (
+            pytest.param("list"),
+            pytest.param("stream"),
+        ),
+    )
+    async def test_publisher_linger(
+        self,
+        type_queue: str,
+        queue: str,
+    ) -> None:
+        broker = self.get_broker()
+
+        publisher = broker.publisher(
+            **{type_queue: queue},
+            linger_ms=50,
+            max_batch_size=3,
+        )
+
+        async with self.patch_broker(broker) as br:
+            await br.start()
+
+            with patch.object(
+                RedisPipeline,
+                "execute",
+                spy_decorator(RedisPipeline.execute),
+            ) as m:
+                results = await asyncio.gather(
+                    *(publisher.publish(i) for i in range(5)),
+                )
+
+            # full batch of 3 messages and the lingered rest
+            assert m.mock.call_count == 2
+
+            if type_queue == "list":
+                assert results == [1, 2, 3, 4, 5]
+                assert await br._connection.llen(queue) == 5
+            else:
+                assert len(set(results)) == 5
+                assert await br._connection.xlen(queue) == 5
+
     @pytest.mark.asyncio()
     async def test_publish_batch_with_pipeline(
         self,
@@ -0,0 +1,62 @@
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from faststream._internal.endpoint.subscriber.executor import make_executor_decorator
+from faststream.exceptions import SetupError
+from faststream.nats import NatsBroker, TestNatsBroker
+
+
+def cpu_bound_handler(msg: int) -> int:
+    return msg * 2
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_request_handler_in_process_pool(queue: str) -> None:
+    broker = NatsBroker()
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        handler = broker.subscriber(queue)(  # noqa: F841
+            cpu_bound_handler,
+            executor=pool,
+        )
+
+        async with TestNatsBroker(broker) as br:
+            response = await br.request(21, queue)
+
+    assert await response.decode() == 42
+
+
+def test_process_pool_requires_module_level_handler() -> None:
+    def local_handler(msg: int) -> int:
+        return msg
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        decorator = make_executor_decorator(pool)
+
+        with pytest.raises(SetupError):
+            decorator(local_handler)
+
+
+def test_process_pool_requires_sync_handler() -> None:
+    async def async_handler(msg: int) -> int:
+        return msg
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        decorator = make_executor_decorator(pool)
+
+        with pytest.raises(SetupError):
+            decorator(async_handler)
+
+
+@pytest.mark.asyncio()
+async def test_thread_pool_calls_handler_object() -> None:
+    def local_handler(msg: int) -> str:
+        return f"{msg}-{threading.current_thread().name}"
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="worker") as pool:
+        wrapper = make_executor_decorator(pool)(local_handler)
+
+        assert (await wrapper(1)).startswith("1-worker")
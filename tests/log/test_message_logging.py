@@ -0,0 +1,133 @@
+import logging
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from faststream._internal.context import ContextRepo
+from faststream._internal.logger import (
+    BackgroundLogWriter,
+    DefaultLoggerStorage,
+    LazyLogContext,
+    LoggerState,
+    make_logger_state,
+)
+from faststream.message import StreamMessage
+from faststream.middlewares.logging import CriticalLogMiddleware
+
+
+class ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+        self.threads: set[int] = set()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+        self.threads.add(threading.get_ident())
+
+
+@pytest.fixture()
+def handler() -> ListHandler:
+    return ListHandler()
+
+
+@pytest.fixture()
+def logger(handler: ListHandler) -> logging.Logger:
+    logger = logging.getLogger("tests.message_logging")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers = [handler]
+    return logger
+
+
+def test_sample_ratio() -> None:
+    assert not LoggerState(sample_ratio=0).sample_message()
+    assert LoggerState(sample_ratio=1).sample_message()
+
+
+def test_rate_limit() -> None:
+    state = LoggerState(rate_limit=2)
+
+    assert [state.sample_message() for _ in range(3)] == [True, True, False]
+
+
+def test_lazy_log_context() -> None:
+    builder = MagicMock(return_value={"queue": "test"})
+
+    context = LazyLogContext(builder, "msg")
+    builder.assert_not_called()
+
+    assert dict(context) == {"queue": "test"}
+    assert context["queue"] == "test"
+    builder.assert_called_once_with("msg")
+
+
+def test_background_writer(logger: logging.Logger, handler: ListHandler) -> None:
+    writer = BackgroundLogWriter(logger)
+    writer.start()
+
+    writer.log(logging.INFO, "msg", extra={"queue": "test"})
+    writer.log(logging.DEBUG, "skipped")
+
+    writer.stop()
+
+    assert [(r.getMessage(), r.queue) for r in handler.records] == [  # type: ignore[attr-defined]
+        ("msg", "test"),
+    ]
+    assert threading.get_ident() not in handler.threads
+
+
+async def consume(state: LoggerState, exc: Exception | None = None) -> None:
+    context = ContextRepo()
+    middleware = CriticalLogMiddleware(state)(None, context=context)
+
+    async def call_next(msg: Any) -> None:
+        if exc is not None:
+            raise exc
+
+    with context.scope("log_context", {"queue": "in"}):
+        async with middleware:
+            await middleware.consume_scope(call_next, StreamMessage(None, b""))
+
+
+@pytest.mark.asyncio()
+async def test_sampled_out_messages_log_errors(
+    logger: logging.Logger,
+    handler: ListHandler,
+) -> None:
+    state = make_logger_state(
+        logger,
+        logging.INFO,
+        DefaultLoggerStorage,
+        sample_ratio=0,
+    )
+    state._setup(ContextRepo())
+
+    await consume(state)
+    assert handler.records == []
+
+    with pytest.raises(ValueError, match="boom"):
+        await consume(state, ValueError("boom"))
+    assert [r.getMessage() for r in handler.records] == ["ValueError: boom"]
+
+
+@pytest.mark.asyncio()
+async def test_log_in_background(logger: logging.Logger, handler: ListHandler) -> None:
+    state = make_logger_state(
+        logger,
+        logging.INFO,
+        DefaultLoggerStorage,
+        in_background=True,
+    )
+    state._setup(ContextRepo())
+
+    await consume(state)
+    await state._stop()
+
+    assert [(r.getMessage(), r.queue) for r in handler.records] == [  # type: ignore[attr-defined]
+        ("Received", "in"),
+        ("Processed", "in"),
+    ]
+    assert threading.get_ident() not in handler.threads
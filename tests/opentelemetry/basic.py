@@ -374,6 +374,138 @@ class LocalTelemetryTestcase(BaseTestcaseConfig):
         self.assert_metrics(metrics, error_type=expected_value_type)
         mock.assert_called_once_with(msg)
 
+    async def test_aggregated_metrics(
+        self,
+        queue: str,
+        mock: MagicMock,
+        meter_provider: MeterProvider,
+        metric_reader: InMemoryMetricReader,
+        event: asyncio.Event,
+    ) -> None:
+        mid = self.telemetry_middleware_class(
+            meter_provider=meter_provider,
+            metrics_export_interval=60,
+        )
+        broker = self.get_broker(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m) -> None:
+            mock(m)
+            event.set()
+
+        broker = self.patch_broker(broker)
+        msg = "start"
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish(msg, queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+            # durations are recorded right away, counters are aggregated
+            metrics = self.get_metrics(metric_reader)
+            assert [m.name for m in metrics] == [
+                "messaging.process.duration",
+                "messaging.publish.duration",
+            ]
+
+            mid.flush_metrics()
+
+        metrics = self.get_metrics(metric_reader)
+
+        self.assert_metrics(metrics)
+        mock.assert_called_once_with(msg)
+
+    async def test_aggregated_metrics_flushed_on_stop(
+        self,
+        queue: str,
+        mock: MagicMock,
+        meter_provider: MeterProvider,
+        metric_reader: InMemoryMetricReader,
+        event: asyncio.Event,
+    ) -> None:
+        mid = self.telemetry_middleware_class(
+            meter_provider=meter_provider,
+            metrics_export_interval=60,
+        )
+        broker = self.get_broker(middlewares=(mid,))
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m) -> None:
+            mock(m)
+            event.set()
+
+        broker = self.patch_broker(broker)
+        msg = "start"
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish(msg, queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+            # durations are recorded right away, counters are aggregated
+            metrics = self.get_metrics(metric_reader)
+            assert [m.name for m in metrics] == [
+                "messaging.process.duration",
+                "messaging.publish.duration",
+            ]
+
+        metrics = self.get_metrics(metric_reader)
+
+        self.assert_metrics(metrics)
+        mock.assert_called_once_with(msg)
+
+    async def test_not_sampled_trace(
+        self,
+        queue: str,
+        mock: MagicMock,
+        tracer_provider: TracerProvider,
+        trace_exporter: InMemorySpanExporter,
+        meter_provider: MeterProvider,
+        metric_reader: InMemoryMetricReader,
+    ) -> None:
+        event = asyncio.Event()
+
+        mid = self.telemetry_middleware_class(
+            tracer_provider=tracer_provider,
+            meter_provider=meter_provider,
+            traces_sample_ratio=0,
+        )
+        broker = self.get_broker(middlewares=(mid,), apply_types=True)
+
+        args, kwargs = self.get_subscriber_params(queue)
+
+        @broker.subscriber(*args, **kwargs)
+        async def handler(m, span: CurrentSpan) -> None:
+            assert not span.is_recording()
+            assert span is get_current_span()
+            mock(m)
+            event.set()
+
+        broker = self.patch_broker(broker)
+        msg = "start"
+
+        async with broker:
+            await broker.start()
+            tasks = (
+                asyncio.create_task(broker.publish(msg, queue)),
+                asyncio.create_task(event.wait()),
+            )
+            await asyncio.wait(tasks, timeout=self.timeout)
+
+        assert self.get_spans(trace_exporter) == []
+        self.assert_metrics(self.get_metrics(metric_reader))
+        mock.assert_called_once_with(msg)
+
     async def test_span_in_context(
         self,
         queue: str,
@@ -0,0 +1,59 @@
+import asyncio
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+from faststream.opentelemetry.middleware import _MetricsContainer
+
+
+def test_flush_rescheduled_in_new_loop() -> None:
+    reader = InMemoryMetricReader()
+    container = _MetricsContainer(
+        MeterProvider(metric_readers=(reader,)).get_meter("test"),
+        include_messages_counters=True,
+        export_interval=0.01,
+    )
+
+    async def observe() -> None:
+        container.observe_consume("system", "queue", None, 1.0, 1)
+
+    # the loop is closed before the scheduled flush
+    asyncio.run(observe())
+    metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+    assert [m.name for m in metrics] == ["messaging.process.duration"]
+
+    async def observe_and_wait() -> None:
+        await observe()
+        await asyncio.sleep(0.05)
+
+    asyncio.run(observe_and_wait())
+
+    metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+    counter = next(m for m in metrics if m.name == "messaging.process.messages")
+    assert counter.data.data_points[0].value == 2
+
+
+def test_durations_not_deferred() -> None:
+    reader = InMemoryMetricReader()
+    container = _MetricsContainer(
+        MeterProvider(metric_readers=(reader,)).get_meter("test"),
+        include_messages_counters=True,
+        export_interval=60,
+    )
+
+    async def observe() -> None:
+        for _ in range(3):
+            container.observe_consume("system", "queue", None, 1.0, 1)
+
+    asyncio.run(observe())
+
+    metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+    (histogram,) = metrics
+    assert histogram.name == "messaging.process.duration"
+    assert histogram.data.data_points[0].count == 3
+
+    container.flush()
+
+    metrics = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+    counter = next(m for m in metrics if m.name == "messaging.process.messages")
+    assert counter.data.data_points[0].value == 3
@@ -421,3 +421,36 @@ class TestCaseMetrics:
         metric_values = manager._container.published_messages_exceptions_total.collect()
 
         assert metric_values == [expected]
+
+    def test_label_children_cached(
+        self,
+        app_name: str,
+        metrics_prefix: str,
+        queue: str,
+        broker: str,
+    ) -> None:
+        manager = self.create_metrics_manager(
+            app_name=app_name,
+            metrics_prefix=metrics_prefix,
+        )
+
+        metrics = manager.consume_metrics(broker, queue)
+        assert manager.consume_metrics(broker, queue) is metrics
+        assert manager.consume_metrics(broker, "other") is not metrics
+
+        assert metrics.received_processed_messages_total(
+            ProcessingStatus.acked
+        ) is metrics.received_processed_messages_total(ProcessingStatus.acked)
+
+        # status children are created on demand only
+        samples = [
+            s.labels["status"]
+            for m in manager._container.received_processed_messages_total.collect()
+            for s in m.samples
+            if s.name.endswith("_total")
+        ]
+        assert samples == [ProcessingStatus.acked.value]
+
+        assert manager.publish_metrics(broker, queue) is manager.publish_metrics(
+            broker, queue
+        )
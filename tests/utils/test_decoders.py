@@ -0,0 +1,99 @@
+from typing import Any
+
+import pytest
+
+from faststream.message import (
+    StreamMessage,
+    decode_batch,
+    decode_message,
+    register_decoder,
+)
+from faststream.message.utils import _DECODERS
+
+
+def make_message(body: Any, content_type: str | None = None) -> StreamMessage[Any]:
+    return StreamMessage(raw_message=None, body=body, content_type=content_type)
+
+
+@pytest.mark.parametrize(
+    ("body", "content_type", "should_be"),
+    (
+        pytest.param(b'{"a": 1}', "application/json", {"a": 1}, id="json"),
+        pytest.param(
+            b'{"a": 1}',
+            "application/json; charset=utf-8",
+            {"a": 1},
+            id="json with params",
+        ),
+        pytest.param(b"hello", "text/plain", "hello", id="text"),
+        pytest.param(b"\x81\xa1a\x01", "application/msgpack", {"a": 1}, id="msgpack"),
+        pytest.param(b"\x08\x01", "application/x-protobuf", b"\x08\x01", id="protobuf"),
+        pytest.param(b'{"a": 1}', "application/unknown", b'{"a": 1}', id="unknown"),
+        pytest.param(memoryview(b"[1]"), "application/json", [1], id="json view"),
+        pytest.param(
+            memoryview(b"raw"), "application/octet-stream", b"raw", id="raw view"
+        ),
+    ),
+)
+def test_decode_by_content_type(
+    body: Any,
+    content_type: str,
+    should_be: Any,
+) -> None:
+    assert decode_message(make_message(body, content_type)) == should_be
+
+
+@pytest.mark.parametrize(
+    ("body", "should_be"),
+    (
+        pytest.param(b'{"a": 1}', {"a": 1}, id="object"),
+        pytest.param(b" [1]", [1], id="array with space"),
+        pytest.param(b"1", 1, id="number"),
+        pytest.param(b"null", None, id="literal"),
+        pytest.param(b"", b"", id="empty"),
+        pytest.param(b"nothing", b"nothing", id="text"),
+        pytest.param(b"{broken", b"{broken", id="invalid json"),
+        pytest.param(b"\x82\xa2id\xd9", b"\x82\xa2id\xd9", id="binary"),
+    ),
+)
+def test_decode_without_content_type(body: bytes, should_be: Any) -> None:
+    assert decode_message(make_message(body)) == should_be
+
+
+def test_register_decoder() -> None:
+    register_decoder("application/upper", bytes.upper)
+    try:
+        assert decode_message(make_message(b"abc", "application/upper")) == b"ABC"
+    finally:
+        _DECODERS.pop("application/upper")
+
+
+JSON = "application/json"
+
+
+@pytest.mark.parametrize(
+    ("bodies", "should_be"),
+    (
+        pytest.param(
+            [b'{"a": 1}', b"[1]", b'"x"', b"2"],
+            [{"a": 1}, [1], "x", 2],
+            id="json",
+        ),
+        pytest.param([b'{"a":\n1}', b"[1]"], [{"a": 1}, [1]], id="multiline"),
+    ),
+)
+def test_decode_batch(bodies: list[bytes], should_be: list[Any]) -> None:
+    assert decode_batch(bodies, [JSON] * len(bodies)) == should_be
+
+
+@pytest.mark.parametrize(
+    "bodies",
+    (
+        pytest.param([b"1,2", b"[3", b"4]"], id="fragments"),
+        pytest.param([b"[[1]", b"[2]]", b"[3],[4]"], id="unbalanced"),
+    ),
+)
+def test_decode_batch_not_shifted_by_fragments(bodies: list[bytes]) -> None:
+    # each body is decoded as a separate message
+    with pytest.raises(ValueError):  # noqa: PT011
+        decode_batch(bodies, [JSON] * len(bodies))
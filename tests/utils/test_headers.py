@@ -0,0 +1,24 @@
+import json
+
+import msgspec
+
+from faststream._internal._compat import json_dumps, json_loads
+from faststream.message.headers import decode_headers
+
+RAW_HEADERS = (("correlation_id", b"1"), ("trace", b"2"), ("content-type", "text"))
+DECODED = {"correlation_id": "1", "trace": "2", "content-type": "text"}
+
+
+def test_decode_headers() -> None:
+    headers = decode_headers(RAW_HEADERS)
+
+    assert headers == DECODED
+    assert type(headers) is dict
+
+
+def test_headers_serializable() -> None:
+    headers = decode_headers(RAW_HEADERS)
+
+    assert json.loads(json.dumps(headers)) == DECODED
+    assert json_loads(json_dumps(headers)) == DECODED
+    assert msgspec.json.decode(msgspec.json.encode(headers)) == DECODED
@@ -0,0 +1,49 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+from faststream._internal.utils.nuid import NUID
+from faststream.message import StreamMessage, gen_cor_id, set_id_factory
+
+
+def test_nuid_next_str() -> None:
+    nuid = NUID()
+    nuid_copy = copy.deepcopy(nuid)
+
+    for _ in range(1000):
+        assert nuid.next_str() == nuid_copy.next().decode()
+
+
+def test_unique_ids() -> None:
+    assert len({gen_cor_id() for _ in range(1000)}) == 1000
+
+
+def test_set_id_factory() -> None:
+    set_id_factory(lambda: "id")
+    try:
+        assert gen_cor_id() == "id"
+    finally:
+        set_id_factory(None)
+
+    assert gen_cor_id() != "id"
+
+
+def test_lazy_message_ids() -> None:
+    msg = StreamMessage(raw_message=None, body=b"")
+
+    assert msg._correlation_id is None
+
+    assert msg.message_id == msg.correlation_id
+
+    msg.message_id = "1"
+    assert msg.message_id == "1"
+    assert msg.correlation_id != "1"
+
+
+def test_unique_ids_between_threads() -> None:
+    def gen_ids() -> list[str]:
+        return [gen_cor_id() for _ in range(1000)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        ids = [i for chunk in pool.map(lambda _: gen_ids(), range(8)) for i in chunk]
+
+    assert len(set(ids)) == len(ids)
@@ -0,0 +1,142 @@
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fast_depends.msgspec import MsgSpecSerializer
+from fast_depends.pydantic import PydanticSerializer
+from msgspec import Struct
+from pydantic import BaseModel
+
+from faststream._internal.di import FastDependsConfig
+from faststream.message import StreamMessage, decode_message
+
+
+class PydanticModel(BaseModel):
+    field: int
+
+
+class MsgspecModel(Struct):
+    field: int
+
+
+def make_message(
+    body: bytes,
+    content_type: str | None = None,
+    decoder: MagicMock | None = None,
+) -> StreamMessage[Any]:
+    msg = StreamMessage(raw_message=None, body=body, content_type=content_type)
+
+    async def decode(msg: StreamMessage[Any]) -> Any:
+        if decoder is not None:
+            decoder(msg)
+        return decode_message(msg)
+
+    msg.set_decoder(decode)
+    return msg
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize(
+    ("model", "serializer"),
+    (
+        pytest.param(PydanticModel, PydanticSerializer(), id="pydantic"),
+        pytest.param(MsgspecModel, MsgSpecSerializer(), id="msgspec"),
+    ),
+)
+async def test_decode_to_model(model: type, serializer: Any) -> None:
+    config = FastDependsConfig(serializer=serializer, decode_to_model=True)
+
+    def handler(msg: model) -> model:  # type: ignore[valid-type]
+        return msg
+
+    call = config.build_call(handler).wrapped_call
+
+    decoder = MagicMock()
+    message = make_message(b'{"field": "1"}', "application/json", decoder)
+    result = await call(message)
+
+    assert result == model(field=1)
+    # body was decoded right into the model
+    assert not decoder.called
+    assert await message.decode() == {"field": "1"}
+
+
+@pytest.mark.asyncio()
+async def test_decode_to_model_already_decoded() -> None:
+    config = FastDependsConfig(decode_to_model=True)
+
+    def handler(msg: PydanticModel) -> PydanticModel:
+        return msg
+
+    call = config.build_call(handler).wrapped_call
+
+    decoder = MagicMock()
+    message = make_message(b'{"field": 1}', "application/json", decoder)
+    # message was decoded by filter or middleware
+    decoded = await message.decode()
+
+    assert await call(message) == PydanticModel(field=1)
+    assert decoder.call_count == 1
+    assert await message.decode() is decoded
+
+
+@pytest.mark.asyncio()
+async def test_decode_to_model_skips_not_json() -> None:
+    config = FastDependsConfig(decode_to_model=True)
+    mock = MagicMock()
+
+    def handler(msg: PydanticModel) -> None:
+        mock(msg)
+
+    call = config.build_call(handler).wrapped_call
+
+    # not JSON bodies are decoded as usual
+    with pytest.raises(ValueError):  # noqa: PT011
+        await call(make_message(b'{"field": 1}', "text/plain"))
+
+    assert not mock.called
+
+
+@pytest.mark.asyncio()
+async def test_decode_to_model_disabled_for_multiple_args() -> None:
+    config = FastDependsConfig(decode_to_model=True)
+
+    def handler(field: int, other: int = 1) -> int:
+        return field + other
+
+    call = config.build_call(handler).wrapped_call
+
+    decoder = MagicMock()
+    message = make_message(b'{"field": 1}', "application/json", decoder)
+    assert await call(message) == 2
+    assert decoder.called
+
+
+@pytest.mark.asyncio()
+@pytest.mark.nats()
+async def test_decode_to_model_with_test_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    from faststream.nats import NatsBroker, TestNatsBroker
+
+    validate_json = MagicMock(wraps=PydanticModel.model_validate_json)
+    monkeypatch.setattr(PydanticModel, "model_validate_json", validate_json)
+
+    broker = NatsBroker(decode_to_model=True)
+
+    @broker.subscriber("in")
+    async def handler(msg: PydanticModel) -> None: ...
+
+    async def decoder(msg: Any, original: Any) -> Any:
+        return await original(msg)
+
+    @broker.subscriber("custom", decoder=decoder)
+    async def custom_handler(msg: PydanticModel) -> None: ...
+
+    async with TestNatsBroker(broker):
+        await broker.publish({"field": 1}, "in")
+        handler.mock.assert_called_once_with({"field": 1})
+        validate_json.assert_called_once()
+
+        # custom decoder result is passed to the handler
+        await broker.publish({"field": 1}, "custom")
+        custom_handler.mock.assert_called_once_with({"field": 1})
+        validate_json.assert_called_once()